@@ -0,0 +1,2966 @@
+#include "arm64-decode.h"
+using namespace captive::arch::aarch64;
+bool aarch64_decode::decode(uint32_t isa_mode, uint64_t insn_pc, const uint32_t *ptr)
+{
+  opcode = aarch64_unknown;
+  pc = insn_pc;
+  ir = *ptr;
+  end_of_block = false;
+  is_predicated = false;
+  bool result = false;
+  switch ((aarch64_isa_modes)isa_mode)
+  {
+    case aarch64_a64:
+      length = 4;
+      result = decode_a64(ir);
+      break;
+  }
+  if (opcode == aarch64_unknown)
+  {
+    end_of_block = true;
+    result = true;
+  }
+  return result;
+}
+
+// NOTE: as decode does for an A64 word, but leaving the result in result
+inline void aarch64_decode::decode_a64_into(uint64_t insn_pc, uint32_t word, decode_result *result)
+{
+  opcode = aarch64_unknown;
+  pc = insn_pc;
+  ir = word;
+  end_of_block = false;
+  is_predicated = false;
+  length = 4;
+  decode_a64(ir);
+  if (opcode == aarch64_unknown)
+  {
+    end_of_block = true;
+  }
+  result->opcode = opcode;
+  result->end_of_block = end_of_block;
+  result->is_predicated = is_predicated;
+}
+
+void aarch64_decode::decode_block(uint64_t insn_pc, const uint32_t *ptr, size_t count, decode_result *results)
+{
+  for (size_t i = 0; i < count; i++)
+  {
+    decode_a64_into(insn_pc + 4 * i, ptr[i], &results[i]);
+  }
+}
+
+size_t aarch64_decode::decode_until_end_of_block(uint64_t insn_pc, const uint32_t *ptr, size_t max_count, decode_result *results)
+{
+  for (size_t i = 0; i < max_count; i++)
+  {
+    decode_a64_into(insn_pc + 4 * i, ptr[i], &results[i]);
+    if (results[i].end_of_block)
+    {
+      return i + 1;
+    }
+  }
+  return max_count;
+}
+
+captive::arch::JumpInfo aarch64_decode::get_jump_info()
+{
+  JumpInfo info;
+  info.type = captive::arch::JumpInfo::NONE;
+  info.target = 0;
+  switch (opcode)
+  {
+    default:
+      break;
+  }
+  return info;
+}
+
+inline bool aarch64_decode::decode_a64(uint32_t ir)
+{
+  if( UNSIGNED_BITS(ir, 31, 27) == 5
+  ) {
+    // INST22 heading [inst22.xml]
+    opcode = op_aarch64_a64_i22_enc221;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 7
+  ) {
+    if( BITSEL(ir, 26) == 0
+     && BITSEL(ir, 25) == 0
+     && BITSEL(ir, 24) == 0
+     && BITSEL(ir, 18) == 1
+     && BITSEL(ir, 17) == 0
+     && BITSEL(ir, 16) == 0
+     && BITSEL(ir, 15) == 1
+     && BITSEL(ir, 14) == 0
+     && BITSEL(ir, 13) == 1
+     && BITSEL(ir, 12) == 1
+     && BITSEL(ir, 8) == 0
+     && BITSEL(ir, 6) == 1
+     && BITSEL(ir, 5) == 1
+     && BITSEL(ir, 4) == 0
+     && BITSEL(ir, 2) == 1
+     && BITSEL(ir, 1) == 0
+     && BITSEL(ir, 0) == 0
+    ) {
+      // INST24 heading [inst24.xml]
+      opcode = op_aarch64_a64_i24_enc242;
+      return true;
+    }
+    if( BITSEL(ir, 26) == 1
+     && BITSEL(ir, 25) == 1
+     && BITSEL(ir, 24) == 1
+     && BITSEL(ir, 21) == 1
+     && BITSEL(ir, 19) == 0
+     && BITSEL(ir, 18) == 1
+     && BITSEL(ir, 17) == 1
+     && BITSEL(ir, 16) == 0
+     && BITSEL(ir, 15) == 1
+     && BITSEL(ir, 11) == 0
+     && BITSEL(ir, 10) == 1
+     && BITSEL(ir, 9) == 1
+     && BITSEL(ir, 8) == 1
+     && BITSEL(ir, 7) == 0
+     && BITSEL(ir, 6) == 0
+     && BITSEL(ir, 5) == 1
+     && BITSEL(ir, 4) == 1
+    ) {
+      // INST5 heading [inst5.xml]
+      opcode = op_aarch64_a64_i5_enc52;
+      return true;
+    }
+    if( BITSEL(ir, 21) == 0
+     && BITSEL(ir, 19) == 1
+     && BITSEL(ir, 18) == 1
+     && BITSEL(ir, 17) == 1
+     && BITSEL(ir, 16) == 0
+     && BITSEL(ir, 15) == 1
+     && BITSEL(ir, 14) == 0
+     && BITSEL(ir, 13) == 1
+     && BITSEL(ir, 12) == 0
+     && BITSEL(ir, 6) == 0
+     && BITSEL(ir, 4) == 0
+     && BITSEL(ir, 2) == 0
+     && BITSEL(ir, 1) == 1
+     && BITSEL(ir, 0) == 0
+    ) {
+      // INST10 heading [inst10.xml]
+      opcode = op_aarch64_a64_i10_enc102;
+      return true;
+    }
+    if( BITSEL(ir, 26) == 0
+     && BITSEL(ir, 25) == 1
+     && BITSEL(ir, 24) == 1
+     && BITSEL(ir, 23) == 0
+     && BITSEL(ir, 22) == 0
+     && BITSEL(ir, 21) == 1
+     && BITSEL(ir, 19) == 1
+     && BITSEL(ir, 15) == 0
+     && BITSEL(ir, 14) == 1
+     && BITSEL(ir, 13) == 1
+     && BITSEL(ir, 11) == 0
+     && BITSEL(ir, 10) == 0
+     && BITSEL(ir, 9) == 0
+    ) {
+      // INST31 heading [inst31.xml]
+      opcode = op_aarch64_a64_i31_enc311;
+      return true;
+    }
+    if( BITSEL(ir, 26) == 1
+     && BITSEL(ir, 25) == 0
+     && BITSEL(ir, 24) == 0
+     && BITSEL(ir, 23) == 1
+     && BITSEL(ir, 22) == 0
+     && BITSEL(ir, 7) == 0
+     && BITSEL(ir, 6) == 0
+     && BITSEL(ir, 2) == 1
+     && BITSEL(ir, 1) == 0
+    ) {
+      // INST35 heading [inst35.xml]
+      opcode = op_aarch64_a64_i35_enc350;
+      return true;
+    }
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 9
+  ) {
+    // INST5 heading [inst5.xml]
+    opcode = op_aarch64_a64_i5_enc50;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 12
+  ) {
+    // INST13 heading [inst13.xml]
+    opcode = op_aarch64_a64_i13_enc131;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 19
+  ) {
+    // INST6 heading [inst6.xml]
+    opcode = op_aarch64_a64_i6_enc61;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 21
+  ) {
+    // INST27 heading [inst27.xml]
+    opcode = op_aarch64_a64_i27_enc271;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 26
+  ) {
+    if( BITSEL(ir, 26) == 0
+     && BITSEL(ir, 25) == 1
+     && BITSEL(ir, 24) == 0
+     && BITSEL(ir, 23) == 1
+     && BITSEL(ir, 18) == 0
+     && BITSEL(ir, 17) == 0
+     && BITSEL(ir, 16) == 0
+     && BITSEL(ir, 15) == 1
+     && BITSEL(ir, 14) == 0
+     && BITSEL(ir, 13) == 1
+     && BITSEL(ir, 7) == 1
+     && BITSEL(ir, 6) == 1
+     && BITSEL(ir, 5) == 1
+     && BITSEL(ir, 4) == 1
+     && BITSEL(ir, 3) == 0
+     && BITSEL(ir, 2) == 1
+    ) {
+      // INST36 heading [inst36.xml]
+      opcode = op_aarch64_a64_i36_enc360;
+      return true;
+    }
+    if( BITSEL(ir, 21) == 1
+     && BITSEL(ir, 20) == 1
+     && BITSEL(ir, 19) == 1
+     && BITSEL(ir, 18) == 1
+     && BITSEL(ir, 17) == 0
+     && BITSEL(ir, 16) == 1
+     && BITSEL(ir, 15) == 0
+     && BITSEL(ir, 14) == 1
+     && BITSEL(ir, 13) == 0
+     && BITSEL(ir, 12) == 1
+     && BITSEL(ir, 11) == 0
+     && BITSEL(ir, 10) == 1
+    ) {
+      // INST8 heading [inst8.xml]
+      opcode = op_aarch64_a64_i8_enc81;
+      return true;
+    }
+    if( BITSEL(ir, 26) == 1
+     && BITSEL(ir, 25) == 0
+     && BITSEL(ir, 24) == 0
+     && BITSEL(ir, 11) == 0
+     && BITSEL(ir, 10) == 0
+     && BITSEL(ir, 4) == 1
+     && BITSEL(ir, 3) == 0
+     && BITSEL(ir, 2) == 0
+     && BITSEL(ir, 1) == 1
+     && BITSEL(ir, 0) == 1
+    ) {
+      // INST6 heading [inst6.xml]
+      opcode = op_aarch64_a64_i6_enc60;
+      return true;
+    }
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 28
+  ) {
+    // INST17 heading [inst17.xml]
+    opcode = op_aarch64_a64_i17_enc170;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 31
+  ) {
+    // INST33 heading [inst33.xml]
+    opcode = op_aarch64_a64_i33_enc332;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 17
+   && BITSEL(ir, 8) == 1
+  ) {
+    if( BITSEL(ir, 26) == 1
+     && BITSEL(ir, 19) == 0
+     && BITSEL(ir, 18) == 0
+     && BITSEL(ir, 17) == 1
+     && BITSEL(ir, 16) == 1
+     && BITSEL(ir, 15) == 1
+     && BITSEL(ir, 9) == 0
+     && BITSEL(ir, 7) == 0
+     && BITSEL(ir, 6) == 0
+     && BITSEL(ir, 5) == 1
+     && BITSEL(ir, 3) == 0
+     && BITSEL(ir, 2) == 0
+     && BITSEL(ir, 1) == 1
+     && BITSEL(ir, 0) == 1
+    ) {
+      // INST7 heading [inst7.xml]
+      opcode = op_aarch64_a64_i7_enc72;
+      return true;
+    }
+    if( BITSEL(ir, 25) == 0
+     && BITSEL(ir, 24) == 1
+     && BITSEL(ir, 23) == 1
+     && BITSEL(ir, 22) == 1
+     && BITSEL(ir, 21) == 1
+     && BITSEL(ir, 12) == 0
+     && BITSEL(ir, 11) == 1
+     && BITSEL(ir, 10) == 0
+     && BITSEL(ir, 9) == 0
+     && BITSEL(ir, 7) == 0
+    ) {
+      // INST17 heading [inst17.xml]
+      opcode = op_aarch64_a64_i17_enc172;
+      return true;
+    }
+    if( BITSEL(ir, 19) == 0
+     && BITSEL(ir, 18) == 0
+    ) {
+      // INST1 heading [inst1.xml]
+      opcode = op_aarch64_a64_i1_enc11;
+      return true;
+    }
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 24
+   && UNSIGNED_BITS(ir, 14, 10) == 9
+   && UNSIGNED_BITS(ir, 6, 4) == 7
+  ) {
+    // INST31 heading [inst31.xml]
+    opcode = op_aarch64_a64_i31_enc310;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 24
+   && UNSIGNED_BITS(ir, 14, 10) == 20
+   && UNSIGNED_BITS(ir, 6, 4) == 6
+  ) {
+    // INST16 heading [inst16.xml]
+    opcode = op_aarch64_a64_i16_enc160;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 24
+   && UNSIGNED_BITS(ir, 14, 10) == 26
+   && UNSIGNED_BITS(ir, 6, 4) == 5
+  ) {
+    // INST15 heading [inst15.xml]
+    opcode = op_aarch64_a64_i15_enc150;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 1
+   && UNSIGNED_BITS(ir, 15, 13) == 3
+  ) {
+    // INST32 heading [inst32.xml]
+    opcode = op_aarch64_a64_i32_enc320;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 25
+   && UNSIGNED_BITS(ir, 15, 11) == 8
+  ) {
+    if( BITSEL(ir, 26) == 0
+     && BITSEL(ir, 17) == 1
+     && BITSEL(ir, 16) == 0
+     && BITSEL(ir, 8) == 0
+     && BITSEL(ir, 7) == 0
+     && BITSEL(ir, 6) == 0
+     && BITSEL(ir, 5) == 1
+    ) {
+      // INST10 heading [inst10.xml]
+      opcode = op_aarch64_a64_i10_enc100;
+      return true;
+    }
+    if( BITSEL(ir, 22) == 0
+     && BITSEL(ir, 21) == 1
+     && BITSEL(ir, 20) == 0
+    ) {
+      // INST0 heading [inst0.xml]
+      opcode = op_aarch64_a64_i0_enc0;
+      return true;
+    }
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 25
+   && UNSIGNED_BITS(ir, 15, 11) == 22
+  ) {
+    // INST26 heading [inst26.xml]
+    opcode = op_aarch64_a64_i26_enc260;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 1
+   && UNSIGNED_BITS(ir, 16, 11) == 5
+   && BITSEL(ir, 0) == 1
+  ) {
+    // INST18 heading [inst18.xml]
+    opcode = op_aarch64_a64_i18_enc180;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 1
+   && UNSIGNED_BITS(ir, 16, 11) == 7
+   && BITSEL(ir, 0) == 1
+  ) {
+    // INST27 heading [inst27.xml]
+    opcode = op_aarch64_a64_i27_enc270;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 2
+   && UNSIGNED_BITS(ir, 17, 15) == 5
+   && UNSIGNED_BITS(ir, 11, 6) == 6
+  ) {
+    // INST25 heading [inst25.xml]
+    opcode = op_aarch64_a64_i25_enc250;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 2
+   && UNSIGNED_BITS(ir, 17, 15) == 7
+   && UNSIGNED_BITS(ir, 11, 6) == 41
+  ) {
+    // INST34 heading [inst34.xml]
+    opcode = op_aarch64_a64_i34_enc340;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 18
+   && UNSIGNED_BITS(ir, 18, 17) == 1
+   && UNSIGNED_BITS(ir, 9, 8) == 0
+  ) {
+    // INST11 heading [inst11.xml]
+    opcode = op_aarch64_a64_i11_enc111;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 18
+   && UNSIGNED_BITS(ir, 18, 17) == 3
+   && UNSIGNED_BITS(ir, 9, 8) == 0
+  ) {
+    // INST17 heading [inst17.xml]
+    opcode = op_aarch64_a64_i17_enc171;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 18
+   && UNSIGNED_BITS(ir, 18, 17) == 3
+   && UNSIGNED_BITS(ir, 9, 8) == 3
+  ) {
+    // INST5 heading [inst5.xml]
+    opcode = op_aarch64_a64_i5_enc51;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 23
+   && UNSIGNED_BITS(ir, 18, 13) == 26
+   && BITSEL(ir, 1) == 0
+  ) {
+    // INST14 heading [inst14.xml]
+    opcode = op_aarch64_a64_i14_enc140;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 23
+   && UNSIGNED_BITS(ir, 18, 13) == 31
+   && BITSEL(ir, 1) == 1
+  ) {
+    // INST13 heading [inst13.xml]
+    opcode = op_aarch64_a64_i13_enc130;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 23
+   && UNSIGNED_BITS(ir, 18, 13) == 32
+   && BITSEL(ir, 1) == 1
+  ) {
+    // INST28 heading [inst28.xml]
+    opcode = op_aarch64_a64_i28_enc280;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 23
+   && UNSIGNED_BITS(ir, 18, 13) == 44
+   && BITSEL(ir, 1) == 0
+  ) {
+    // INST3 heading [inst3.xml]
+    opcode = op_aarch64_a64_i3_enc31;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 14
+   && UNSIGNED_BITS(ir, 20, 19) == 1
+   && UNSIGNED_BITS(ir, 16, 8) == 186
+  ) {
+    // INST12 heading [inst12.xml]
+    opcode = op_aarch64_a64_i12_enc121;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 14
+   && UNSIGNED_BITS(ir, 20, 19) == 2
+   && UNSIGNED_BITS(ir, 16, 8) == 345
+  ) {
+    // INST22 heading [inst22.xml]
+    opcode = op_aarch64_a64_i22_enc222;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 3
+   && BITSEL(ir, 21) == 1
+   && UNSIGNED_BITS(ir, 17, 15) == 0
+   && UNSIGNED_BITS(ir, 13, 9) == 19
+   && BITSEL(ir, 7) == 0
+   && UNSIGNED_BITS(ir, 1, 0) == 1
+  ) {
+    // INST21 heading [inst21.xml]
+    opcode = op_aarch64_a64_i21_enc210;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 3
+   && BITSEL(ir, 21) == 1
+   && UNSIGNED_BITS(ir, 17, 15) == 5
+   && UNSIGNED_BITS(ir, 13, 9) == 14
+   && BITSEL(ir, 7) == 1
+   && UNSIGNED_BITS(ir, 1, 0) == 1
+  ) {
+    // INST7 heading [inst7.xml]
+    opcode = op_aarch64_a64_i7_enc71;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 22
+   && UNSIGNED_BITS(ir, 21, 20) == 1
+   && UNSIGNED_BITS(ir, 2, 0) == 6
+  ) {
+    // INST28 heading [inst28.xml]
+    opcode = op_aarch64_a64_i28_enc281;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 22
+   && UNSIGNED_BITS(ir, 21, 20) == 2
+   && UNSIGNED_BITS(ir, 2, 0) == 7
+  ) {
+    // INST11 heading [inst11.xml]
+    opcode = op_aarch64_a64_i11_enc112;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 22
+   && UNSIGNED_BITS(ir, 21, 20) == 3
+   && UNSIGNED_BITS(ir, 2, 0) == 6
+  ) {
+    // INST23 heading [inst23.xml]
+    opcode = op_aarch64_a64_i23_enc230;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 1
+   && UNSIGNED_BITS(ir, 22, 20) == 5
+   && BITSEL(ir, 17) == 0
+   && UNSIGNED_BITS(ir, 15, 13) == 4
+   && UNSIGNED_BITS(ir, 7, 5) == 0
+  ) {
+    // INST33 heading [inst33.xml]
+    opcode = op_aarch64_a64_i33_enc330;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 1
+   && UNSIGNED_BITS(ir, 22, 20) == 7
+   && BITSEL(ir, 17) == 1
+   && UNSIGNED_BITS(ir, 15, 13) == 4
+   && UNSIGNED_BITS(ir, 7, 5) == 1
+  ) {
+    // INST23 heading [inst23.xml]
+    opcode = op_aarch64_a64_i23_enc232;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 27
+   && UNSIGNED_BITS(ir, 23, 22) == 0
+   && BITSEL(ir, 17) == 0
+   && UNSIGNED_BITS(ir, 11, 10) == 2
+   && BITSEL(ir, 0) == 0
+  ) {
+    // INST3 heading [inst3.xml]
+    opcode = op_aarch64_a64_i3_enc32;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 27
+   && UNSIGNED_BITS(ir, 23, 22) == 2
+   && BITSEL(ir, 17) == 1
+   && UNSIGNED_BITS(ir, 11, 10) == 3
+   && BITSEL(ir, 0) == 1
+  ) {
+    // INST1 heading [inst1.xml]
+    opcode = op_aarch64_a64_i1_enc10;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 27
+   && UNSIGNED_BITS(ir, 23, 22) == 3
+   && BITSEL(ir, 17) == 1
+   && UNSIGNED_BITS(ir, 11, 10) == 2
+   && BITSEL(ir, 0) == 0
+  ) {
+    // INST24 heading [inst24.xml]
+    opcode = op_aarch64_a64_i24_enc240;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 8
+   && UNSIGNED_BITS(ir, 25, 22) == 3
+   && BITSEL(ir, 0) == 0
+  ) {
+    // INST26 heading [inst26.xml]
+    opcode = op_aarch64_a64_i26_enc262;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 27) == 8
+   && UNSIGNED_BITS(ir, 25, 22) == 6
+   && BITSEL(ir, 0) == 0
+  ) {
+    // INST3 heading [inst3.xml]
+    opcode = op_aarch64_a64_i3_enc30;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 26) == 0
+   && UNSIGNED_BITS(ir, 17, 15) == 5
+   && BITSEL(ir, 11) == 0
+   && UNSIGNED_BITS(ir, 8, 4) == 13
+  ) {
+    // INST26 heading [inst26.xml]
+    opcode = op_aarch64_a64_i26_enc261;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 26) == 1
+   && UNSIGNED_BITS(ir, 17, 15) == 3
+   && BITSEL(ir, 11) == 0
+   && UNSIGNED_BITS(ir, 8, 4) == 9
+  ) {
+    // INST4 heading [inst4.xml]
+    opcode = op_aarch64_a64_i4_enc40;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 26) == 60
+   && UNSIGNED_BITS(ir, 22, 18) == 18
+   && UNSIGNED_BITS(ir, 11, 4) == 119
+  ) {
+    // INST13 heading [inst13.xml]
+    opcode = op_aarch64_a64_i13_enc132;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 26) == 61
+   && UNSIGNED_BITS(ir, 22, 18) == 29
+   && UNSIGNED_BITS(ir, 11, 4) == 249
+  ) {
+    // INST32 heading [inst32.xml]
+    opcode = op_aarch64_a64_i32_enc321;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 25) == 64
+   && BITSEL(ir, 17) == 1
+   && UNSIGNED_BITS(ir, 2, 0) == 7
+  ) {
+    // INST24 heading [inst24.xml]
+    opcode = op_aarch64_a64_i24_enc241;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 25) == 65
+   && BITSEL(ir, 17) == 0
+   && UNSIGNED_BITS(ir, 2, 0) == 2
+  ) {
+    // INST8 heading [inst8.xml]
+    opcode = op_aarch64_a64_i8_enc80;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 25) == 66
+   && BITSEL(ir, 17) == 0
+   && UNSIGNED_BITS(ir, 2, 0) == 6
+  ) {
+    // INST33 heading [inst33.xml]
+    opcode = op_aarch64_a64_i33_enc331;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 25) == 67
+   && BITSEL(ir, 17) == 0
+   && UNSIGNED_BITS(ir, 2, 0) == 0
+  ) {
+    // INST20 heading [inst20.xml]
+    opcode = op_aarch64_a64_i20_enc200;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 34
+  ) {
+    // INST12 heading [inst12.xml]
+    opcode = op_aarch64_a64_i12_enc122;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 49
+   && BITSEL(ir, 11) == 0
+   && UNSIGNED_BITS(ir, 4, 2) == 5
+  ) {
+    // INST2 heading [inst2.xml]
+    opcode = op_aarch64_a64_i2_enc20;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 53
+   && BITSEL(ir, 11) == 0
+   && UNSIGNED_BITS(ir, 4, 2) == 3
+  ) {
+    // INST1 heading [inst1.xml]
+    opcode = op_aarch64_a64_i1_enc12;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 36
+   && UNSIGNED_BITS(ir, 18, 15) == 0
+   && BITSEL(ir, 10) == 0
+  ) {
+    // INST36 heading [inst36.xml]
+    opcode = op_aarch64_a64_i36_enc362;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 36
+   && UNSIGNED_BITS(ir, 18, 15) == 0
+   && BITSEL(ir, 10) == 1
+  ) {
+    // INST8 heading [inst8.xml]
+    opcode = op_aarch64_a64_i8_enc82;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 32
+   && UNSIGNED_BITS(ir, 21, 9) == 2769
+   && BITSEL(ir, 6) == 1
+   && BITSEL(ir, 4) == 1
+  ) {
+    // INST38 heading [inst38.xml]
+    opcode = op_aarch64_a64_i38_enc381;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 24) == 32
+   && UNSIGNED_BITS(ir, 21, 9) == 6060
+   && BITSEL(ir, 6) == 1
+   && BITSEL(ir, 4) == 1
+  ) {
+    // INST11 heading [inst11.xml]
+    opcode = op_aarch64_a64_i11_enc110;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 22) == 362
+   && UNSIGNED_BITS(ir, 4, 3) == 0
+  ) {
+    // INST30 heading [inst30.xml]
+    opcode = op_aarch64_a64_i30_enc300;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 22) == 363
+   && UNSIGNED_BITS(ir, 4, 3) == 2
+  ) {
+    // INST12 heading [inst12.xml]
+    opcode = op_aarch64_a64_i12_enc120;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 22) == 152
+   && UNSIGNED_BITS(ir, 8, 7) == 1
+  ) {
+    if( BITSEL(ir, 21) == 1
+     && BITSEL(ir, 14) == 1
+     && BITSEL(ir, 4) == 0
+     && BITSEL(ir, 3) == 0
+     && BITSEL(ir, 2) == 0
+     && BITSEL(ir, 1) == 0
+    ) {
+      // INST37 heading [inst37.xml]
+      opcode = op_aarch64_a64_i37_enc370;
+      return true;
+    }
+    if( BITSEL(ir, 17) == 0
+     && BITSEL(ir, 16) == 1
+     && BITSEL(ir, 11) == 1
+     && BITSEL(ir, 10) == 1
+     && BITSEL(ir, 9) == 1
+     && BITSEL(ir, 6) == 0
+    ) {
+      // INST10 heading [inst10.xml]
+      opcode = op_aarch64_a64_i10_enc101;
+      return true;
+    }
+  }
+  if( UNSIGNED_BITS(ir, 31, 20) == 1957
+  ) {
+    // INST7 heading [inst7.xml]
+    opcode = op_aarch64_a64_i7_enc70;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 20) == 1992
+  ) {
+    // INST23 heading [inst23.xml]
+    opcode = op_aarch64_a64_i23_enc231;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 20) == 2020
+  ) {
+    // INST22 heading [inst22.xml]
+    opcode = op_aarch64_a64_i22_enc220;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 18) == 15006
+   && UNSIGNED_BITS(ir, 14, 10) == 25
+   && UNSIGNED_BITS(ir, 2, 0) == 5
+  ) {
+    // INST38 heading [inst38.xml]
+    opcode = op_aarch64_a64_i38_enc380;
+    return true;
+  }
+  if( UNSIGNED_BITS(ir, 31, 18) == 15309
+   && UNSIGNED_BITS(ir, 14, 10) == 4
+   && UNSIGNED_BITS(ir, 2, 0) == 1
+  ) {
+    // INST36 heading [inst36.xml]
+    opcode = op_aarch64_a64_i36_enc361;
+    return true;
+  }
+  return false;
+}
+
+uint8_t aarch64_a64_i22_enc221::get_sf()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i22_enc221::get_imm()
+{
+  return UNSIGNED_BITS(ir, 22, 19);
+}
+uint8_t aarch64_a64_i22_enc221::get_op()
+{
+  return UNSIGNED_BITS(ir, 18, 16);
+}
+uint8_t aarch64_a64_i22_enc221::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i22_enc221::get_size()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i22_enc221::get_Rm()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i22_enc221::get_f1()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i24_enc242::get_sf()
+{
+  return UNSIGNED_BITS(ir, 25, 24);
+}
+uint8_t aarch64_a64_i24_enc242::get_imm()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i24_enc242::get_op()
+{
+  return BITSEL(ir, 18);
+}
+uint8_t aarch64_a64_i24_enc242::get_Rm()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i24_enc242::get_opc()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i24_enc242::get_size()
+{
+  return UNSIGNED_BITS(ir, 11, 9);
+}
+uint8_t aarch64_a64_i24_enc242::get_Rn()
+{
+  return BITSEL(ir, 8);
+}
+uint8_t aarch64_a64_i24_enc242::get_Rd()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i5_enc52::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 25, 24);
+}
+uint8_t aarch64_a64_i5_enc52::get_f23()
+{
+  return UNSIGNED_BITS(ir, 23, 22);
+}
+uint8_t aarch64_a64_i5_enc52::get_f20()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i5_enc52::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 19, 15);
+}
+uint8_t aarch64_a64_i5_enc52::get_sf()
+{
+  return UNSIGNED_BITS(ir, 14, 12);
+}
+uint8_t aarch64_a64_i5_enc52::get_size()
+{
+  return BITSEL(ir, 10);
+}
+uint8_t aarch64_a64_i5_enc52::get_op()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i5_enc52::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 7, 4);
+}
+uint8_t aarch64_a64_i5_enc52::get_imm()
+{
+  return UNSIGNED_BITS(ir, 3, 0);
+}
+uint8_t aarch64_a64_i10_enc102::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 16, 13);
+}
+uint8_t aarch64_a64_i10_enc102::get_size()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i10_enc102::get_opc()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i10_enc102::get_imm()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i10_enc102::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 4, 0);
+}
+uint8_t aarch64_a64_i31_enc311::get_imm()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i31_enc311::get_op()
+{
+  return UNSIGNED_BITS(ir, 18, 17);
+}
+uint8_t aarch64_a64_i31_enc311::get_sf()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i31_enc311::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 15, 13);
+}
+uint8_t aarch64_a64_i31_enc311::get_Rd()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i31_enc311::get_opc()
+{
+  return BITSEL(ir, 11);
+}
+uint8_t aarch64_a64_i31_enc311::get_size()
+{
+  return UNSIGNED_BITS(ir, 10, 9);
+}
+uint8_t aarch64_a64_i31_enc311::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 8, 4);
+}
+uint8_t aarch64_a64_i31_enc311::get_f0()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i35_enc350::get_f21()
+{
+  return UNSIGNED_BITS(ir, 21, 20);
+}
+uint8_t aarch64_a64_i35_enc350::get_f19()
+{
+  return BITSEL(ir, 19);
+}
+uint8_t aarch64_a64_i35_enc350::get_op()
+{
+  return UNSIGNED_BITS(ir, 18, 17);
+}
+uint8_t aarch64_a64_i35_enc350::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 16, 12);
+}
+uint8_t aarch64_a64_i35_enc350::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i35_enc350::get_sf()
+{
+  return UNSIGNED_BITS(ir, 7, 6);
+}
+uint8_t aarch64_a64_i35_enc350::get_f3()
+{
+  return BITSEL(ir, 3);
+}
+uint8_t aarch64_a64_i35_enc350::get_imm()
+{
+  return UNSIGNED_BITS(ir, 2, 1);
+}
+uint8_t aarch64_a64_i35_enc350::get_opc()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i5_enc50::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i5_enc50::get_f22()
+{
+  return BITSEL(ir, 22);
+}
+uint8_t aarch64_a64_i5_enc50::get_f20()
+{
+  return UNSIGNED_BITS(ir, 20, 16);
+}
+uint8_t aarch64_a64_i5_enc50::get_opc()
+{
+  return UNSIGNED_BITS(ir, 15, 11);
+}
+uint8_t aarch64_a64_i5_enc50::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 9, 5);
+}
+uint8_t aarch64_a64_i5_enc50::get_op()
+{
+  return UNSIGNED_BITS(ir, 4, 0);
+}
+uint8_t aarch64_a64_i13_enc131::get_size()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i13_enc131::get_op()
+{
+  return UNSIGNED_BITS(ir, 20, 18);
+}
+uint8_t aarch64_a64_i13_enc131::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 15, 13);
+}
+uint8_t aarch64_a64_i13_enc131::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 8, 6);
+}
+uint8_t aarch64_a64_i13_enc131::get_sf()
+{
+  return UNSIGNED_BITS(ir, 5, 3);
+}
+uint8_t aarch64_a64_i13_enc131::get_imm()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i6_enc61::get_Rd()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i6_enc61::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 25, 22);
+}
+uint8_t aarch64_a64_i6_enc61::get_size()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i6_enc61::get_f20()
+{
+  return UNSIGNED_BITS(ir, 20, 16);
+}
+uint8_t aarch64_a64_i6_enc61::get_sf()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i6_enc61::get_op()
+{
+  return UNSIGNED_BITS(ir, 8, 4);
+}
+uint8_t aarch64_a64_i27_enc271::get_opc()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i27_enc271::get_imm()
+{
+  return BITSEL(ir, 25);
+}
+uint8_t aarch64_a64_i27_enc271::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 24, 20);
+}
+uint8_t aarch64_a64_i27_enc271::get_f19()
+{
+  return UNSIGNED_BITS(ir, 19, 18);
+}
+uint8_t aarch64_a64_i27_enc271::get_op()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i27_enc271::get_f15()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i27_enc271::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 6, 2);
+}
+uint8_t aarch64_a64_i27_enc271::get_Rm()
+{
+  return BITSEL(ir, 1);
+}
+uint8_t aarch64_a64_i27_enc271::get_size()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i36_enc360::get_sf()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i36_enc360::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 22, 19);
+}
+uint8_t aarch64_a64_i36_enc360::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 17, 13);
+}
+uint8_t aarch64_a64_i36_enc360::get_imm()
+{
+  return BITSEL(ir, 2);
+}
+uint8_t aarch64_a64_i36_enc360::get_f1()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i8_enc81::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 26, 22);
+}
+uint8_t aarch64_a64_i8_enc81::get_opc()
+{
+  return UNSIGNED_BITS(ir, 18, 16);
+}
+uint8_t aarch64_a64_i8_enc81::get_sf()
+{
+  return UNSIGNED_BITS(ir, 15, 11);
+}
+uint8_t aarch64_a64_i8_enc81::get_op()
+{
+  return BITSEL(ir, 10);
+}
+uint8_t aarch64_a64_i8_enc81::get_size()
+{
+  return UNSIGNED_BITS(ir, 9, 7);
+}
+uint8_t aarch64_a64_i8_enc81::get_imm()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i6_enc60::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i6_enc60::get_imm()
+{
+  return BITSEL(ir, 24);
+}
+uint8_t aarch64_a64_i6_enc60::get_opc()
+{
+  return UNSIGNED_BITS(ir, 23, 20);
+}
+uint8_t aarch64_a64_i6_enc60::get_size()
+{
+  return UNSIGNED_BITS(ir, 19, 17);
+}
+uint8_t aarch64_a64_i6_enc60::get_op()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i6_enc60::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i6_enc60::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 9, 5);
+}
+uint8_t aarch64_a64_i6_enc60::get_sf()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i17_enc170::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i17_enc170::get_f23()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i17_enc170::get_sf()
+{
+  return BITSEL(ir, 18);
+}
+uint8_t aarch64_a64_i17_enc170::get_f17()
+{
+  return UNSIGNED_BITS(ir, 17, 13);
+}
+uint8_t aarch64_a64_i17_enc170::get_imm()
+{
+  return UNSIGNED_BITS(ir, 11, 9);
+}
+uint8_t aarch64_a64_i17_enc170::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 8, 4);
+}
+uint8_t aarch64_a64_i17_enc170::get_op()
+{
+  return UNSIGNED_BITS(ir, 3, 1);
+}
+uint8_t aarch64_a64_i17_enc170::get_size()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i33_enc332::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 20, 19);
+}
+uint8_t aarch64_a64_i33_enc332::get_f18()
+{
+  return UNSIGNED_BITS(ir, 18, 16);
+}
+uint8_t aarch64_a64_i33_enc332::get_opc()
+{
+  return UNSIGNED_BITS(ir, 15, 14);
+}
+uint8_t aarch64_a64_i33_enc332::get_f13()
+{
+  return BITSEL(ir, 13);
+}
+uint8_t aarch64_a64_i33_enc332::get_op()
+{
+  return UNSIGNED_BITS(ir, 12, 9);
+}
+uint8_t aarch64_a64_i33_enc332::get_imm()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i7_enc72::get_op()
+{
+  return UNSIGNED_BITS(ir, 25, 23);
+}
+uint8_t aarch64_a64_i7_enc72::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 22, 20);
+}
+uint8_t aarch64_a64_i7_enc72::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 12, 10);
+}
+uint8_t aarch64_a64_i7_enc72::get_size()
+{
+  return UNSIGNED_BITS(ir, 9, 7);
+}
+uint8_t aarch64_a64_i7_enc72::get_opc()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i7_enc72::get_sf()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i7_enc72::get_imm()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i17_enc172::get_imm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i17_enc172::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 25, 21);
+}
+uint8_t aarch64_a64_i17_enc172::get_opc()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i17_enc172::get_f19()
+{
+  return UNSIGNED_BITS(ir, 19, 17);
+}
+uint8_t aarch64_a64_i17_enc172::get_op()
+{
+  return UNSIGNED_BITS(ir, 16, 15);
+}
+uint8_t aarch64_a64_i17_enc172::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 14, 13);
+}
+uint8_t aarch64_a64_i17_enc172::get_size()
+{
+  return UNSIGNED_BITS(ir, 12, 11);
+}
+uint8_t aarch64_a64_i17_enc172::get_sf()
+{
+  return UNSIGNED_BITS(ir, 4, 3);
+}
+uint8_t aarch64_a64_i17_enc172::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i1_enc11::get_opc()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i1_enc11::get_imm()
+{
+  return BITSEL(ir, 25);
+}
+uint8_t aarch64_a64_i1_enc11::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 24, 21);
+}
+uint8_t aarch64_a64_i1_enc11::get_sf()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i1_enc11::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 19, 18);
+}
+uint8_t aarch64_a64_i1_enc11::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 14, 12);
+}
+uint8_t aarch64_a64_i1_enc11::get_size()
+{
+  return UNSIGNED_BITS(ir, 11, 9);
+}
+uint8_t aarch64_a64_i1_enc11::get_op()
+{
+  return BITSEL(ir, 8);
+}
+uint8_t aarch64_a64_i1_enc11::get_f7()
+{
+  return UNSIGNED_BITS(ir, 7, 4);
+}
+uint8_t aarch64_a64_i1_enc11::get_f3()
+{
+  return BITSEL(ir, 3);
+}
+uint8_t aarch64_a64_i1_enc11::get_f2()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i31_enc310::get_imm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i31_enc310::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 25, 21);
+}
+uint8_t aarch64_a64_i31_enc310::get_size()
+{
+  return UNSIGNED_BITS(ir, 20, 18);
+}
+uint8_t aarch64_a64_i31_enc310::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i31_enc310::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 7, 3);
+}
+uint8_t aarch64_a64_i31_enc310::get_sf()
+{
+  return UNSIGNED_BITS(ir, 2, 1);
+}
+uint8_t aarch64_a64_i31_enc310::get_op()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i16_enc160::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i16_enc160::get_f18()
+{
+  return UNSIGNED_BITS(ir, 18, 15);
+}
+uint8_t aarch64_a64_i16_enc160::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 14, 10);
+}
+uint8_t aarch64_a64_i16_enc160::get_f9()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i16_enc160::get_f8()
+{
+  return UNSIGNED_BITS(ir, 8, 7);
+}
+uint8_t aarch64_a64_i16_enc160::get_opc()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i15_enc150::get_size()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i15_enc150::get_op()
+{
+  return UNSIGNED_BITS(ir, 23, 20);
+}
+uint8_t aarch64_a64_i15_enc150::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 19, 15);
+}
+uint8_t aarch64_a64_i15_enc150::get_opc()
+{
+  return BITSEL(ir, 11);
+}
+uint8_t aarch64_a64_i15_enc150::get_imm()
+{
+  return UNSIGNED_BITS(ir, 7, 4);
+}
+uint8_t aarch64_a64_i32_enc320::get_opc()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i32_enc320::get_sf()
+{
+  return BITSEL(ir, 24);
+}
+uint8_t aarch64_a64_i32_enc320::get_op()
+{
+  return BITSEL(ir, 23);
+}
+uint8_t aarch64_a64_i32_enc320::get_f22()
+{
+  return UNSIGNED_BITS(ir, 22, 18);
+}
+uint8_t aarch64_a64_i32_enc320::get_f17()
+{
+  return UNSIGNED_BITS(ir, 17, 16);
+}
+uint8_t aarch64_a64_i32_enc320::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 12, 10);
+}
+uint8_t aarch64_a64_i32_enc320::get_f9()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i32_enc320::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 8, 4);
+}
+uint8_t aarch64_a64_i32_enc320::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 3, 2);
+}
+uint8_t aarch64_a64_i10_enc100::get_Rm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i10_enc100::get_imm()
+{
+  return UNSIGNED_BITS(ir, 25, 24);
+}
+uint8_t aarch64_a64_i10_enc100::get_f23()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i10_enc100::get_sf()
+{
+  return BITSEL(ir, 18);
+}
+uint8_t aarch64_a64_i10_enc100::get_opc()
+{
+  return UNSIGNED_BITS(ir, 17, 13);
+}
+uint8_t aarch64_a64_i10_enc100::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 12, 9);
+}
+uint8_t aarch64_a64_i10_enc100::get_size()
+{
+  return BITSEL(ir, 8);
+}
+uint8_t aarch64_a64_i10_enc100::get_op()
+{
+  return UNSIGNED_BITS(ir, 7, 5);
+}
+uint8_t aarch64_a64_i10_enc100::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 4, 1);
+}
+uint8_t aarch64_a64_i10_enc100::get_f0()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i0_enc0::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i0_enc0::get_size()
+{
+  return UNSIGNED_BITS(ir, 22, 20);
+}
+uint8_t aarch64_a64_i0_enc0::get_f19()
+{
+  return UNSIGNED_BITS(ir, 19, 16);
+}
+uint8_t aarch64_a64_i0_enc0::get_op()
+{
+  return UNSIGNED_BITS(ir, 15, 11);
+}
+uint8_t aarch64_a64_i0_enc0::get_opc()
+{
+  return UNSIGNED_BITS(ir, 10, 7);
+}
+uint8_t aarch64_a64_i0_enc0::get_imm()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i26_enc260::get_Rm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i26_enc260::get_Rd()
+{
+  return BITSEL(ir, 25);
+}
+uint8_t aarch64_a64_i26_enc260::get_size()
+{
+  return UNSIGNED_BITS(ir, 24, 20);
+}
+uint8_t aarch64_a64_i26_enc260::get_imm()
+{
+  return UNSIGNED_BITS(ir, 19, 18);
+}
+uint8_t aarch64_a64_i26_enc260::get_op()
+{
+  return UNSIGNED_BITS(ir, 16, 15);
+}
+uint8_t aarch64_a64_i26_enc260::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 9, 8);
+}
+uint8_t aarch64_a64_i26_enc260::get_sf()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i26_enc260::get_opc()
+{
+  return UNSIGNED_BITS(ir, 6, 4);
+}
+uint8_t aarch64_a64_i26_enc260::get_f1()
+{
+  return BITSEL(ir, 1);
+}
+uint8_t aarch64_a64_i18_enc180::get_sf()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i18_enc180::get_Rd()
+{
+  return BITSEL(ir, 23);
+}
+uint8_t aarch64_a64_i18_enc180::get_f22()
+{
+  return UNSIGNED_BITS(ir, 22, 19);
+}
+uint8_t aarch64_a64_i18_enc180::get_Rn()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i18_enc180::get_op()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i18_enc180::get_Rm()
+{
+  return BITSEL(ir, 11);
+}
+uint8_t aarch64_a64_i18_enc180::get_opc()
+{
+  return BITSEL(ir, 10);
+}
+uint8_t aarch64_a64_i18_enc180::get_imm()
+{
+  return UNSIGNED_BITS(ir, 9, 5);
+}
+uint8_t aarch64_a64_i18_enc180::get_f4()
+{
+  return UNSIGNED_BITS(ir, 4, 2);
+}
+uint8_t aarch64_a64_i27_enc270::get_op()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i27_enc270::get_f24()
+{
+  return UNSIGNED_BITS(ir, 24, 22);
+}
+uint8_t aarch64_a64_i27_enc270::get_Rm()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i27_enc270::get_sf()
+{
+  return UNSIGNED_BITS(ir, 19, 18);
+}
+uint8_t aarch64_a64_i27_enc270::get_Rn()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i27_enc270::get_f10()
+{
+  return UNSIGNED_BITS(ir, 10, 6);
+}
+uint8_t aarch64_a64_i27_enc270::get_size()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i27_enc270::get_opc()
+{
+  return UNSIGNED_BITS(ir, 4, 3);
+}
+uint8_t aarch64_a64_i27_enc270::get_f2()
+{
+  return UNSIGNED_BITS(ir, 2, 1);
+}
+uint8_t aarch64_a64_i27_enc270::get_Rd()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i25_enc250::get_sf()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i25_enc250::get_Rn()
+{
+  return BITSEL(ir, 23);
+}
+uint8_t aarch64_a64_i25_enc250::get_f22()
+{
+  return UNSIGNED_BITS(ir, 22, 19);
+}
+uint8_t aarch64_a64_i25_enc250::get_imm()
+{
+  return UNSIGNED_BITS(ir, 18, 14);
+}
+uint8_t aarch64_a64_i25_enc250::get_size()
+{
+  return UNSIGNED_BITS(ir, 13, 10);
+}
+uint8_t aarch64_a64_i25_enc250::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 9, 7);
+}
+uint8_t aarch64_a64_i25_enc250::get_op()
+{
+  return UNSIGNED_BITS(ir, 5, 1);
+}
+uint8_t aarch64_a64_i25_enc250::get_opc()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i34_enc340::get_f26()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i34_enc340::get_op()
+{
+  return UNSIGNED_BITS(ir, 22, 18);
+}
+uint8_t aarch64_a64_i34_enc340::get_imm()
+{
+  return UNSIGNED_BITS(ir, 14, 12);
+}
+uint8_t aarch64_a64_i34_enc340::get_size()
+{
+  return UNSIGNED_BITS(ir, 11, 7);
+}
+uint8_t aarch64_a64_i34_enc340::get_opc()
+{
+  return UNSIGNED_BITS(ir, 6, 3);
+}
+uint8_t aarch64_a64_i11_enc111::get_sf()
+{
+  return UNSIGNED_BITS(ir, 22, 20);
+}
+uint8_t aarch64_a64_i11_enc111::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 19, 17);
+}
+uint8_t aarch64_a64_i11_enc111::get_Rn()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i11_enc111::get_size()
+{
+  return UNSIGNED_BITS(ir, 15, 14);
+}
+uint8_t aarch64_a64_i11_enc111::get_opc()
+{
+  return BITSEL(ir, 8);
+}
+uint8_t aarch64_a64_i11_enc111::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 7, 4);
+}
+uint8_t aarch64_a64_i17_enc171::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i17_enc171::get_opc()
+{
+  return UNSIGNED_BITS(ir, 23, 22);
+}
+uint8_t aarch64_a64_i17_enc171::get_Rn()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i17_enc171::get_imm()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i17_enc171::get_sf()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i17_enc171::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 16, 13);
+}
+uint8_t aarch64_a64_i17_enc171::get_size()
+{
+  return UNSIGNED_BITS(ir, 12, 9);
+}
+uint8_t aarch64_a64_i17_enc171::get_op()
+{
+  return UNSIGNED_BITS(ir, 8, 7);
+}
+uint8_t aarch64_a64_i17_enc171::get_f6()
+{
+  return UNSIGNED_BITS(ir, 6, 2);
+}
+uint8_t aarch64_a64_i5_enc51::get_Rd()
+{
+  return BITSEL(ir, 24);
+}
+uint8_t aarch64_a64_i5_enc51::get_f23()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i5_enc51::get_op()
+{
+  return UNSIGNED_BITS(ir, 18, 14);
+}
+uint8_t aarch64_a64_i5_enc51::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 13, 10);
+}
+uint8_t aarch64_a64_i5_enc51::get_Rn()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i5_enc51::get_size()
+{
+  return BITSEL(ir, 8);
+}
+uint8_t aarch64_a64_i5_enc51::get_imm()
+{
+  return UNSIGNED_BITS(ir, 7, 6);
+}
+uint8_t aarch64_a64_i5_enc51::get_sf()
+{
+  return UNSIGNED_BITS(ir, 5, 2);
+}
+uint8_t aarch64_a64_i14_enc140::get_imm()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i14_enc140::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 22, 19);
+}
+uint8_t aarch64_a64_i14_enc140::get_sf()
+{
+  return UNSIGNED_BITS(ir, 13, 12);
+}
+uint8_t aarch64_a64_i14_enc140::get_opc()
+{
+  return UNSIGNED_BITS(ir, 8, 5);
+}
+uint8_t aarch64_a64_i14_enc140::get_op()
+{
+  return UNSIGNED_BITS(ir, 4, 2);
+}
+uint8_t aarch64_a64_i14_enc140::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i13_enc130::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i13_enc130::get_size()
+{
+  return UNSIGNED_BITS(ir, 18, 14);
+}
+uint8_t aarch64_a64_i13_enc130::get_op()
+{
+  return UNSIGNED_BITS(ir, 13, 12);
+}
+uint8_t aarch64_a64_i13_enc130::get_opc()
+{
+  return UNSIGNED_BITS(ir, 11, 10);
+}
+uint8_t aarch64_a64_i13_enc130::get_imm()
+{
+  return UNSIGNED_BITS(ir, 5, 4);
+}
+uint8_t aarch64_a64_i13_enc130::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 3, 1);
+}
+uint8_t aarch64_a64_i13_enc130::get_Rn()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i28_enc280::get_op()
+{
+  return UNSIGNED_BITS(ir, 22, 19);
+}
+uint8_t aarch64_a64_i28_enc280::get_Rd()
+{
+  return BITSEL(ir, 18);
+}
+uint8_t aarch64_a64_i28_enc280::get_imm()
+{
+  return UNSIGNED_BITS(ir, 12, 8);
+}
+uint8_t aarch64_a64_i3_enc31::get_imm()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i3_enc31::get_size()
+{
+  return UNSIGNED_BITS(ir, 23, 20);
+}
+uint8_t aarch64_a64_i3_enc31::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 19, 15);
+}
+uint8_t aarch64_a64_i3_enc31::get_sf()
+{
+  return UNSIGNED_BITS(ir, 14, 11);
+}
+uint8_t aarch64_a64_i3_enc31::get_Rm()
+{
+  return BITSEL(ir, 10);
+}
+uint8_t aarch64_a64_i3_enc31::get_opc()
+{
+  return UNSIGNED_BITS(ir, 9, 8);
+}
+uint8_t aarch64_a64_i3_enc31::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 7, 5);
+}
+uint8_t aarch64_a64_i3_enc31::get_op()
+{
+  return UNSIGNED_BITS(ir, 4, 1);
+}
+uint8_t aarch64_a64_i3_enc31::get_f0()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i12_enc121::get_opc()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i12_enc121::get_sf()
+{
+  return BITSEL(ir, 11);
+}
+uint8_t aarch64_a64_i12_enc121::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 7, 6);
+}
+uint8_t aarch64_a64_i12_enc121::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 4, 0);
+}
+uint8_t aarch64_a64_i22_enc222::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i22_enc222::get_f22()
+{
+  return UNSIGNED_BITS(ir, 22, 21);
+}
+uint8_t aarch64_a64_i22_enc222::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 20, 18);
+}
+uint8_t aarch64_a64_i22_enc222::get_size()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i22_enc222::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 16, 12);
+}
+uint8_t aarch64_a64_i22_enc222::get_op()
+{
+  return UNSIGNED_BITS(ir, 11, 10);
+}
+uint8_t aarch64_a64_i22_enc222::get_imm()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i22_enc222::get_opc()
+{
+  return UNSIGNED_BITS(ir, 6, 5);
+}
+uint8_t aarch64_a64_i22_enc222::get_sf()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i21_enc210::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 24, 22);
+}
+uint8_t aarch64_a64_i21_enc210::get_imm()
+{
+  return UNSIGNED_BITS(ir, 20, 16);
+}
+uint8_t aarch64_a64_i21_enc210::get_op()
+{
+  return BITSEL(ir, 14);
+}
+uint8_t aarch64_a64_i21_enc210::get_Rd()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i21_enc210::get_sf()
+{
+  return BITSEL(ir, 8);
+}
+uint8_t aarch64_a64_i21_enc210::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 6, 5);
+}
+uint8_t aarch64_a64_i21_enc210::get_opc()
+{
+  return UNSIGNED_BITS(ir, 4, 2);
+}
+uint8_t aarch64_a64_i7_enc71::get_imm()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i7_enc71::get_sf()
+{
+  return UNSIGNED_BITS(ir, 24, 21);
+}
+uint8_t aarch64_a64_i7_enc71::get_opc()
+{
+  return UNSIGNED_BITS(ir, 20, 18);
+}
+uint8_t aarch64_a64_i7_enc71::get_size()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i7_enc71::get_Rd()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i7_enc71::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i7_enc71::get_op()
+{
+  return BITSEL(ir, 6);
+}
+uint8_t aarch64_a64_i7_enc71::get_Rn()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i28_enc281::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i28_enc281::get_f22()
+{
+  return BITSEL(ir, 22);
+}
+uint8_t aarch64_a64_i28_enc281::get_sf()
+{
+  return UNSIGNED_BITS(ir, 21, 18);
+}
+uint8_t aarch64_a64_i28_enc281::get_op()
+{
+  return BITSEL(ir, 11);
+}
+uint8_t aarch64_a64_i28_enc281::get_imm()
+{
+  return UNSIGNED_BITS(ir, 10, 8);
+}
+uint8_t aarch64_a64_i28_enc281::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 7, 3);
+}
+uint8_t aarch64_a64_i28_enc281::get_Rd()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i11_enc112::get_imm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i11_enc112::get_f25()
+{
+  return BITSEL(ir, 25);
+}
+uint8_t aarch64_a64_i11_enc112::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 24, 20);
+}
+uint8_t aarch64_a64_i11_enc112::get_size()
+{
+  return UNSIGNED_BITS(ir, 19, 17);
+}
+uint8_t aarch64_a64_i11_enc112::get_opc()
+{
+  return UNSIGNED_BITS(ir, 16, 13);
+}
+uint8_t aarch64_a64_i11_enc112::get_Rm()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i11_enc112::get_sf()
+{
+  return UNSIGNED_BITS(ir, 11, 7);
+}
+uint8_t aarch64_a64_i11_enc112::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 6, 4);
+}
+uint8_t aarch64_a64_i11_enc112::get_op()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i23_enc230::get_Rd()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i23_enc230::get_size()
+{
+  return UNSIGNED_BITS(ir, 21, 20);
+}
+uint8_t aarch64_a64_i23_enc230::get_f19()
+{
+  return UNSIGNED_BITS(ir, 19, 16);
+}
+uint8_t aarch64_a64_i23_enc230::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 14, 12);
+}
+uint8_t aarch64_a64_i23_enc230::get_imm()
+{
+  return UNSIGNED_BITS(ir, 11, 7);
+}
+uint8_t aarch64_a64_i23_enc230::get_opc()
+{
+  return BITSEL(ir, 6);
+}
+uint8_t aarch64_a64_i23_enc230::get_op()
+{
+  return UNSIGNED_BITS(ir, 5, 4);
+}
+uint8_t aarch64_a64_i23_enc230::get_sf()
+{
+  return BITSEL(ir, 2);
+}
+uint8_t aarch64_a64_i23_enc230::get_Rn()
+{
+  return BITSEL(ir, 1);
+}
+uint8_t aarch64_a64_i33_enc330::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i33_enc330::get_opc()
+{
+  return BITSEL(ir, 23);
+}
+uint8_t aarch64_a64_i33_enc330::get_sf()
+{
+  return UNSIGNED_BITS(ir, 22, 20);
+}
+uint8_t aarch64_a64_i33_enc330::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 13, 11);
+}
+uint8_t aarch64_a64_i33_enc330::get_op()
+{
+  return UNSIGNED_BITS(ir, 9, 8);
+}
+uint8_t aarch64_a64_i33_enc330::get_imm()
+{
+  return UNSIGNED_BITS(ir, 7, 5);
+}
+uint8_t aarch64_a64_i23_enc232::get_Rd()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i23_enc232::get_opc()
+{
+  return UNSIGNED_BITS(ir, 19, 18);
+}
+uint8_t aarch64_a64_i23_enc232::get_sf()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i23_enc232::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 15, 13);
+}
+uint8_t aarch64_a64_i23_enc232::get_imm()
+{
+  return UNSIGNED_BITS(ir, 12, 8);
+}
+uint8_t aarch64_a64_i23_enc232::get_op()
+{
+  return UNSIGNED_BITS(ir, 4, 2);
+}
+uint8_t aarch64_a64_i23_enc232::get_size()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i3_enc32::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 24, 23);
+}
+uint8_t aarch64_a64_i3_enc32::get_imm()
+{
+  return BITSEL(ir, 22);
+}
+uint8_t aarch64_a64_i3_enc32::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 21, 20);
+}
+uint8_t aarch64_a64_i3_enc32::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 16, 15);
+}
+uint8_t aarch64_a64_i3_enc32::get_opc()
+{
+  return UNSIGNED_BITS(ir, 14, 10);
+}
+uint8_t aarch64_a64_i3_enc32::get_f4()
+{
+  return UNSIGNED_BITS(ir, 4, 3);
+}
+uint8_t aarch64_a64_i1_enc10::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 25, 22);
+}
+uint8_t aarch64_a64_i1_enc10::get_sf()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i1_enc10::get_op()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i1_enc10::get_opc()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i1_enc10::get_imm()
+{
+  return UNSIGNED_BITS(ir, 10, 9);
+}
+uint8_t aarch64_a64_i1_enc10::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 8, 6);
+}
+uint8_t aarch64_a64_i1_enc10::get_Rd()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i1_enc10::get_size()
+{
+  return UNSIGNED_BITS(ir, 1, 0);
+}
+uint8_t aarch64_a64_i24_enc240::get_f26()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i24_enc240::get_imm()
+{
+  return BITSEL(ir, 23);
+}
+uint8_t aarch64_a64_i24_enc240::get_size()
+{
+  return UNSIGNED_BITS(ir, 21, 18);
+}
+uint8_t aarch64_a64_i24_enc240::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 17, 14);
+}
+uint8_t aarch64_a64_i24_enc240::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 12, 9);
+}
+uint8_t aarch64_a64_i24_enc240::get_sf()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i24_enc240::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 4, 3);
+}
+uint8_t aarch64_a64_i24_enc240::get_op()
+{
+  return UNSIGNED_BITS(ir, 2, 1);
+}
+uint8_t aarch64_a64_i26_enc262::get_op()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i26_enc262::get_Rd()
+{
+  return BITSEL(ir, 25);
+}
+uint8_t aarch64_a64_i26_enc262::get_size()
+{
+  return UNSIGNED_BITS(ir, 24, 21);
+}
+uint8_t aarch64_a64_i26_enc262::get_sf()
+{
+  return UNSIGNED_BITS(ir, 19, 16);
+}
+uint8_t aarch64_a64_i26_enc262::get_opc()
+{
+  return UNSIGNED_BITS(ir, 15, 11);
+}
+uint8_t aarch64_a64_i26_enc262::get_f10()
+{
+  return UNSIGNED_BITS(ir, 10, 8);
+}
+uint8_t aarch64_a64_i26_enc262::get_imm()
+{
+  return UNSIGNED_BITS(ir, 7, 6);
+}
+uint8_t aarch64_a64_i26_enc262::get_f5()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i26_enc262::get_f4()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i3_enc30::get_imm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i3_enc30::get_op()
+{
+  return UNSIGNED_BITS(ir, 25, 22);
+}
+uint8_t aarch64_a64_i3_enc30::get_opc()
+{
+  return UNSIGNED_BITS(ir, 21, 18);
+}
+uint8_t aarch64_a64_i3_enc30::get_f17()
+{
+  return UNSIGNED_BITS(ir, 17, 16);
+}
+uint8_t aarch64_a64_i3_enc30::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i3_enc30::get_sf()
+{
+  return UNSIGNED_BITS(ir, 11, 7);
+}
+uint8_t aarch64_a64_i3_enc30::get_Rm()
+{
+  return BITSEL(ir, 6);
+}
+uint8_t aarch64_a64_i3_enc30::get_f5()
+{
+  return UNSIGNED_BITS(ir, 5, 4);
+}
+uint8_t aarch64_a64_i3_enc30::get_size()
+{
+  return UNSIGNED_BITS(ir, 3, 1);
+}
+uint8_t aarch64_a64_i3_enc30::get_Rn()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i26_enc261::get_sf()
+{
+  return UNSIGNED_BITS(ir, 21, 19);
+}
+uint8_t aarch64_a64_i26_enc261::get_imm()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i26_enc261::get_op()
+{
+  return UNSIGNED_BITS(ir, 10, 9);
+}
+uint8_t aarch64_a64_i26_enc261::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 8, 4);
+}
+uint8_t aarch64_a64_i26_enc261::get_opc()
+{
+  return UNSIGNED_BITS(ir, 3, 0);
+}
+uint8_t aarch64_a64_i4_enc40::get_f25()
+{
+  return UNSIGNED_BITS(ir, 25, 22);
+}
+uint8_t aarch64_a64_i4_enc40::get_Rn()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i4_enc40::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 20, 18);
+}
+uint8_t aarch64_a64_i4_enc40::get_opc()
+{
+  return UNSIGNED_BITS(ir, 17, 16);
+}
+uint8_t aarch64_a64_i4_enc40::get_imm()
+{
+  return BITSEL(ir, 15);
+}
+uint8_t aarch64_a64_i4_enc40::get_sf()
+{
+  return UNSIGNED_BITS(ir, 14, 12);
+}
+uint8_t aarch64_a64_i4_enc40::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i4_enc40::get_op()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i4_enc40::get_size()
+{
+  return BITSEL(ir, 6);
+}
+uint8_t aarch64_a64_i13_enc132::get_sf()
+{
+  return UNSIGNED_BITS(ir, 26, 22);
+}
+uint8_t aarch64_a64_i13_enc132::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 17, 13);
+}
+uint8_t aarch64_a64_i13_enc132::get_Rm()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i13_enc132::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 6, 4);
+}
+uint8_t aarch64_a64_i13_enc132::get_size()
+{
+  return UNSIGNED_BITS(ir, 3, 0);
+}
+uint8_t aarch64_a64_i32_enc321::get_f25()
+{
+  return UNSIGNED_BITS(ir, 25, 23);
+}
+uint8_t aarch64_a64_i32_enc321::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 22, 21);
+}
+uint8_t aarch64_a64_i32_enc321::get_sf()
+{
+  return BITSEL(ir, 19);
+}
+uint8_t aarch64_a64_i32_enc321::get_op()
+{
+  return BITSEL(ir, 13);
+}
+uint8_t aarch64_a64_i24_enc241::get_Rn()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i24_enc241::get_size()
+{
+  return UNSIGNED_BITS(ir, 20, 17);
+}
+uint8_t aarch64_a64_i24_enc241::get_f16()
+{
+  return UNSIGNED_BITS(ir, 16, 13);
+}
+uint8_t aarch64_a64_i24_enc241::get_op()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i24_enc241::get_imm()
+{
+  return UNSIGNED_BITS(ir, 10, 8);
+}
+uint8_t aarch64_a64_i24_enc241::get_f7()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i24_enc241::get_sf()
+{
+  return BITSEL(ir, 6);
+}
+uint8_t aarch64_a64_i24_enc241::get_f5()
+{
+  return UNSIGNED_BITS(ir, 5, 3);
+}
+uint8_t aarch64_a64_i24_enc241::get_Rd()
+{
+  return BITSEL(ir, 2);
+}
+uint8_t aarch64_a64_i24_enc241::get_opc()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i8_enc80::get_sf()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i8_enc80::get_size()
+{
+  return UNSIGNED_BITS(ir, 24, 23);
+}
+uint8_t aarch64_a64_i8_enc80::get_Rn()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i8_enc80::get_Rm()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i8_enc80::get_op()
+{
+  return BITSEL(ir, 19);
+}
+uint8_t aarch64_a64_i8_enc80::get_Rd()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i8_enc80::get_imm()
+{
+  return UNSIGNED_BITS(ir, 16, 14);
+}
+uint8_t aarch64_a64_i8_enc80::get_opc()
+{
+  return BITSEL(ir, 13);
+}
+uint8_t aarch64_a64_i8_enc80::get_f12()
+{
+  return BITSEL(ir, 12);
+}
+uint8_t aarch64_a64_i33_enc331::get_opc()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i33_enc331::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 24, 20);
+}
+uint8_t aarch64_a64_i33_enc331::get_op()
+{
+  return UNSIGNED_BITS(ir, 19, 18);
+}
+uint8_t aarch64_a64_i33_enc331::get_Rm()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i33_enc331::get_imm()
+{
+  return UNSIGNED_BITS(ir, 16, 15);
+}
+uint8_t aarch64_a64_i33_enc331::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 14, 11);
+}
+uint8_t aarch64_a64_i33_enc331::get_sf()
+{
+  return UNSIGNED_BITS(ir, 10, 9);
+}
+uint8_t aarch64_a64_i33_enc331::get_f8()
+{
+  return UNSIGNED_BITS(ir, 8, 4);
+}
+uint8_t aarch64_a64_i33_enc331::get_size()
+{
+  return UNSIGNED_BITS(ir, 3, 0);
+}
+uint8_t aarch64_a64_i20_enc200::get_size()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i20_enc200::get_imm()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i20_enc200::get_op()
+{
+  return BITSEL(ir, 18);
+}
+uint8_t aarch64_a64_i20_enc200::get_opc()
+{
+  return UNSIGNED_BITS(ir, 9, 8);
+}
+uint8_t aarch64_a64_i20_enc200::get_sf()
+{
+  return UNSIGNED_BITS(ir, 7, 4);
+}
+uint8_t aarch64_a64_i20_enc200::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 3, 2);
+}
+uint8_t aarch64_a64_i12_enc122::get_op()
+{
+  return UNSIGNED_BITS(ir, 19, 15);
+}
+uint8_t aarch64_a64_i12_enc122::get_imm()
+{
+  return UNSIGNED_BITS(ir, 14, 10);
+}
+uint8_t aarch64_a64_i12_enc122::get_size()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i12_enc122::get_Rd()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i12_enc122::get_Rn()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i2_enc20::get_sf()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i2_enc20::get_size()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i2_enc20::get_Rn()
+{
+  return BITSEL(ir, 15);
+}
+uint8_t aarch64_a64_i2_enc20::get_imm()
+{
+  return UNSIGNED_BITS(ir, 11, 8);
+}
+uint8_t aarch64_a64_i2_enc20::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 6, 5);
+}
+uint8_t aarch64_a64_i2_enc20::get_opc()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i1_enc12::get_Rm()
+{
+  return BITSEL(ir, 26);
+}
+uint8_t aarch64_a64_i1_enc12::get_op()
+{
+  return UNSIGNED_BITS(ir, 25, 22);
+}
+uint8_t aarch64_a64_i1_enc12::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 21, 19);
+}
+uint8_t aarch64_a64_i1_enc12::get_size()
+{
+  return BITSEL(ir, 15);
+}
+uint8_t aarch64_a64_i1_enc12::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 10, 9);
+}
+uint8_t aarch64_a64_i1_enc12::get_imm()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i1_enc12::get_sf()
+{
+  return BITSEL(ir, 3);
+}
+uint8_t aarch64_a64_i36_enc362::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 26, 22);
+}
+uint8_t aarch64_a64_i36_enc362::get_opc()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i36_enc362::get_sf()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i36_enc362::get_Rn()
+{
+  return BITSEL(ir, 14);
+}
+uint8_t aarch64_a64_i36_enc362::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 12, 11);
+}
+uint8_t aarch64_a64_i36_enc362::get_imm()
+{
+  return UNSIGNED_BITS(ir, 9, 5);
+}
+uint8_t aarch64_a64_i36_enc362::get_f4()
+{
+  return UNSIGNED_BITS(ir, 4, 1);
+}
+uint8_t aarch64_a64_i36_enc362::get_size()
+{
+  return BITSEL(ir, 0);
+}
+uint8_t aarch64_a64_i8_enc82::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i8_enc82::get_sf()
+{
+  return UNSIGNED_BITS(ir, 17, 15);
+}
+uint8_t aarch64_a64_i8_enc82::get_opc()
+{
+  return UNSIGNED_BITS(ir, 10, 7);
+}
+uint8_t aarch64_a64_i8_enc82::get_f3()
+{
+  return BITSEL(ir, 3);
+}
+uint8_t aarch64_a64_i8_enc82::get_size()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i38_enc381::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 21, 19);
+}
+uint8_t aarch64_a64_i38_enc381::get_sf()
+{
+  return UNSIGNED_BITS(ir, 18, 14);
+}
+uint8_t aarch64_a64_i38_enc381::get_size()
+{
+  return UNSIGNED_BITS(ir, 8, 7);
+}
+uint8_t aarch64_a64_i38_enc381::get_Rm()
+{
+  return BITSEL(ir, 6);
+}
+uint8_t aarch64_a64_i38_enc381::get_Rd()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i11_enc110::get_opc()
+{
+  return UNSIGNED_BITS(ir, 25, 21);
+}
+uint8_t aarch64_a64_i11_enc110::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 20, 19);
+}
+uint8_t aarch64_a64_i11_enc110::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 18, 17);
+}
+uint8_t aarch64_a64_i11_enc110::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 16, 13);
+}
+uint8_t aarch64_a64_i11_enc110::get_op()
+{
+  return UNSIGNED_BITS(ir, 9, 6);
+}
+uint8_t aarch64_a64_i11_enc110::get_size()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i11_enc110::get_imm()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i30_enc300::get_opc()
+{
+  return UNSIGNED_BITS(ir, 26, 23);
+}
+uint8_t aarch64_a64_i30_enc300::get_size()
+{
+  return UNSIGNED_BITS(ir, 21, 17);
+}
+uint8_t aarch64_a64_i30_enc300::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 16, 14);
+}
+uint8_t aarch64_a64_i30_enc300::get_Rd()
+{
+  return BITSEL(ir, 13);
+}
+uint8_t aarch64_a64_i30_enc300::get_op()
+{
+  return UNSIGNED_BITS(ir, 12, 8);
+}
+uint8_t aarch64_a64_i30_enc300::get_f7()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i30_enc300::get_sf()
+{
+  return UNSIGNED_BITS(ir, 6, 5);
+}
+uint8_t aarch64_a64_i30_enc300::get_imm()
+{
+  return UNSIGNED_BITS(ir, 4, 3);
+}
+uint8_t aarch64_a64_i30_enc300::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i12_enc120::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 26, 25);
+}
+uint8_t aarch64_a64_i12_enc120::get_opc()
+{
+  return BITSEL(ir, 24);
+}
+uint8_t aarch64_a64_i12_enc120::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 23, 19);
+}
+uint8_t aarch64_a64_i12_enc120::get_sf()
+{
+  return UNSIGNED_BITS(ir, 18, 14);
+}
+uint8_t aarch64_a64_i12_enc120::get_op()
+{
+  return UNSIGNED_BITS(ir, 12, 8);
+}
+uint8_t aarch64_a64_i12_enc120::get_size()
+{
+  return UNSIGNED_BITS(ir, 7, 5);
+}
+uint8_t aarch64_a64_i37_enc370::get_Rd()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i37_enc370::get_f20()
+{
+  return BITSEL(ir, 20);
+}
+uint8_t aarch64_a64_i37_enc370::get_f19()
+{
+  return UNSIGNED_BITS(ir, 19, 15);
+}
+uint8_t aarch64_a64_i37_enc370::get_op()
+{
+  return UNSIGNED_BITS(ir, 13, 9);
+}
+uint8_t aarch64_a64_i37_enc370::get_Rm()
+{
+  return BITSEL(ir, 7);
+}
+uint8_t aarch64_a64_i37_enc370::get_size()
+{
+  return UNSIGNED_BITS(ir, 6, 5);
+}
+uint8_t aarch64_a64_i10_enc101::get_imm()
+{
+  return UNSIGNED_BITS(ir, 25, 22);
+}
+uint8_t aarch64_a64_i10_enc101::get_opc()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i10_enc101::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 20, 18);
+}
+uint8_t aarch64_a64_i10_enc101::get_size()
+{
+  return BITSEL(ir, 17);
+}
+uint8_t aarch64_a64_i10_enc101::get_sf()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i10_enc101::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i10_enc101::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 10, 6);
+}
+uint8_t aarch64_a64_i10_enc101::get_op()
+{
+  return BITSEL(ir, 5);
+}
+uint8_t aarch64_a64_i10_enc101::get_f4()
+{
+  return UNSIGNED_BITS(ir, 4, 0);
+}
+uint8_t aarch64_a64_i7_enc70::get_sf()
+{
+  return UNSIGNED_BITS(ir, 18, 17);
+}
+uint8_t aarch64_a64_i7_enc70::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 16, 12);
+}
+uint8_t aarch64_a64_i7_enc70::get_size()
+{
+  return BITSEL(ir, 11);
+}
+uint8_t aarch64_a64_i7_enc70::get_imm()
+{
+  return BITSEL(ir, 10);
+}
+uint8_t aarch64_a64_i7_enc70::get_opc()
+{
+  return BITSEL(ir, 9);
+}
+uint8_t aarch64_a64_i7_enc70::get_f8()
+{
+  return UNSIGNED_BITS(ir, 8, 5);
+}
+uint8_t aarch64_a64_i7_enc70::get_Rm()
+{
+  return BITSEL(ir, 4);
+}
+uint8_t aarch64_a64_i7_enc70::get_op()
+{
+  return UNSIGNED_BITS(ir, 3, 0);
+}
+uint8_t aarch64_a64_i23_enc231::get_Rm()
+{
+  return BITSEL(ir, 22);
+}
+uint8_t aarch64_a64_i23_enc231::get_size()
+{
+  return BITSEL(ir, 21);
+}
+uint8_t aarch64_a64_i23_enc231::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 20, 16);
+}
+uint8_t aarch64_a64_i23_enc231::get_op()
+{
+  return UNSIGNED_BITS(ir, 15, 12);
+}
+uint8_t aarch64_a64_i23_enc231::get_f11()
+{
+  return UNSIGNED_BITS(ir, 11, 9);
+}
+uint8_t aarch64_a64_i23_enc231::get_sf()
+{
+  return UNSIGNED_BITS(ir, 8, 7);
+}
+uint8_t aarch64_a64_i23_enc231::get_opc()
+{
+  return UNSIGNED_BITS(ir, 6, 4);
+}
+uint8_t aarch64_a64_i23_enc231::get_imm()
+{
+  return BITSEL(ir, 3);
+}
+uint8_t aarch64_a64_i23_enc231::get_Rn()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i22_enc220::get_sf()
+{
+  return UNSIGNED_BITS(ir, 26, 24);
+}
+uint8_t aarch64_a64_i22_enc220::get_Rn()
+{
+  return BITSEL(ir, 23);
+}
+uint8_t aarch64_a64_i22_enc220::get_Rd()
+{
+  return UNSIGNED_BITS(ir, 22, 20);
+}
+uint8_t aarch64_a64_i22_enc220::get_opc()
+{
+  return BITSEL(ir, 19);
+}
+uint8_t aarch64_a64_i22_enc220::get_op()
+{
+  return UNSIGNED_BITS(ir, 18, 16);
+}
+uint8_t aarch64_a64_i22_enc220::get_size()
+{
+  return UNSIGNED_BITS(ir, 15, 14);
+}
+uint8_t aarch64_a64_i22_enc220::get_Rm()
+{
+  return UNSIGNED_BITS(ir, 13, 10);
+}
+uint8_t aarch64_a64_i22_enc220::get_imm()
+{
+  return UNSIGNED_BITS(ir, 9, 8);
+}
+uint8_t aarch64_a64_i22_enc220::get_f2()
+{
+  return UNSIGNED_BITS(ir, 2, 0);
+}
+uint8_t aarch64_a64_i38_enc380::get_opc()
+{
+  return UNSIGNED_BITS(ir, 26, 22);
+}
+uint8_t aarch64_a64_i38_enc380::get_op()
+{
+  return BITSEL(ir, 18);
+}
+uint8_t aarch64_a64_i38_enc380::get_f17()
+{
+  return UNSIGNED_BITS(ir, 17, 15);
+}
+uint8_t aarch64_a64_i38_enc380::get_size()
+{
+  return UNSIGNED_BITS(ir, 9, 6);
+}
+uint8_t aarch64_a64_i38_enc380::get_Rn()
+{
+  return BITSEL(ir, 1);
+}
+uint8_t aarch64_a64_i36_enc361::get_Rn()
+{
+  return BITSEL(ir, 25);
+}
+uint8_t aarch64_a64_i36_enc361::get_imm()
+{
+  return UNSIGNED_BITS(ir, 24, 21);
+}
+uint8_t aarch64_a64_i36_enc361::get_Rd()
+{
+  return BITSEL(ir, 16);
+}
+uint8_t aarch64_a64_i36_enc361::get_size()
+{
+  return UNSIGNED_BITS(ir, 15, 11);
+}
+uint8_t aarch64_a64_i36_enc361::get_opc()
+{
+  return BITSEL(ir, 10);
+}
+uint8_t aarch64_a64_i36_enc361::get_op()
+{
+  return UNSIGNED_BITS(ir, 7, 3);
+}
+uint8_t aarch64_a64_i36_enc361::get_sf()
+{
+  return BITSEL(ir, 2);
+}
+uint8_t aarch64_a64_i36_enc361::get_Rm()
+{
+  return BITSEL(ir, 0);
+}
@@ -0,0 +1,1085 @@
+#pragma once
+#include <stddef.h>
+#include <stdint.h>
+#ifdef AARCH64_DECODE_COUNTERS
+#include <stdio.h>
+#endif
+#include "decode.h"
+namespace captive
+{
+  namespace arch
+  {
+    namespace aarch64
+    {
+      class aarch64_decode : public Decode
+      {
+        public:
+          enum aarch64_isa_modes
+          {
+            aarch64_a64 = 0,
+          };
+          enum aarch64_opcodes
+          {
+            op_aarch64_a64_i2_enc20,
+            op_aarch64_a64_i20_enc200,
+            op_aarch64_a64_i22_enc220,
+            op_aarch64_a64_i22_enc221,
+            op_aarch64_a64_i22_enc222,
+            op_aarch64_a64_i27_enc270,
+            op_aarch64_a64_i27_enc271,
+            op_aarch64_a64_i28_enc280,
+            op_aarch64_a64_i28_enc281,
+            op_aarch64_a64_i31_enc310,
+            op_aarch64_a64_i31_enc311,
+            op_aarch64_a64_i12_enc120,
+            op_aarch64_a64_i12_enc121,
+            op_aarch64_a64_i12_enc122,
+            op_aarch64_a64_i15_enc150,
+            op_aarch64_a64_i17_enc170,
+            op_aarch64_a64_i17_enc171,
+            op_aarch64_a64_i17_enc172,
+            op_aarch64_a64_i18_enc180,
+            op_aarch64_a64_i24_enc240,
+            op_aarch64_a64_i24_enc241,
+            op_aarch64_a64_i24_enc242,
+            op_aarch64_a64_i36_enc360,
+            op_aarch64_a64_i36_enc361,
+            op_aarch64_a64_i36_enc362,
+            op_aarch64_a64_i38_enc380,
+            op_aarch64_a64_i38_enc381,
+            op_aarch64_a64_i0_enc0,
+            op_aarch64_a64_i10_enc100,
+            op_aarch64_a64_i10_enc101,
+            op_aarch64_a64_i10_enc102,
+            op_aarch64_a64_i25_enc250,
+            op_aarch64_a64_i26_enc260,
+            op_aarch64_a64_i26_enc261,
+            op_aarch64_a64_i26_enc262,
+            op_aarch64_a64_i8_enc80,
+            op_aarch64_a64_i8_enc81,
+            op_aarch64_a64_i8_enc82,
+            op_aarch64_a64_i1_enc10,
+            op_aarch64_a64_i1_enc11,
+            op_aarch64_a64_i1_enc12,
+            op_aarch64_a64_i11_enc110,
+            op_aarch64_a64_i11_enc111,
+            op_aarch64_a64_i11_enc112,
+            op_aarch64_a64_i14_enc140,
+            op_aarch64_a64_i23_enc230,
+            op_aarch64_a64_i23_enc231,
+            op_aarch64_a64_i23_enc232,
+            op_aarch64_a64_i3_enc30,
+            op_aarch64_a64_i3_enc31,
+            op_aarch64_a64_i3_enc32,
+            op_aarch64_a64_i32_enc320,
+            op_aarch64_a64_i32_enc321,
+            op_aarch64_a64_i35_enc350,
+            op_aarch64_a64_i4_enc40,
+            op_aarch64_a64_i5_enc50,
+            op_aarch64_a64_i5_enc51,
+            op_aarch64_a64_i5_enc52,
+            op_aarch64_a64_i21_enc210,
+            op_aarch64_a64_i33_enc330,
+            op_aarch64_a64_i33_enc331,
+            op_aarch64_a64_i33_enc332,
+            op_aarch64_a64_i34_enc340,
+            op_aarch64_a64_i37_enc370,
+            op_aarch64_a64_i7_enc70,
+            op_aarch64_a64_i7_enc71,
+            op_aarch64_a64_i7_enc72,
+            op_aarch64_a64_i13_enc130,
+            op_aarch64_a64_i13_enc131,
+            op_aarch64_a64_i13_enc132,
+            op_aarch64_a64_i16_enc160,
+            op_aarch64_a64_i30_enc300,
+            op_aarch64_a64_i6_enc60,
+            op_aarch64_a64_i6_enc61,
+            aarch64_unknown = -1
+          };
+
+          // The result of decoding a word, as compactly as decode_block gives it
+          struct decode_result
+          {
+            int16_t opcode; // an aarch64_opcodes
+            bool end_of_block;
+            bool is_predicated;
+          };
+
+          aarch64_isa_modes isa_mode;
+          aarch64_opcodes opcode;
+          uint32_t ir;
+          bool decode(uint32_t isa_mode, uint64_t insn_pc, const uint32_t *ptr) override;
+          JumpInfo get_jump_info() override;
+          // The name of the opcode, as in the aarch64_opcodes enum
+          static const char *opcode_name(aarch64_opcodes opcode);
+          // Decodes count A64 words from ptr, the first at insn_pc, into results, without a virtual call for each
+          void decode_block(uint64_t insn_pc, const uint32_t *ptr, size_t count, decode_result *results);
+          // Decodes A64 words from ptr into results until one ends the block, or max_count words have been decoded,
+          // returning the number of words decoded
+          size_t decode_until_end_of_block(uint64_t insn_pc, const uint32_t *ptr, size_t max_count, decode_result *results);
+#ifdef AARCH64_DECODE_CACHE_STATS
+          // the hits and misses of the current thread's decode cache, only defined if the cache is generated
+          static void get_decode_cache_stats(uint64_t &hits, uint64_t &misses);
+#endif
+#ifdef AARCH64_DECODE_COUNTERS
+          // writes the current thread's decode counters to file, as a profile that --decode-profile reads, or zeroes
+          // them, only defined if the counters are generated
+          static void dump_decode_counters(FILE *file);
+          static void reset_decode_counters();
+#endif
+        private:
+          bool decode_a64(uint32_t ir);
+          bool decode_a64_cold(uint32_t ir);
+          bool decode_a64_cached(uint32_t ir);
+          void decode_a64_into(uint64_t insn_pc, uint32_t word, decode_result *result);
+      };
+
+      class aarch64_decode_a64 : public aarch64_decode
+      {
+        public:
+          uint32_t immu32;
+          int32_t imms32;
+          uint64_t immu64;
+          int64_t imms64;
+          uint8_t shift_amount;
+          int64_t label;
+          uint8_t bit_pos;
+          uint8_t ext_type;
+          uint8_t arrangement;
+          uint8_t width;
+          uint8_t size;
+          uint8_t regcnt;
+          uint8_t elemcnt;
+          uint8_t elemsize;
+          uint8_t ta;
+          uint8_t tb;
+          uint8_t eindex;
+          uint8_t eindex2;
+          uint8_t rmr;
+      };
+
+      class aarch64_a64_i2_enc20 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i20_enc200 : public aarch64_decode_a64
+      {
+        uint8_t get_size();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+      };
+
+      class aarch64_a64_i22_enc220 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+        uint8_t get_opc();
+        uint8_t get_op();
+        uint8_t get_size();
+        uint8_t get_Rm();
+        uint8_t get_imm();
+        uint8_t get_f2();
+      };
+
+      class aarch64_a64_i22_enc221 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_Rm();
+        uint8_t get_f1();
+      };
+
+      class aarch64_a64_i22_enc222 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_f22();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_imm();
+        uint8_t get_opc();
+        uint8_t get_sf();
+      };
+
+      class aarch64_a64_i27_enc270 : public aarch64_decode_a64
+      {
+        uint8_t get_op();
+        uint8_t get_f24();
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_f10();
+        uint8_t get_size();
+        uint8_t get_opc();
+        uint8_t get_f2();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i27_enc271 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_Rd();
+        uint8_t get_f19();
+        uint8_t get_op();
+        uint8_t get_f15();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i28_enc280 : public aarch64_decode_a64
+      {
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i28_enc281 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_f22();
+        uint8_t get_sf();
+        uint8_t get_op();
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i31_enc310 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+        uint8_t get_op();
+      };
+
+      class aarch64_a64_i31_enc311 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+        uint8_t get_opc();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_f0();
+      };
+
+      class aarch64_a64_i12_enc120 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+        uint8_t get_op();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i12_enc121 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+      };
+
+      class aarch64_a64_i12_enc122 : public aarch64_decode_a64
+      {
+        uint8_t get_op();
+        uint8_t get_imm();
+        uint8_t get_size();
+        uint8_t get_Rd();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i15_enc150 : public aarch64_decode_a64
+      {
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_opc();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i17_enc170 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_f23();
+        uint8_t get_sf();
+        uint8_t get_f17();
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i17_enc171 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_sf();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_f6();
+      };
+
+      class aarch64_a64_i17_enc172 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_Rn();
+        uint8_t get_opc();
+        uint8_t get_f19();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_size();
+        uint8_t get_sf();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i18_enc180 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rd();
+        uint8_t get_f22();
+        uint8_t get_Rn();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_f4();
+      };
+
+      class aarch64_a64_i24_enc240 : public aarch64_decode_a64
+      {
+        uint8_t get_f26();
+        uint8_t get_imm();
+        uint8_t get_size();
+        uint8_t get_Rd();
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_op();
+      };
+
+      class aarch64_a64_i24_enc241 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_f16();
+        uint8_t get_op();
+        uint8_t get_imm();
+        uint8_t get_f7();
+        uint8_t get_sf();
+        uint8_t get_f5();
+        uint8_t get_Rd();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i24_enc242 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i36_enc360 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+        uint8_t get_imm();
+        uint8_t get_f1();
+      };
+
+      class aarch64_a64_i36_enc361 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_opc();
+        uint8_t get_op();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+      };
+
+      class aarch64_a64_i36_enc362 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+        uint8_t get_imm();
+        uint8_t get_f4();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i38_enc380 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_op();
+        uint8_t get_f17();
+        uint8_t get_size();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i38_enc381 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_sf();
+        uint8_t get_size();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i0_enc0 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_f19();
+        uint8_t get_op();
+        uint8_t get_opc();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i10_enc100 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_imm();
+        uint8_t get_f23();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_f0();
+      };
+
+      class aarch64_a64_i10_enc101 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_opc();
+        uint8_t get_Rm();
+        uint8_t get_size();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_f4();
+      };
+
+      class aarch64_a64_i10_enc102 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_size();
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i25_enc250 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_f22();
+        uint8_t get_imm();
+        uint8_t get_size();
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i26_enc260 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_Rn();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_f1();
+      };
+
+      class aarch64_a64_i26_enc261 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i26_enc262 : public aarch64_decode_a64
+      {
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_f10();
+        uint8_t get_imm();
+        uint8_t get_f5();
+        uint8_t get_f4();
+      };
+
+      class aarch64_a64_i8_enc80 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_imm();
+        uint8_t get_opc();
+        uint8_t get_f12();
+      };
+
+      class aarch64_a64_i8_enc81 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_op();
+        uint8_t get_size();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i8_enc82 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_f3();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i1_enc10 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_op();
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i1_enc11 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_f7();
+        uint8_t get_f3();
+        uint8_t get_f2();
+      };
+
+      class aarch64_a64_i1_enc12 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_sf();
+      };
+
+      class aarch64_a64_i11_enc110 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_Rd();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_size();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i11_enc111 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_opc();
+        uint8_t get_Rd();
+      };
+
+      class aarch64_a64_i11_enc112 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_f25();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_opc();
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_Rd();
+        uint8_t get_op();
+      };
+
+      class aarch64_a64_i14_enc140 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_op();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i23_enc230 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_f19();
+        uint8_t get_Rm();
+        uint8_t get_imm();
+        uint8_t get_opc();
+        uint8_t get_op();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i23_enc231 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_size();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_f11();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i23_enc232 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i3_enc30 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_opc();
+        uint8_t get_f17();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_f5();
+        uint8_t get_size();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i3_enc31 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_size();
+        uint8_t get_Rn();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_f0();
+      };
+
+      class aarch64_a64_i3_enc32 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_Rd();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_f4();
+      };
+
+      class aarch64_a64_i32_enc320 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_op();
+        uint8_t get_f22();
+        uint8_t get_f17();
+        uint8_t get_Rm();
+        uint8_t get_f9();
+        uint8_t get_Rd();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i32_enc321 : public aarch64_decode_a64
+      {
+        uint8_t get_f25();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+        uint8_t get_op();
+      };
+
+      class aarch64_a64_i35_enc350 : public aarch64_decode_a64
+      {
+        uint8_t get_f21();
+        uint8_t get_f19();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_Rm();
+        uint8_t get_sf();
+        uint8_t get_f3();
+        uint8_t get_imm();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i4_enc40 : public aarch64_decode_a64
+      {
+        uint8_t get_f25();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_sf();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i5_enc50 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_f22();
+        uint8_t get_f20();
+        uint8_t get_opc();
+        uint8_t get_Rm();
+        uint8_t get_op();
+      };
+
+      class aarch64_a64_i5_enc51 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_f23();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_imm();
+        uint8_t get_sf();
+      };
+
+      class aarch64_a64_i5_enc52 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_f23();
+        uint8_t get_f20();
+        uint8_t get_Rn();
+        uint8_t get_sf();
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i21_enc210 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_imm();
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i33_enc330 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i33_enc331 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_imm();
+        uint8_t get_Rn();
+        uint8_t get_sf();
+        uint8_t get_f8();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i33_enc332 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_f18();
+        uint8_t get_opc();
+        uint8_t get_f13();
+        uint8_t get_op();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i34_enc340 : public aarch64_decode_a64
+      {
+        uint8_t get_f26();
+        uint8_t get_op();
+        uint8_t get_imm();
+        uint8_t get_size();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i37_enc370 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_f20();
+        uint8_t get_f19();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i7_enc70 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_imm();
+        uint8_t get_opc();
+        uint8_t get_f8();
+        uint8_t get_Rm();
+        uint8_t get_op();
+      };
+
+      class aarch64_a64_i7_enc71 : public aarch64_decode_a64
+      {
+        uint8_t get_imm();
+        uint8_t get_sf();
+        uint8_t get_opc();
+        uint8_t get_size();
+        uint8_t get_Rd();
+        uint8_t get_Rm();
+        uint8_t get_op();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i7_enc72 : public aarch64_decode_a64
+      {
+        uint8_t get_op();
+        uint8_t get_Rd();
+        uint8_t get_Rm();
+        uint8_t get_size();
+        uint8_t get_opc();
+        uint8_t get_sf();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i13_enc130 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_opc();
+        uint8_t get_imm();
+        uint8_t get_Rm();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i13_enc131 : public aarch64_decode_a64
+      {
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+        uint8_t get_imm();
+      };
+
+      class aarch64_a64_i13_enc132 : public aarch64_decode_a64
+      {
+        uint8_t get_sf();
+        uint8_t get_Rn();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+        uint8_t get_size();
+      };
+
+      class aarch64_a64_i16_enc160 : public aarch64_decode_a64
+      {
+        uint8_t get_Rn();
+        uint8_t get_f18();
+        uint8_t get_Rd();
+        uint8_t get_f9();
+        uint8_t get_f8();
+        uint8_t get_opc();
+      };
+
+      class aarch64_a64_i30_enc300 : public aarch64_decode_a64
+      {
+        uint8_t get_opc();
+        uint8_t get_size();
+        uint8_t get_Rm();
+        uint8_t get_Rd();
+        uint8_t get_op();
+        uint8_t get_f7();
+        uint8_t get_sf();
+        uint8_t get_imm();
+        uint8_t get_Rn();
+      };
+
+      class aarch64_a64_i6_enc60 : public aarch64_decode_a64
+      {
+        uint8_t get_Rm();
+        uint8_t get_imm();
+        uint8_t get_opc();
+        uint8_t get_size();
+        uint8_t get_op();
+        uint8_t get_Rn();
+        uint8_t get_Rd();
+        uint8_t get_sf();
+      };
+
+      class aarch64_a64_i6_enc61 : public aarch64_decode_a64
+      {
+        uint8_t get_Rd();
+        uint8_t get_Rn();
+        uint8_t get_size();
+        uint8_t get_f20();
+        uint8_t get_sf();
+        uint8_t get_op();
+      };
+
+      class aarch64_unknown : public aarch64_decode_a64
+      {
+      };
+
+      inline const char *aarch64_decode::opcode_name(aarch64_opcodes opcode)
+      {
+        static const char *const names[] = {
+          "op_aarch64_a64_i2_enc20",
+          "op_aarch64_a64_i20_enc200",
+          "op_aarch64_a64_i22_enc220",
+          "op_aarch64_a64_i22_enc221",
+          "op_aarch64_a64_i22_enc222",
+          "op_aarch64_a64_i27_enc270",
+          "op_aarch64_a64_i27_enc271",
+          "op_aarch64_a64_i28_enc280",
+          "op_aarch64_a64_i28_enc281",
+          "op_aarch64_a64_i31_enc310",
+          "op_aarch64_a64_i31_enc311",
+          "op_aarch64_a64_i12_enc120",
+          "op_aarch64_a64_i12_enc121",
+          "op_aarch64_a64_i12_enc122",
+          "op_aarch64_a64_i15_enc150",
+          "op_aarch64_a64_i17_enc170",
+          "op_aarch64_a64_i17_enc171",
+          "op_aarch64_a64_i17_enc172",
+          "op_aarch64_a64_i18_enc180",
+          "op_aarch64_a64_i24_enc240",
+          "op_aarch64_a64_i24_enc241",
+          "op_aarch64_a64_i24_enc242",
+          "op_aarch64_a64_i36_enc360",
+          "op_aarch64_a64_i36_enc361",
+          "op_aarch64_a64_i36_enc362",
+          "op_aarch64_a64_i38_enc380",
+          "op_aarch64_a64_i38_enc381",
+          "op_aarch64_a64_i0_enc0",
+          "op_aarch64_a64_i10_enc100",
+          "op_aarch64_a64_i10_enc101",
+          "op_aarch64_a64_i10_enc102",
+          "op_aarch64_a64_i25_enc250",
+          "op_aarch64_a64_i26_enc260",
+          "op_aarch64_a64_i26_enc261",
+          "op_aarch64_a64_i26_enc262",
+          "op_aarch64_a64_i8_enc80",
+          "op_aarch64_a64_i8_enc81",
+          "op_aarch64_a64_i8_enc82",
+          "op_aarch64_a64_i1_enc10",
+          "op_aarch64_a64_i1_enc11",
+          "op_aarch64_a64_i1_enc12",
+          "op_aarch64_a64_i11_enc110",
+          "op_aarch64_a64_i11_enc111",
+          "op_aarch64_a64_i11_enc112",
+          "op_aarch64_a64_i14_enc140",
+          "op_aarch64_a64_i23_enc230",
+          "op_aarch64_a64_i23_enc231",
+          "op_aarch64_a64_i23_enc232",
+          "op_aarch64_a64_i3_enc30",
+          "op_aarch64_a64_i3_enc31",
+          "op_aarch64_a64_i3_enc32",
+          "op_aarch64_a64_i32_enc320",
+          "op_aarch64_a64_i32_enc321",
+          "op_aarch64_a64_i35_enc350",
+          "op_aarch64_a64_i4_enc40",
+          "op_aarch64_a64_i5_enc50",
+          "op_aarch64_a64_i5_enc51",
+          "op_aarch64_a64_i5_enc52",
+          "op_aarch64_a64_i21_enc210",
+          "op_aarch64_a64_i33_enc330",
+          "op_aarch64_a64_i33_enc331",
+          "op_aarch64_a64_i33_enc332",
+          "op_aarch64_a64_i34_enc340",
+          "op_aarch64_a64_i37_enc370",
+          "op_aarch64_a64_i7_enc70",
+          "op_aarch64_a64_i7_enc71",
+          "op_aarch64_a64_i7_enc72",
+          "op_aarch64_a64_i13_enc130",
+          "op_aarch64_a64_i13_enc131",
+          "op_aarch64_a64_i13_enc132",
+          "op_aarch64_a64_i16_enc160",
+          "op_aarch64_a64_i30_enc300",
+          "op_aarch64_a64_i6_enc60",
+          "op_aarch64_a64_i6_enc61",
+        };
+        return opcode == aarch64_unknown ? "aarch64_unknown" : names[opcode];
+      }
+    }
+  }
+}
\ No newline at end of file
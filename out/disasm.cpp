@@ -0,0 +1,316 @@
+#include <stdio.h>
+#include "arm64-decode.cpp"
+
+using namespace captive::arch::aarch64;
+
+int disasm(uint32_t ir) {
+
+  captive::arch::aarch64::aarch64_decode_a64 decoder;
+  decoder.isa_mode = aarch64_decode_a64::aarch64_a64;
+  uint64_t pc = 0x0000000000000000;
+  uint32_t* ptr = &ir;
+  bool is_valid = decoder.decode(0, pc, ptr);
+
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i2_enc20)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i20_enc200)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i22_enc220)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i22_enc221)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i22_enc222)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i27_enc270)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i27_enc271)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i28_enc280)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i28_enc281)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i31_enc310)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i31_enc311)
+  {
+    printf("add\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i12_enc120)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i12_enc121)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i12_enc122)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i15_enc150)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i17_enc170)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i17_enc171)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i17_enc172)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i18_enc180)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i24_enc240)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i24_enc241)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i24_enc242)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i36_enc360)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i36_enc361)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i36_enc362)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i38_enc380)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i38_enc381)
+  {
+    printf("b\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i0_enc0)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i10_enc100)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i10_enc101)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i10_enc102)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i25_enc250)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i26_enc260)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i26_enc261)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i26_enc262)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i8_enc80)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i8_enc81)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i8_enc82)
+  {
+    printf("ldr\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i1_enc10)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i1_enc11)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i1_enc12)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i11_enc110)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i11_enc111)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i11_enc112)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i14_enc140)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i23_enc230)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i23_enc231)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i23_enc232)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i3_enc30)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i3_enc31)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i3_enc32)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i32_enc320)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i32_enc321)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i35_enc350)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i4_enc40)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i5_enc50)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i5_enc51)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i5_enc52)
+  {
+    printf("mov\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i21_enc210)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i33_enc330)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i33_enc331)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i33_enc332)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i34_enc340)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i37_enc370)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i7_enc70)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i7_enc71)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i7_enc72)
+  {
+    printf("str\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i13_enc130)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i13_enc131)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i13_enc132)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i16_enc160)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i30_enc300)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i6_enc60)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::op_aarch64_a64_i6_enc61)
+  {
+    printf("sub\n");
+  }
+  if(decoder.opcode == aarch64_decode_a64::aarch64_unknown)
+  {
+    printf("unknown\n");
+  }
+
+  return 0;
+}
\ No newline at end of file
@@ -2,17 +2,45 @@
 # comparison. The Python binding for [Capstone](http://www.capstone-engine.org) must be installed.
 # The bulk of this script comes from the [Capstone docs](http://www.capstone-engine.org/lang_python.html)
 
+# The binary may be raw instructions, or an AArch64 ELF file, whose executable sections are disassembled at their
+# virtual addresses.
+
 from capstone import *
+import struct
 import sys
 
+ELF_HEADER = struct.Struct('<16sHHIQQQIHHHHHH')
+SECTION_HEADER = struct.Struct('<IIQQQQIIQQ')
+PROGRAM_HEADER = struct.Struct('<IIQQQQQQ')
+
+def code_regions(data):
+   """The executable sections of an ELF file, or its executable segments if it has no sections, as (address, code)"""
+   (_, _, _, _, _, phoff, shoff, _, _, phentsize, phnum, shentsize, shnum, _) = ELF_HEADER.unpack_from(data, 0)
+   if shnum != 0 and shentsize == SECTION_HEADER.size:
+      headers = [SECTION_HEADER.unpack_from(data, shoff + i * shentsize) for i in range(shnum)]
+      # NOTE: SHF_EXECINSTR, and not SHT_NOBITS
+      ranges = [(address, offset, size) for (_, section_type, flags, address, offset, size, _, _, _, _) in headers
+                if flags & 0x4 and section_type != 8]
+   else:
+      headers = [PROGRAM_HEADER.unpack_from(data, phoff + i * phentsize) for i in range(phnum)]
+      # NOTE: PT_LOAD, and PF_X
+      ranges = [(address, offset, size) for (segment_type, flags, offset, address, _, size, _, _) in headers
+                if segment_type == 1 and flags & 0x1]
+   for (address, offset, size) in ranges:
+      if offset + size > len(data):
+         raise ValueError("The code of the ELF file runs past its end")
+   return([(address, data[offset:offset + size]) for (address, offset, size) in ranges])
+
 if __name__ == "__main__":
    if(len(sys.argv) != 2):
       print("Just the path of binary file must be given.")
-      exit
+      exit(1)
 
    with open(sys.argv[1], mode='rb') as file:
       CODE = file.read()
 
    md = Cs(CS_ARCH_ARM64, CS_MODE_ARM)
-   for i in md.disasm(CODE, 0x1000):
-      print("0x%x:\t%s\t%s" %(i.address, i.mnemonic, i.op_str))
+   regions = code_regions(CODE) if CODE[:4] == b'\x7fELF' else [(0x1000, CODE)]
+   for address, code in regions:
+      for i in md.disasm(code, address):
+         print("0x%x:\t%s\t%s" %(i.address, i.mnemonic, i.op_str))
@@ -0,0 +1,254 @@
+# This is for measuring how changes to the generator affect the speed of the generated decoder, by timing each
+#  variant (NAME=DIR of generated files, or NAME:ARGS for main.py) over each corpus with src/disasm/bench.cpp e.g.
+#    python3 decoder_benchmark.py --variant "flat:--backend=flat" --variant "table:--backend=table" --corpus random
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+GENERATOR_DIR = os.path.join(ROOT, 'src', 'generate_decoder')
+OUT_DIR = os.path.join(ROOT, 'out')
+BENCH_SOURCE = os.path.join(ROOT, 'src', 'disasm', 'bench.cpp')
+# the most batches of words generated for the valid corpus, in case the reference decoder decodes few or none of them
+MAX_VALID_ATTEMPTS = 100
+
+def generate_variant(args, directory):
+    """Run main.py with the args, and copy the files it generates into the directory"""
+    # NOTE: main.py writes to ../../out from where it is run, so it is run in a temporary tree beside the repository's
+    # templates, spec, and cache, leaving the repository's out directory as it was
+    tree = tempfile.mkdtemp()
+    try:
+        os.makedirs(os.path.join(tree, 'src', 'generate_decoder'))
+        os.makedirs(os.path.join(tree, 'out'))
+        os.makedirs(os.path.join(ROOT, 'cache'), exist_ok=True)
+        for name in ['templates', 'spec', 'cache']:
+            os.symlink(os.path.join(ROOT, name), os.path.join(tree, name))
+        subprocess.run([sys.executable, os.path.join(GENERATOR_DIR, 'main.py')] + args.split(),
+                       cwd=os.path.join(tree, 'src', 'generate_decoder'), check=True, stdout=subprocess.DEVNULL)
+        shutil.copytree(os.path.join(tree, 'out'), directory, dirs_exist_ok=True)
+    finally:
+        shutil.rmtree(tree)
+
+def prepare_variant(variant, work_dir):
+    """The name and directory of generated files of a variant, NAME=DIR or NAME:ARGS, generating it into work_dir"""
+    # NOTE: whichever of = or : comes first separates the name, as main.py's args may contain either
+    if variant.find(':') == -1 or -1 < variant.find('=') < variant.find(':'):
+        (name, directory) = variant.split('=', 1)
+        return(name, os.path.abspath(directory))
+    (name, generator_args) = variant.split(':', 1)
+    directory = os.path.join(work_dir, name)
+    generate_variant(generator_args, directory)
+    return(name, directory)
+
+def build_variant(directory, executable, cxx, cxxflags):
+    subprocess.run([cxx] + cxxflags.split() + ['-I', directory, BENCH_SOURCE, '-o', executable], check=True)
+
+def write_random_corpus(path, words, seed):
+    generator = random.Random(seed)
+    with open(path, 'wb') as file:
+        file.write(b''.join([generator.getrandbits(32).to_bytes(4, 'little') for _ in range(words)]))
+
+def write_valid_corpus(path, words, seed):
+    """Words of randomly chosen encodings, with their unbound bits random, that the reference decoder decodes"""
+    import numpy as np
+    sys.path.insert(0, GENERATOR_DIR)
+    cwd = os.getcwd()
+    os.chdir(GENERATOR_DIR)
+    try:
+        from parser import parseAllFiles
+        from decoder import buildEncodingsSets
+        from reference_decoder import ReferenceDecoder
+        instructions = parseAllFiles()
+        reference = ReferenceDecoder(buildEncodingsSets(instructions), instructions)
+    finally:
+        os.chdir(cwd)
+    known_mask = np.array([enc.known_mask for enc in reference.encodings], dtype=np.uint32)
+    known_value = np.array([enc.known_value for enc in reference.encodings], dtype=np.uint32)
+    generator = np.random.default_rng(seed)
+    corpus = np.zeros(0, dtype=np.uint32)
+    for _ in range(MAX_VALID_ATTEMPTS):
+        chosen = generator.integers(0, len(known_mask), words)
+        candidates = (generator.integers(0, 1 << 32, words, dtype=np.uint32) & ~known_mask[chosen]) | known_value[chosen]
+        corpus = np.concatenate([corpus, candidates[reference.decode(candidates) >= 0]])
+        if len(corpus) >= words:
+            break
+    if len(corpus) < words:
+        raise RuntimeError("The reference decoder decoded only %d of the %d words generated for the valid corpus"
+                           % (len(corpus), MAX_VALID_ATTEMPTS * words))
+    corpus[:words].astype('<u4').tofile(path)
+
+def prepare_corpora(corpus_args, directory, words, seed):
+    """The path of each corpus by name, where random and valid corpora are generated into the directory"""
+    corpora = dict()
+    for corpus in corpus_args:
+        if '=' in corpus:
+            (name, path) = corpus.split('=', 1)
+            corpora[name] = os.path.abspath(path)
+        elif corpus == 'random':
+            corpora[corpus] = os.path.join(directory, 'random.bin')
+            write_random_corpus(corpora[corpus], words, seed)
+        elif corpus == 'valid':
+            corpora[corpus] = os.path.join(directory, 'valid.bin')
+            write_valid_corpus(corpora[corpus], words, seed)
+        else:
+            raise ValueError("A corpus is random, valid, or NAME=PATH of a binary file of instructions: " + corpus)
+    return(corpora)
+
+def describe_corpora(corpus_args, words, seed):
+    """How each corpus was made, by name: the path of a file, or how a generated corpus, which isn't kept, was made"""
+    descriptions = dict()
+    for corpus in corpus_args:
+        if '=' in corpus:
+            (name, path) = corpus.split('=', 1)
+            descriptions[name] = {'path': os.path.abspath(path)}
+        else:
+            descriptions[corpus] = {'generated': corpus, 'words': words, 'seed': seed}
+    return(descriptions)
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return(ordered[max(0, math.ceil(fraction * len(ordered)) - 1)])
+
+def run_benchmark(executable, corpus_path, iterations, warmup, as_block = False):
+    res = subprocess.run([executable, corpus_path, str(iterations), str(warmup)] + (['block'] if as_block else []),
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError(res.stdout + res.stderr)
+    times = []
+    result = dict()
+    for line in res.stdout.splitlines():
+        (key, value) = line.split()
+        if key == 'ns':
+            times.append(int(value))
+        else:
+            result[key] = int(value)
+    median = statistics.median(times)
+    result.update({
+        'times_ns': times,
+        'median_ns': median,
+        'p95_ns': percentile(times, 0.95),
+        'stddev_ns': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'ns_per_instruction': median / result['words'] if result['words'] > 0 else 0.0,
+    })
+    return(result)
+
+def compare(baseline, results, threshold):
+    """Compare each result with the baseline's for the same corpus, returning whether any regressed"""
+    regressed = False
+    print("%-12s %-12s %12s %12s %9s" % ("variant", "corpus", "base ns/ins", "ns/ins", "change"))
+    for result in results:
+        base = baseline.get(result['corpus'])
+        if base is None:
+            continue
+        if base['checksum'] != result['checksum']:
+            print("WARNING: %s decodes %s differently to the baseline" % (result['variant'], result['corpus']))
+        change = result['median_ns'] / base['median_ns'] - 1
+        is_regression = (change > threshold
+                         and result['median_ns'] - base['median_ns'] > max(base['stddev_ns'], result['stddev_ns']))
+        regressed |= is_regression
+        print("%-12s %-12s %12.3f %12.3f %+8.1f%%%s" % (result['variant'], result['corpus'],
+                                                       base['ns_per_instruction'], result['ns_per_instruction'],
+                                                       100 * change, "  REGRESSION" if is_regression else ""))
+    return(regressed)
+
+def print_results(results):
+    print("%-12s %-12s %10s %14s %14s %12s %10s" % ("variant", "corpus", "words", "median ns", "p95 ns",
+                                                   "stddev ns", "ns/ins"))
+    for result in results:
+        print("%-12s %-12s %10d %14d %14d %12.0f %10.3f" % (result['variant'], result['corpus'], result['words'],
+                                                            result['median_ns'], result['p95_ns'],
+                                                            result['stddev_ns'], result['ns_per_instruction']))
+
+def compare_saved(before_path, after_path, threshold):
+    with open(before_path, 'r') as file:
+        before = json.load(file)
+    with open(after_path, 'r') as file:
+        after = json.load(file)
+    regressed = False
+    for variant in sorted(set([result['variant'] for result in before['results']])):
+        baseline = dict([(result['corpus'], result) for result in before['results'] if result['variant'] == variant])
+        regressed |= compare(baseline, [result for result in after['results'] if result['variant'] == variant],
+                             threshold)
+    return(regressed)
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Benchmark variants of the generated decoder.')
+    arg_parser.add_argument('--variant', dest='variants', action='append', default=[],
+                            help='NAME=DIR of previously generated files, or NAME:ARGS to pass main.py to generate them.')
+    arg_parser.add_argument('--corpus', dest='corpora', action='append', default=[],
+                            help='random, valid, or NAME=PATH of a binary file of instructions (defaults to random).')
+    arg_parser.add_argument('--words', dest='words', action='store', type=int, default=1000000,
+                            help='The number of words in each generated corpus.')
+    arg_parser.add_argument('--seed', dest='seed', action='store', type=int, default=0,
+                            help='The seed for generating the corpora, so that runs are reproducible.')
+    arg_parser.add_argument('--iterations', dest='iterations', action='store', type=int, default=20,
+                            help='The number of timed runs over each corpus.')
+    arg_parser.add_argument('--warmup', dest='warmup', action='store', type=int, default=3,
+                            help='The number of untimed runs over each corpus before the timed runs.')
+    arg_parser.add_argument('--cxx', dest='cxx', action='store', default=os.environ.get('CXX', 'g++'),
+                            help='The compiler to build the variants with.')
+    arg_parser.add_argument('--cxxflags', dest='cxxflags', action='store', default='-O2',
+                            help='The flags to build the variants with.')
+    arg_parser.add_argument('--threshold', dest='threshold', action='store', type=float, default=0.05,
+                            help='The fraction by which a variant must be slower than the baseline to regress.')
+    arg_parser.add_argument('--decode-block', dest='decode_block', action='store_const', const=True, default=False,
+                            help='Decode each corpus with a single call to decode_block, rather than a call to decode per word.')
+    arg_parser.add_argument('--json', dest='json', action='store', default=None,
+                            help='Write the results to this JSON file.')
+    arg_parser.add_argument('--compare', dest='compare', action='store', nargs=2, default=None,
+                            metavar=('BEFORE', 'AFTER'), help='Compare two JSON files of results, rather than running.')
+    args = arg_parser.parse_args()
+
+    if args.compare is not None:
+        exit(1 if compare_saved(args.compare[0], args.compare[1], args.threshold) else 0)
+
+    if args.variants == []:
+        args.variants = ['out=' + OUT_DIR]
+    work_dir = tempfile.mkdtemp()
+    try:
+        corpora = prepare_corpora(args.corpora or ['random'], work_dir, args.words, args.seed)
+        executables = []
+        for variant in args.variants:
+            (name, directory) = prepare_variant(variant, work_dir)
+            executables.append((name, os.path.join(work_dir, 'bench_' + name)))
+            build_variant(directory, executables[-1][1], args.cxx, args.cxxflags)
+
+        results = []
+        for (name, executable) in executables:
+            for corpus, path in corpora.items():
+                result = run_benchmark(executable, path, args.iterations, args.warmup, args.decode_block)
+                result.update({'variant': name, 'corpus': corpus})
+                results.append(result)
+        print_results(results)
+
+        regressed = False
+        if len(executables) > 1:
+            print()
+            baseline = dict([(result['corpus'], result) for result in results if result['variant'] == executables[0][0]])
+            regressed = compare(baseline, [result for result in results if result['variant'] != executables[0][0]],
+                                args.threshold)
+
+        if args.json is not None:
+            with open(args.json, 'w') as file:
+                json.dump({
+                    'cxx': args.cxx,
+                    'cxxflags': args.cxxflags,
+                    'iterations': args.iterations,
+                    'warmup': args.warmup,
+                    'decode_block': args.decode_block,
+                    'seed': args.seed,
+                    'corpora': describe_corpora(args.corpora or ['random'], args.words, args.seed),
+                    'results': results,
+                }, file, indent=2)
+            print("Written to", args.json)
+    finally:
+        shutil.rmtree(work_dir)
+    exit(1 if regressed else 0)
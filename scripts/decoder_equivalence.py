@@ -0,0 +1,96 @@
+# This is for checking that a change to the generator doesn't change how the generated decoder decodes any word,
+#  by comparing two variants, given as for decoder_benchmark.py, over every word with src/disasm/equivalence.cpp e.g.
+#    python3 decoder_equivalence.py --variant "flat:--backend=flat" --variant "tree:--backend=tree" --sample 100000000
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from decoder_benchmark import ROOT, prepare_variant
+
+EQUIVALENCE_SOURCE = os.path.join(ROOT, 'src', 'disasm', 'equivalence.cpp')
+VARIANT_SOURCE = os.path.join(ROOT, 'src', 'disasm', 'equivalence_variant.cpp')
+
+def build_checker(directories, executable, cxx, cxxflags):
+    """Build the checker of the two directories of generated files"""
+    objects = []
+    for (namespace, directory) in zip(['captive_a', 'captive_b'], directories):
+        objects.append(executable + '_' + namespace + '.o')
+        subprocess.run([cxx] + cxxflags.split() + ['-I', directory, '-Dcaptive=' + namespace, '-c', VARIANT_SOURCE,
+                                                   '-o', objects[-1]], check=True)
+    subprocess.run([cxx] + cxxflags.split() + ['-pthread', EQUIVALENCE_SOURCE] + objects + ['-o', executable],
+                   check=True)
+
+def run_checker(executable, threads, sample, seed, examples):
+    command = [executable, '-s', str(sample), '-r', str(seed), '-e', str(examples)]
+    if threads is not None:
+        command += ['-t', str(threads)]
+    res = subprocess.run(command, capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError(res.stdout + res.stderr)
+    result = {'differences': []}
+    for line in res.stdout.splitlines():
+        fields = line.split()
+        if fields[0] == 'diff':
+            result['differences'].append({'opcodes': fields[1:3], 'words': int(fields[3]), 'examples': fields[4:]})
+        else:
+            result[fields[0]] = int(fields[1])
+    result['differences'].sort(key=lambda difference: (-difference['words'], difference['opcodes']))
+    return(result)
+
+def print_result(names, result, top = 20):
+    print("%d words compared in %.1fs, %d decoded differently" % (result['words'], result['ns'] / 1e9,
+                                                                   result['differing']))
+    if result['differences'] != []:
+        print("%-50s %-50s %12s  %s" % (names[0], names[1], "words", "examples"))
+    for difference in result['differences'][:top]:
+        print("%-50s %-50s %12d  %s" % (difference['opcodes'][0], difference['opcodes'][1], difference['words'],
+                                        " ".join(difference['examples'])))
+    if len(result['differences']) > top:
+        print("... and %d more pairs of opcodes" % (len(result['differences']) - top))
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Check that two variants of the generated decoder decode every word the same.')
+    arg_parser.add_argument('--variant', dest='variants', action='append', default=[],
+                            help='NAME=DIR of previously generated files, or NAME:ARGS to pass main.py to generate them. '
+                                 'Given twice; if given once, the variant is compared with the out directory.')
+    arg_parser.add_argument('--sample', dest='sample', action='store', type=int, default=0,
+                            help='The number of random words to compare, rather than all 2^32 of them.')
+    arg_parser.add_argument('--seed', dest='seed', action='store', type=int, default=0,
+                            help='The seed for sampling the words, so that runs are reproducible.')
+    arg_parser.add_argument('--threads', dest='threads', action='store', type=int, default=None,
+                            help='The number of threads to compare the words on (defaults to one per core).')
+    arg_parser.add_argument('--examples', dest='examples', action='store', type=int, default=8,
+                            help='The number of words to list for each pair of opcodes that the variants differ on.')
+    arg_parser.add_argument('--top', dest='top', action='store', type=int, default=20,
+                            help='The number of pairs of opcodes to list.')
+    arg_parser.add_argument('--cxx', dest='cxx', action='store', default=os.environ.get('CXX', 'g++'),
+                            help='The compiler to build the variants with.')
+    arg_parser.add_argument('--cxxflags', dest='cxxflags', action='store', default='-O2',
+                            help='The flags to build the variants with.')
+    arg_parser.add_argument('--json', dest='json', action='store', default=None,
+                            help='Write the result, with every pair of opcodes, to this JSON file.')
+    args = arg_parser.parse_args()
+
+    if len(args.variants) == 1:
+        args.variants = ['out=' + os.path.join(ROOT, 'out')] + args.variants
+    if len(args.variants) != 2:
+        arg_parser.error("Compare two variants")
+    work_dir = tempfile.mkdtemp()
+    try:
+        (names, directories) = zip(*[prepare_variant(variant, work_dir) for variant in args.variants])
+        executable = os.path.join(work_dir, 'equivalence')
+        build_checker(directories, executable, args.cxx, args.cxxflags)
+        result = run_checker(executable, args.threads, args.sample, args.seed, args.examples)
+        print_result(names, result, args.top)
+
+        if args.json is not None:
+            with open(args.json, 'w') as file:
+                json.dump(dict(result, variants=dict(zip(names, directories)), sample=args.sample, seed=args.seed),
+                          file, indent=2)
+            print("Written to", args.json)
+    finally:
+        shutil.rmtree(work_dir)
+    exit(1 if result['differing'] != 0 else 0)
@@ -0,0 +1,88 @@
+// Times the generated decoder over a file of instruction words, for scripts/decoder_benchmark.py. The decoder is
+// included from the include path, so that each variant of it can be built from the directory it was generated in
+// e.g. g++ -O2 -I../../out bench.cpp -o bench
+#include <chrono>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <vector>
+#include "arm64-decode.cpp"
+#include "input.h"
+
+using namespace captive::arch::aarch64;
+
+// returns the sum of the decoded opcodes, so that the decoding can't be optimised away, and so that variants of
+// the decoder can be checked to decode the same words in the same way
+static uint64_t decode_all(const std::vector<code_region> &regions) {
+  aarch64_decode_a64 decoder;
+  decoder.isa_mode = aarch64_decode_a64::aarch64_a64;
+  uint64_t checksum = 0;
+  for(const code_region &region : regions) {
+    for(size_t i = 0; i < region.count; i++) {
+      decoder.decode(0, region.address + i * 4, &region.words[i]);
+      checksum += (uint64_t)(int64_t)decoder.opcode;
+    }
+  }
+  return checksum;
+}
+
+// as decode_all, but decoding each region with a single call to decode_block
+static uint64_t decode_all_as_block(const std::vector<code_region> &regions, std::vector<aarch64_decode::decode_result> &results) {
+  aarch64_decode_a64 decoder;
+  decoder.isa_mode = aarch64_decode_a64::aarch64_a64;
+  uint64_t checksum = 0;
+  for(const code_region &region : regions) {
+    decoder.decode_block(region.address, region.words, region.count, results.data());
+    for(size_t i = 0; i < region.count; i++) {
+      checksum += (uint64_t)(int64_t)results[i].opcode;
+    }
+  }
+  return checksum;
+}
+
+int main(int argc, char *argv[]) {
+
+  if(argc != 4 && !(argc == 5 && strcmp(argv[4], "block") == 0)) {
+    printf("Usage: bench <binary instructions> <iterations> <warm-up iterations> [block]\n");
+    return 1;
+  }
+
+  instruction_input input;
+  if(!input.open(argv[1], true)) {
+    printf("Couldn't read %s\n", argv[1]);
+    return 1;
+  }
+  int iterations = atoi(argv[2]);
+  int warmup = atoi(argv[3]);
+  bool as_block = argc == 5;
+  size_t largest = 0;
+  for(const code_region &region : input.regions()) {
+    largest = region.count > largest ? region.count : largest;
+  }
+  std::vector<aarch64_decode::decode_result> results(as_block ? largest : 0);
+
+  uint64_t checksum = 0;
+  for(int i = 0; i < warmup; i++) {
+    checksum = as_block ? decode_all_as_block(input.regions(), results) : decode_all(input.regions());
+  }
+  printf("words %zu\n", input.count());
+  for(int i = 0; i < iterations; i++) {
+    auto begin = std::chrono::steady_clock::now();
+    checksum = as_block ? decode_all_as_block(input.regions(), results) : decode_all(input.regions());
+    auto end = std::chrono::steady_clock::now();
+    printf("ns %lld\n", (long long)std::chrono::duration_cast<std::chrono::nanoseconds>(end - begin).count());
+  }
+  printf("checksum %llu\n", (unsigned long long)checksum);
+#if defined(AARCH64_DECODE_CACHE) && defined(AARCH64_DECODE_CACHE_STATS)
+  uint64_t hits, misses;
+  aarch64_decode::get_decode_cache_stats(hits, misses);
+  printf("cache_hits %llu\ncache_misses %llu\n", (unsigned long long)hits, (unsigned long long)misses);
+#endif
+#if defined(AARCH64_DECODE_INSTRUMENTED) && defined(AARCH64_DECODE_COUNTERS)
+  // NOTE: to stderr, so that the output is unchanged, as a profile that can be given to --decode-profile
+  aarch64_decode::dump_decode_counters(stderr);
+#endif
+
+  return 0;
+}
@@ -0,0 +1,20 @@
+// Decodes words a batch at a time with decode_block, for the tools that handle the result of every word, without
+// holding the results of all of them
+#pragma once
+#include <stddef.h>
+#include <stdint.h>
+
+// the number of words decoded by each call to decode_block
+#define RESULTS_BATCH 4096
+
+// decodes count words from words, the first at address, calling handle(i, results, batch) with the results of each
+// batch of words from words[i]
+template <typename Decoder, typename Handler>
+static void decode_batches(Decoder &decoder, uint64_t address, const uint32_t *words, size_t count, Handler handle) {
+  typename Decoder::decode_result results[RESULTS_BATCH];
+  for(size_t i = 0; i < count; i += RESULTS_BATCH) {
+    size_t batch = count - i < RESULTS_BATCH ? count - i : RESULTS_BATCH;
+    decoder.decode_block(address + i * 4, &words[i], batch, results);
+    handle(i, (const typename Decoder::decode_result *)results, batch);
+  }
+}
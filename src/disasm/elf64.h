@@ -0,0 +1,121 @@
+// The parts of the ELF format needed to find the code in an AArch64 executable, defined here rather than taken from
+// <elf.h>, as not every platform has it. Only little-endian, 64-bit files are read, as A64 code is little-endian.
+#pragma once
+#include <stdint.h>
+#include <string>
+#include <vector>
+
+#define ELF64_CLASS_64 2
+#define ELF64_DATA_LSB 1
+#define ELF64_MACHINE_AARCH64 183
+#define ELF64_SECTION_NOBITS 8
+#define ELF64_SECTION_FLAG_EXECINSTR 0x4
+#define ELF64_SEGMENT_LOAD 1
+#define ELF64_SEGMENT_FLAG_X 0x1
+
+struct elf64_header {
+  unsigned char ident[16];
+  uint16_t type;
+  uint16_t machine;
+  uint32_t version;
+  uint64_t entry;
+  uint64_t phoff;
+  uint64_t shoff;
+  uint32_t flags;
+  uint16_t ehsize;
+  uint16_t phentsize;
+  uint16_t phnum;
+  uint16_t shentsize;
+  uint16_t shnum;
+  uint16_t shstrndx;
+};
+
+struct elf64_section_header {
+  uint32_t name;
+  uint32_t type;
+  uint64_t flags;
+  uint64_t addr;
+  uint64_t offset;
+  uint64_t size;
+  uint32_t link;
+  uint32_t info;
+  uint64_t addralign;
+  uint64_t entsize;
+};
+
+struct elf64_program_header {
+  uint32_t type;
+  uint32_t flags;
+  uint64_t offset;
+  uint64_t vaddr;
+  uint64_t paddr;
+  uint64_t filesz;
+  uint64_t memsz;
+  uint64_t align;
+};
+
+// a range of the file that holds code, and the virtual address that it is loaded at
+struct elf64_code {
+  std::string name;
+  uint64_t address;
+  uint64_t offset;
+  uint64_t size;
+};
+
+inline bool is_elf64(const unsigned char *ident) {
+  return ident[0] == 0x7f && ident[1] == 'E' && ident[2] == 'L' && ident[3] == 'F'
+         && ident[4] == ELF64_CLASS_64 && ident[5] == ELF64_DATA_LSB;
+}
+
+// whether size bytes from offset lie within a file of file_size bytes, written so that a crafted offset or size can't
+// overflow
+inline bool elf64_in_file(uint64_t offset, uint64_t size, uint64_t file_size) {
+  return size <= file_size && offset <= file_size - size;
+}
+
+// Finds the executable sections of an AArch64 ELF file, or its executable segments if it has no section headers,
+// where read(offset, size, dest) reads part of the file of file_size bytes, returning whether it could. Returns false
+// if the file isn't an AArch64 ELF file, or is truncated.
+template <typename Reader>
+bool elf64_code_ranges(Reader read, uint64_t file_size, std::vector<elf64_code> &code) {
+  elf64_header header;
+  if(!read(0, sizeof(header), &header) || !is_elf64(header.ident) || header.machine != ELF64_MACHINE_AARCH64) {
+    return false;
+  }
+
+  if(header.shnum != 0 && header.shentsize == sizeof(elf64_section_header)) {
+    std::vector<elf64_section_header> sections(header.shnum);
+    if(!read(header.shoff, header.shnum * sizeof(elf64_section_header), sections.data())) {
+      return false;
+    }
+    std::vector<char> names;
+    if(header.shstrndx < header.shnum
+       && elf64_in_file(sections[header.shstrndx].offset, sections[header.shstrndx].size, file_size)) {
+      names.resize(sections[header.shstrndx].size + 1, '\0');
+      if(!read(sections[header.shstrndx].offset, sections[header.shstrndx].size, names.data())) {
+        names.clear();
+      }
+    }
+    for(const elf64_section_header &section : sections) {
+      if((section.flags & ELF64_SECTION_FLAG_EXECINSTR) && section.type != ELF64_SECTION_NOBITS && section.size != 0) {
+        std::string name = section.name < names.size() ? std::string(&names[section.name]) : std::string();
+        code.push_back({name, section.addr, section.offset, section.size});
+      }
+    }
+    return true;
+  }
+
+  if(header.phentsize != sizeof(elf64_program_header)) {
+    return false;
+  }
+  std::vector<elf64_program_header> segments(header.phnum);
+  if(!read(header.phoff, header.phnum * sizeof(elf64_program_header), segments.data())) {
+    return false;
+  }
+  for(const elf64_program_header &segment : segments) {
+    if(segment.type == ELF64_SEGMENT_LOAD && (segment.flags & ELF64_SEGMENT_FLAG_X) && segment.filesz != 0) {
+      code.push_back({"", segment.vaddr, segment.offset, segment.filesz});
+    }
+  }
+  return true;
+}
@@ -0,0 +1,179 @@
+// Checks that two generated decoders, built from equivalence_variant.cpp, decode every word to the same opcode name,
+// for scripts/decoder_equivalence.py
+// e.g. g++ -O2 -pthread equivalence.cpp variant_a.o variant_b.o -o equivalence && ./equivalence -t 32
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <map>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string>
+#include <thread>
+#include <unistd.h>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace captive_a { namespace equivalence {
+  void decode_words(const uint32_t *words, size_t count, int32_t *opcodes);
+  const char *opcode_name(int32_t opcode);
+} }
+
+namespace captive_b { namespace equivalence {
+  void decode_words(const uint32_t *words, size_t count, int32_t *opcodes);
+  const char *opcode_name(int32_t opcode);
+} }
+
+// the words compared by each task that a thread takes, which are consecutive unless sampling
+#define CHUNK_WORDS (1024 * 1024)
+#define WORD_SPACE (1ULL << 32)
+
+// The words of a pair of opcodes that the variants differ on
+struct difference {
+  uint64_t count;
+  std::vector<uint32_t> examples;
+};
+
+typedef std::map<std::pair<std::string, std::string>, difference> differences;
+
+// Whether an opcode of variant a has the same name as one of variant b, caching the b opcodes that have been matched,
+// as each variant's opcodes are only known by name as they are decoded
+class opcode_matcher {
+public:
+  bool same(int32_t a, int32_t b) {
+    size_t index = (size_t)(b + 1);
+    if(index < a_of_b.size() && a_of_b[index] != UNMATCHED) {
+      return a_of_b[index] == a;
+    }
+    a_by_name.emplace(captive_a::equivalence::opcode_name(a), a);
+    auto found = a_by_name.find(captive_b::equivalence::opcode_name(b));
+    if(found == a_by_name.end()) {
+      // NOTE: left unmatched, as variant a may yet decode a word to the same name
+      return false;
+    }
+    if(index >= a_of_b.size()) {
+      a_of_b.resize(index + 1, UNMATCHED);
+    }
+    a_of_b[index] = found->second;
+    return found->second == a;
+  }
+
+private:
+  enum { UNMATCHED = -2 };
+  std::unordered_map<std::string, int32_t> a_by_name;
+  std::vector<int32_t> a_of_b;
+};
+
+// the words of a chunk to compare: every word of the chunk, or when sampling, count words from a generator seeded
+// by the chunk, so that the words don't depend on which thread compares them
+static size_t chunk_words(uint64_t chunk, uint64_t samples, uint64_t seed, uint32_t *words) {
+  if(samples == 0) {
+    for(size_t i = 0; i < CHUNK_WORDS; i++) {
+      words[i] = (uint32_t)(chunk * CHUNK_WORDS + i);
+    }
+    return CHUNK_WORDS;
+  }
+  size_t count = std::min<uint64_t>(CHUNK_WORDS, samples - chunk * CHUNK_WORDS);
+  uint64_t state = seed ^ (chunk * 0x9e3779b97f4a7c15ULL);
+  for(size_t i = 0; i < count; i++) {
+    // splitmix64
+    uint64_t z = (state += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    words[i] = (uint32_t)((z ^ (z >> 31)) >> 32);
+  }
+  return count;
+}
+
+static void compare_chunks(std::atomic<uint64_t> *next_chunk, uint64_t chunks, uint64_t samples, uint64_t seed,
+                           size_t max_examples, differences *found) {
+  std::vector<uint32_t> words(CHUNK_WORDS);
+  std::vector<int32_t> opcodes_a(CHUNK_WORDS);
+  std::vector<int32_t> opcodes_b(CHUNK_WORDS);
+  opcode_matcher matcher;
+  for(uint64_t chunk = (*next_chunk)++; chunk < chunks; chunk = (*next_chunk)++) {
+    size_t count = chunk_words(chunk, samples, seed, words.data());
+    captive_a::equivalence::decode_words(words.data(), count, opcodes_a.data());
+    captive_b::equivalence::decode_words(words.data(), count, opcodes_b.data());
+    for(size_t i = 0; i < count; i++) {
+      if(matcher.same(opcodes_a[i], opcodes_b[i])) {
+        continue;
+      }
+      difference &entry = (*found)[std::make_pair(std::string(captive_a::equivalence::opcode_name(opcodes_a[i])),
+                                                  std::string(captive_b::equivalence::opcode_name(opcodes_b[i])))];
+      entry.count++;
+      if(entry.examples.size() < max_examples) {
+        entry.examples.push_back(words[i]);
+      }
+    }
+  }
+}
+
+int main(int argc, char *argv[]) {
+  unsigned threads = std::thread::hardware_concurrency();
+  uint64_t samples = 0;
+  uint64_t seed = 0;
+  size_t max_examples = 8;
+  int opt;
+  while((opt = getopt(argc, argv, "t:s:r:e:")) != -1) {
+    if(opt == 't') {
+      threads = atoi(optarg);
+    } else if(opt == 's') {
+      samples = strtoull(optarg, NULL, 0);
+    } else if(opt == 'r') {
+      seed = strtoull(optarg, NULL, 0);
+    } else if(opt == 'e') {
+      max_examples = atoi(optarg);
+    } else {
+      optind = argc;
+    }
+  }
+  if(optind != argc || threads == 0) {
+    printf("Usage: equivalence [-t threads] [-s sampled words] [-r seed] [-e examples per pair]\n");
+    return 1;
+  }
+
+  uint64_t words = samples == 0 ? WORD_SPACE : samples;
+  uint64_t chunks = (words + CHUNK_WORDS - 1) / CHUNK_WORDS;
+  std::atomic<uint64_t> next_chunk(0);
+  std::vector<differences> found(threads);
+
+  // NOTE: wall-clock time, as clock() would sum the time of all of the threads
+  auto begin = std::chrono::steady_clock::now();
+  std::vector<std::thread> workers;
+  for(unsigned t = 0; t < threads; t++) {
+    workers.emplace_back(compare_chunks, &next_chunk, chunks, samples, seed, max_examples, &found[t]);
+  }
+  for(std::thread &worker : workers) {
+    worker.join();
+  }
+  auto end = std::chrono::steady_clock::now();
+
+  // NOTE: each thread compares its chunks in order, so the examples of a pair in an exhaustive run are its lowest
+  // words, however many threads there are
+  differences merged;
+  for(const differences &thread_found : found) {
+    for(const auto &item : thread_found) {
+      difference &entry = merged[item.first];
+      entry.count += item.second.count;
+      entry.examples.insert(entry.examples.end(), item.second.examples.begin(), item.second.examples.end());
+    }
+  }
+  uint64_t differing = 0;
+  for(auto &item : merged) {
+    difference &entry = item.second;
+    std::sort(entry.examples.begin(), entry.examples.end());
+    entry.examples.resize(std::min(entry.examples.size(), max_examples));
+    differing += entry.count;
+    printf("diff %s %s %llu", item.first.first.c_str(), item.first.second.c_str(), (unsigned long long)entry.count);
+    for(uint32_t word : entry.examples) {
+      printf(" %08x", word);
+    }
+    printf("\n");
+  }
+  printf("words %llu\n", (unsigned long long)words);
+  printf("differing %llu\n", (unsigned long long)differing);
+  printf("ns %lld\n", (long long)std::chrono::duration_cast<std::chrono::nanoseconds>(end - begin).count());
+  return 0;
+}
@@ -0,0 +1,30 @@
+// One of the two decoders compared by equivalence.cpp, built once for each with the generated files of that variant
+// on the include path, and with the captive namespace renamed, so that both decoders can be linked into one program
+// e.g. g++ -O2 -I../../out -Dcaptive=captive_a -c equivalence_variant.cpp -o variant_a.o
+#include <stdint.h>
+#include "arm64-decode.cpp"
+#include "decode_batches.h"
+
+namespace captive
+{
+  namespace equivalence
+  {
+    // decodes count words into opcodes, each an aarch64_opcodes of this variant
+    void decode_words(const uint32_t *words, size_t count, int32_t *opcodes)
+    {
+      arch::aarch64::aarch64_decode_a64 decoder;
+      decoder.isa_mode = arch::aarch64::aarch64_decode::aarch64_a64;
+      decode_batches(decoder, 0, words, count,
+                     [opcodes](size_t i, const arch::aarch64::aarch64_decode::decode_result *results, size_t batch) {
+        for(size_t j = 0; j < batch; j++) {
+          opcodes[i + j] = results[j].opcode;
+        }
+      });
+    }
+
+    const char *opcode_name(int32_t opcode)
+    {
+      return arch::aarch64::aarch64_decode::opcode_name((arch::aarch64::aarch64_decode::aarch64_opcodes)opcode);
+    }
+  }
+}
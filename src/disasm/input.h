@@ -0,0 +1,156 @@
+// The instruction words of a binary file, either raw instructions at address 0, or the executable sections of an
+// AArch64 ELF file, memory-mapped where possible so that they are decoded in place
+#pragma once
+#include <fcntl.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#include <string>
+#include <vector>
+#include "elf64.h"
+
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ != __ORDER_LITTLE_ENDIAN__
+#error "A64 instructions are little-endian, and are decoded in place, so the host must be little-endian too"
+#endif
+
+#define INPUT_READ_BLOCK_SIZE (16 * 1024 * 1024)
+
+struct code_region {
+  std::string name;
+  uint64_t address;
+  const uint32_t *words;
+  size_t count;
+};
+
+class instruction_input {
+public:
+  ~instruction_input() {
+    unmap();
+  }
+
+  // populate reads all of a mapped file in when it is opened, rather than as its pages are first decoded
+  bool open(const char *path, bool populate = false) {
+    int fd = ::open(path, O_RDONLY);
+    if(fd == -1) {
+      return false;
+    }
+    struct stat st;
+    bool opened = fstat(fd, &st) == 0 && S_ISREG(st.st_mode) && map_all(fd, st.st_size, populate);
+    if(!opened) {
+      unmap();
+      opened = read_all(fd);
+    }
+    ::close(fd);
+    return opened;
+  }
+
+  const std::vector<code_region> &regions() const {
+    return code_regions;
+  }
+
+  // the number of words in all of the regions
+  size_t count() const {
+    size_t total = 0;
+    for(const code_region &region : code_regions) {
+      total += region.count;
+    }
+    return total;
+  }
+
+private:
+  bool map_all(int fd, size_t size, bool populate) {
+    unsigned char ident[16];
+    if(size < sizeof(elf64_header) || pread(fd, ident, sizeof(ident), 0) != sizeof(ident) || !is_elf64(ident)) {
+      return size < 4 || map(fd, "", 0, 0, size, populate);
+    }
+    std::vector<elf64_code> code;
+    auto read = [fd](uint64_t offset, size_t bytes, void *dest) { return pread(fd, dest, bytes, offset) == (ssize_t)bytes; };
+    if(!elf64_code_ranges(read, size, code)) {
+      return false;
+    }
+    for(const elf64_code &range : code) {
+      if(!in_file(range, size) || !map(fd, range.name, range.address, range.offset, range.size, populate)) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  // whether the range lies within the file, and starts on a word boundary, so that its words can be read in place
+  static bool in_file(const elf64_code &range, size_t size) {
+    return elf64_in_file(range.offset, range.size, size) && range.offset % 4 == 0;
+  }
+
+  bool map(int fd, const std::string &name, uint64_t address, uint64_t offset, size_t size, bool populate) {
+    // NOTE: mappings must start on a page boundary, so the start of the page is mapped too
+    uint64_t page_offset = offset % sysconf(_SC_PAGESIZE);
+    int flags = MAP_PRIVATE;
+#ifdef MAP_POPULATE
+    if(populate) {
+      flags |= MAP_POPULATE;
+    }
+#endif
+    void *mapping = mmap(NULL, size + page_offset, PROT_READ, flags, fd, offset - page_offset);
+    if(mapping == MAP_FAILED) {
+      return false;
+    }
+    madvise(mapping, size + page_offset, MADV_SEQUENTIAL);
+    mappings.push_back({mapping, size + page_offset});
+    code_regions.push_back({name, address, (const uint32_t *)((const char *)mapping + page_offset), size / 4});
+    return true;
+  }
+
+  void unmap() {
+    for(auto &mapping : mappings) {
+      munmap(mapping.first, mapping.second);
+    }
+    mappings.clear();
+    code_regions.clear();
+  }
+
+  bool read_all(int fd) {
+    size_t bytes = 0;
+    while(true) {
+      // NOTE: the buffer is of words, so that they are aligned, but is filled as bytes
+      buffer.resize((bytes + INPUT_READ_BLOCK_SIZE) / 4 + 1);
+      ssize_t count = ::read(fd, (char *)buffer.data() + bytes, INPUT_READ_BLOCK_SIZE);
+      if(count < 0) {
+        return false;
+      }
+      if(count == 0) {
+        break;
+      }
+      bytes += count;
+    }
+    const char *data = (const char *)buffer.data();
+    if(bytes < sizeof(elf64_header) || !is_elf64((const unsigned char *)data)) {
+      code_regions.push_back({"", 0, buffer.data(), bytes / 4});
+      return true;
+    }
+    std::vector<elf64_code> code;
+    auto read = [data, bytes](uint64_t offset, size_t size, void *dest) {
+      if(!elf64_in_file(offset, size, bytes)) {
+        return false;
+      }
+      memcpy(dest, data + offset, size);
+      return true;
+    };
+    if(!elf64_code_ranges(read, bytes, code)) {
+      return false;
+    }
+    for(const elf64_code &range : code) {
+      if(!in_file(range, bytes)) {
+        return false;
+      }
+      code_regions.push_back({range.name, range.address, (const uint32_t *)(data + range.offset), range.size / 4});
+    }
+    return true;
+  }
+
+  std::vector<std::pair<void *, size_t>> mappings;
+  std::vector<uint32_t> buffer;
+  std::vector<code_region> code_regions;
+};
@@ -0,0 +1,121 @@
+// Disassembles a binary file of A64 instructions on many threads, writing the disassembly in address order
+// e.g. g++ -O2 -pthread parallel.cpp -o parallel && ./parallel -t 32 -o vmlinux.txt vmlinux.bin
+#include <chrono>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string>
+#include <thread>
+#include <unistd.h>
+#include <vector>
+#include "../../out/arm64-decode.cpp"
+#include "decode_batches.h"
+#include "input.h"
+
+using namespace captive::arch::aarch64;
+
+// the number of words in each chunk that a thread formats the output of, so that a round of output fits in memory
+#define OUTPUT_CHUNK_WORDS (1024 * 1024)
+
+// decodes count words of the region from first, appending their disassembly to output if it isn't NULL, and
+// returning the number of words that are unknown
+static size_t decode_chunk(const code_region &region, size_t first, size_t count, std::string *output) {
+  const uint32_t *words = region.words;
+  aarch64_decode_a64 decoder;
+  decoder.isa_mode = aarch64_decode_a64::aarch64_a64;
+  char line[128];
+  size_t unknown = 0;
+  decode_batches(decoder, region.address + first * 4, &words[first], count,
+                 [&](size_t i, const aarch64_decode::decode_result *results, size_t batch) {
+    for(size_t j = 0; j < batch; j++) {
+      aarch64_decode::aarch64_opcodes opcode = (aarch64_decode::aarch64_opcodes)results[j].opcode;
+      unknown += opcode == aarch64_decode::aarch64_unknown;
+      if(output != NULL) {
+        int length = snprintf(line, sizeof(line), "%08llx: %08x %s\n",
+                              (unsigned long long)(region.address + (first + i + j) * 4), words[first + i + j],
+                              aarch64_decode::opcode_name(opcode));
+        output->append(line, length);
+      }
+    }
+  });
+  return unknown;
+}
+
+int main(int argc, char *argv[]) {
+
+  unsigned threads = std::thread::hardware_concurrency();
+  const char *output_path = NULL;
+  int opt;
+  while((opt = getopt(argc, argv, "t:o:")) != -1) {
+    if(opt == 't') {
+      threads = atoi(optarg);
+    } else if(opt == 'o') {
+      output_path = optarg;
+    } else {
+      optind = argc;
+    }
+  }
+  if(optind != argc - 1 || threads == 0) {
+    printf("Usage: parallel [-t threads] [-o output] <binary instructions>\n");
+    return 1;
+  }
+
+  instruction_input input;
+  if(!input.open(argv[optind], true)) {
+    printf("Couldn't read %s\n", argv[optind]);
+    return 1;
+  }
+  FILE *output = NULL;
+  if(output_path != NULL && (output = fopen(output_path, "w")) == NULL) {
+    printf("Couldn't write %s\n", output_path);
+    return 1;
+  }
+  std::vector<size_t> unknown(threads, 0);
+
+  // NOTE: wall-clock time, as clock() would sum the time of all of the threads
+  auto begin = std::chrono::steady_clock::now();
+
+  for(const code_region &region : input.regions()) {
+    size_t count = region.count;
+    if(output == NULL) {
+      // each thread decodes an equal share of the words
+      std::vector<std::thread> workers;
+      for(unsigned t = 0; t < threads; t++) {
+        size_t first = count * t / threads;
+        size_t last = count * (t + 1) / threads;
+        workers.emplace_back([&, t, first, last]() { unknown[t] += decode_chunk(region, first, last - first, NULL); });
+      }
+      for(auto &worker : workers) {
+        worker.join();
+      }
+    } else {
+      // each round, every thread formats a chunk, and the chunks are written in order
+      std::vector<std::string> outputs(threads);
+      for(size_t round = 0; round < count; round += (size_t)threads * OUTPUT_CHUNK_WORDS) {
+        std::vector<std::thread> workers;
+        for(unsigned t = 0; t < threads; t++) {
+          size_t first = round + (size_t)t * OUTPUT_CHUNK_WORDS;
+          size_t chunk = first >= count ? 0 : (count - first < OUTPUT_CHUNK_WORDS ? count - first : OUTPUT_CHUNK_WORDS);
+          outputs[t].clear();
+          workers.emplace_back([&, t, first, chunk]() { unknown[t] += decode_chunk(region, first, chunk, &outputs[t]); });
+        }
+        for(unsigned t = 0; t < threads; t++) {
+          workers[t].join();
+          fwrite(outputs[t].data(), 1, outputs[t].size(), output);
+        }
+      }
+    }
+  }
+  if(output != NULL) {
+    fclose(output);
+  }
+
+  auto end = std::chrono::steady_clock::now();
+  size_t total_unknown = 0;
+  for(size_t u : unknown) {
+    total_unknown += u;
+  }
+  printf("Decoded %zu words (%zu unknown) on %u threads in %f seconds\n", input.count(), total_unknown, threads,
+         std::chrono::duration<double>(end - begin).count());
+
+  return 0;
+}
@@ -1,5 +1,14 @@
-from jinja2 import Environment, FileSystemLoader
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import filecmp
+import os
 import re
+from decoder import orderedEncodingsSets, flatDecodeRules, flatLayout, profiledLayout
+from decode_profile import instructionClass, opcodeName, loadProfile
+from decision_tree import buildDecisionTree, sharedNodes
+from switch_tree import buildSwitchTree
+from decode_tables import buildDecodeTables
+from phase_profiler import phase, profiling
 
 def prepend_lines(multiline_string, prefix):
     """prepend a string before every line i.e. after every newline char"""
@@ -9,96 +18,175 @@ def mk_cpp_identifier(string):
     """Convert any passed string into a valid c++ identifier by converting all invalid chars to underscores"""
     return(re.sub(r"[^a-zA-Z0-9]","_",string))
 
+def write_if_changed(path, chunks):
+    """Write the chunks to the file unless it already holds exactly them, returning whether it was written"""
+    temporary_path = path + ".tmp"
+    with open(temporary_path, 'w') as file:
+        file.writelines(chunks)
+    if os.path.exists(path) and filecmp.cmp(temporary_path, path, shallow=False):
+        os.remove(temporary_path)
+        return(False)
+    os.replace(temporary_path, path)
+    return(True)
+
+def report_written(written, name):
+    print(("Written to " if written else "Unchanged ") + name)
+
+BYTECODE_CACHE_DIR = '../../cache/templates'
+# the names that the templates give encodings, made in Python, so that the tools that name opcodes agree with them
+TEMPLATE_GLOBALS = dict(instruction_class_name=instructionClass, opcode_name=opcodeName)
+
+_environment = None
+
 def environment():
-    return(Environment(
-        loader=FileSystemLoader('../..'),
-        line_statement_prefix='£'
-    ))
+    """The environment shared by all of the templates, which caches the compiled templates between runs"""
+    global _environment
+    if _environment is None:
+        os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+        _environment = Environment(
+            loader=FileSystemLoader('../..'),
+            line_statement_prefix='£',
+            bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR)
+        )
+        _environment.globals.update(TEMPLATE_GLOBALS)
+    return(_environment)
+
+# The templates for each of the ways in which decode_a64 can be generated
+DECODER_TEMPLATES = {
+    "flat": 'templates/decoder.cpp.jinja',
+    "tree": 'templates/decoder_tree.cpp.jinja',
+    "switch": 'templates/decoder_switch.cpp.jinja',
+    "table": 'templates/decoder_table.cpp.jinja',
+}
 
-def generate_code(encodings_sets, instructions):
-    generate_decoder_h(instructions)
-    generate_decode_h()
-    generate_disasm_cpp(instructions)
-    generate_decoder_cpp(encodings_sets)
+def generate_code(encodings_sets, instructions, templates = None, backend = "flat", **decoder_options):
+    """Generate the output files, or just those rendered from the listed templates"""
+    # fix the order of the instructions and sets, so that regenerating from the same spec gives identical files
+    instructions = sorted(instructions, key=lambda inst: inst.fileName)
+    encodings_sets = orderedEncodingsSets(encodings_sets)
+    generators = [
+        ('templates/decoder.h.jinja', lambda: generate_decoder_h(instructions)),
+        ('templates/decode.h.jinja', generate_decode_h),
+        ('templates/disasm.cpp.jinja', lambda: generate_disasm_cpp(instructions)),
+        (DECODER_TEMPLATES[backend], lambda: generate_decoder_cpp(encodings_sets, backend, **decoder_options)),
+    ]
+    selected = [(template, generate) for template, generate in generators if templates is None or template in templates]
+
+    def profiled(template, generate):
+        with phase("render " + template):
+            return(generate())
+
+    # NOTE: the outputs are independent, so are rendered concurrently, but reported in order - unless the run is
+    # being profiled, as the phases of the profile must run one at a time
+    workers = 1 if profiling() else max(len(selected), 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for (written, name) in executor.map(lambda selection: profiled(*selection), selected):
+            report_written(written, name)
+
+def template_dependencies(template):
+    """The templates that the given template imports, includes, or extends"""
+    with open('../../' + template, 'r') as file:
+        return(set(re.findall(r"(?:import|include|extends)\s+'([^']+)'", file.read())))
 
 def generate_decode_h():
     env = environment()
     template = env.get_template('templates/decode.h.jinja')
-    with open('../../out/decode.h', 'w') as file:
-        file.write(template.render(
-        ))
-    print("Written to out/decode.h")
+    written = write_if_changed('../../out/decode.h', template.generate(
+    ))
+    return(written, "out/decode.h")
 
 def generate_disasm_cpp(instructions):
     env = environment()
     template = env.get_template('templates/disasm.cpp.jinja')
-    with open('../../out/disasm.cpp', 'w') as file:
-        file.write(template.render(
-            instructions=instructions
-        ))
-    print("Written to out/disasm.cpp")
+    written = write_if_changed('../../out/disasm.cpp', template.generate(
+        instructions=instructions
+    ))
+    return(written, "out/disasm.cpp")
 
 def generate_decoder_h(instructions):
     env = environment()
     template = env.get_template('templates/decoder.h.jinja')
-    with open('../../out/arm64-decode.h', 'w') as file:
-        file.write(template.render(
-            instructions=instructions,
-            mk_cpp_identifier=mk_cpp_identifier
-        ))
-    print("Written to out/decoder.h")
-
-def generate_decoder_cpp(encodings_sets):
+    written = write_if_changed('../../out/arm64-decode.h', template.generate(
+        instructions=instructions,
+        mk_cpp_identifier=mk_cpp_identifier
+    ))
+    return(written, "out/decoder.h")
+
+def decoder_structures(encodings_sets, backend = "flat", tree_max_depth = 20, switch_max_field_width = 8,
+                       table_root_bits = 8, table_field_width = 4, decode_profile = None, cold_threshold = 0.0):
+    """The decode structure that the backend's template renders, as (weights, layout, structures)"""
+    # NOTE: the profile is reloaded every time, as its encodings must be those of the given sets
+    weights = loadProfile(decode_profile, encodings_sets) if decode_profile is not None else None
+    layout = profiledLayout(encodings_sets, weights, cold_threshold) if weights is not None else flatLayout(encodings_sets)
+    structures = dict()
+    if backend == "tree":
+        structures["tree"] = buildDecisionTree(flatDecodeRules(encodings_sets, weights, layout), max_depth=tree_max_depth)
+        # the subtrees that are shared are emitted once, under a label of their index, and jumped to elsewhere
+        structures["tree_labels"] = dict([(node, n) for n, node in enumerate(sharedNodes(structures["tree"]))])
+    elif backend == "switch":
+        structures["switch_tree"] = buildSwitchTree(layout.sets(), max_field_width=switch_max_field_width)
+    elif backend == "table":
+        structures["tables"] = buildDecodeTables(flatDecodeRules(encodings_sets, weights, layout),
+                                                 root_bits=table_root_bits, field_width=table_field_width)
+    return(weights, layout, structures)
+
+def generate_decoder_cpp(encodings_sets, backend = "flat", decode_cache = None, decode_counters = False,
+                         **structure_options):
+    """decode_cache is None, or the sets and ways of the cache to generate, as a dict"""
     env = environment()
-    template = env.get_template('templates/decoder.cpp.jinja')
-    with open('../../out/arm64-decode.cpp', 'w') as file:
-        file.write(template.render(
-            sets=encodings_sets,
-            jumps={
-                "op_aarch64_a64_b_uncond_b_only_branch_imm": { # b_uncond.xml
-                    "type": "DIRECT",
-                    "predicated": False,
-                    "target": True,
-                },
-                "op_aarch64_a64_b_cond_b_only_condbranch": { # b_cond.xml
-                    "type": "INDIRECT",
-                    "predicated": False,
-                    "target": False,
-                    "is_predicated": True,
-                },
-                "op_aarch64_a64_br_br_64_branch_reg": { # br.xml
-                    "type": "INDIRECT",
-                    "predicated": False,
-                    "target": False,
-                },
-                "op_aarch64_a64_cbz_br19": { # cbz.xml
-                    "type": "DIRECT",
-                    "predicated": True,
-                    "target": True,
-                },
-                "op_aarch64_a64_drps_drps_64e_branch_reg": { # drps.xml
-                    "type": "INDIRECT",
-                    "predicated": False,
-                    "target": False,
-                },
-                "op_aarch64_a64_eret_eret_64e_branch_reg": { # eret.xml
-                    "type": "INDIRECT",
-                    "predicated": False,
-                    "target": False,
-                },
-                "op_aarch64_a64_ret_ret_64r_branch_reg": { # ret.xml
-                    "type": "INDIRECT",
-                    "predicated": False,
-                    "target": False,
-                },
-                "op_aarch64_a64_tbz_tbz_only_testbranch": { # tbz.xml
-                    "type": "DIRECT",
-                    "predicated": True,
-                    "target": False,
-                }
+    template = env.get_template(DECODER_TEMPLATES[backend])
+    (_, layout, structures) = decoder_structures(encodings_sets, backend, **structure_options)
+    written = write_if_changed('../../out/arm64-decode.cpp', template.generate(
+        sets=encodings_sets,
+        layout=layout,
+        decode_cache=decode_cache,
+        decode_counters=decode_counters,
+        # NOTE: the index of each set's counter, which only the flat and switch backends count, as the others have no sets
+        set_indices=dict([(enc_set, n) for n, enc_set in enumerate(encodings_sets)]),
+        jumps={
+            "op_aarch64_a64_b_uncond_b_only_branch_imm": { # b_uncond.xml
+                "type": "DIRECT",
+                "predicated": False,
+                "target": True,
+            },
+            "op_aarch64_a64_b_cond_b_only_condbranch": { # b_cond.xml
+                "type": "INDIRECT",
+                "predicated": False,
+                "target": False,
+                "is_predicated": True,
+            },
+            "op_aarch64_a64_br_br_64_branch_reg": { # br.xml
+                "type": "INDIRECT",
+                "predicated": False,
+                "target": False,
             },
-            drop_unbound_from_pos_map=lambda pos_map: dict([(x,(y,z)) for x,(y,z) in pos_map.items() if z is not None]),
-            list=list,
-            mk_cpp_identifier=mk_cpp_identifier
-        ))
-    print("Written to out/decoder.cpp")
+            "op_aarch64_a64_cbz_br19": { # cbz.xml
+                "type": "DIRECT",
+                "predicated": True,
+                "target": True,
+            },
+            "op_aarch64_a64_drps_drps_64e_branch_reg": { # drps.xml
+                "type": "INDIRECT",
+                "predicated": False,
+                "target": False,
+            },
+            "op_aarch64_a64_eret_eret_64e_branch_reg": { # eret.xml
+                "type": "INDIRECT",
+                "predicated": False,
+                "target": False,
+            },
+            "op_aarch64_a64_ret_ret_64r_branch_reg": { # ret.xml
+                "type": "INDIRECT",
+                "predicated": False,
+                "target": False,
+            },
+            "op_aarch64_a64_tbz_tbz_only_testbranch": { # tbz.xml
+                "type": "DIRECT",
+                "predicated": True,
+                "target": False,
+            }
+        },
+        mk_cpp_identifier=mk_cpp_identifier,
+        **structures
+    ))
+    return(written, "out/decoder.cpp")
@@ -0,0 +1,148 @@
+class Rule():
+    """A check made when decoding, which a word matches if (word & mask) == value"""
+
+    def __init__(self, mask, value, payload, weight = 1):
+        self.mask = mask
+        self.value = value
+        self.payload = payload
+        self.weight = weight
+
+    def matches(self, word):
+        return(word & self.mask == self.value)
+
+class Leaf():
+    """The rules that a word reaching this point of the tree could match, to be checked in order"""
+
+    def __init__(self, rules):
+        self.rules = rules
+
+    def is_leaf(self):
+        return(True)
+
+    def decode(self, word):
+        for rule in self.rules:
+            if rule.matches(word):
+                return(rule)
+        return(None)
+
+class Node():
+    """Selects a child by the value of a field of the word, bits high_bit..low_bit inclusive"""
+
+    def __init__(self, high_bit, low_bit, children):
+        self.high_bit = high_bit
+        self.low_bit = low_bit
+        self.children = children
+
+    def is_leaf(self):
+        return(False)
+
+    def width(self):
+        return(self.high_bit - self.low_bit + 1)
+
+    def child(self, word):
+        return(self.children[(word >> self.low_bit) & ((1 << self.width()) - 1)])
+
+    def decode(self, word):
+        return(self.child(word).decode(word))
+
+def fieldValues(rule, high_bit, low_bit):
+    """The values that the field could have in a word matching the rule"""
+    field_mask = (1 << (high_bit - low_bit + 1)) - 1
+    value = (rule.value >> low_bit) & field_mask
+    free = field_mask & ~(rule.mask >> low_bit)
+    values = []
+    subset = free
+    while True:
+        values.append(value | subset)
+        if subset == 0:
+            return(values)
+        subset = (subset - 1) & free
+
+def splitRules(rules, high_bit, low_bit):
+    """The rules that each value of the field could match, and the smoothed likelihood of each value"""
+    children = [[] for _ in range(1 << (high_bit - low_bit + 1))]
+    likelihoods = [0] * len(children)
+    for rule in rules:
+        values = fieldValues(rule, high_bit, low_bit)
+        share = (rule.weight + 1) / len(values)
+        for value in values:
+            children[value].append(rule)
+            likelihoods[value] += share
+    return(children, likelihoods)
+
+def expectedComparisons(children, likelihoods):
+    """The cost model: the expected number of rules left to check after selecting a child"""
+    total = sum(likelihoods)
+    return(sum([likelihood * len(child) for child, likelihood in zip(children, likelihoods)]) / total)
+
+def informativeBits(rules):
+    """The bits that are bound to zero by at least one rule, and to one by another - only these can be split on"""
+    zeros = 0
+    ones = 0
+    for rule in rules:
+        zeros |= rule.mask & ~rule.value
+        ones |= rule.mask & rule.value
+    return(zeros & ones)
+
+def candidateFields(rules, max_field_width):
+    """Each field of up to max_field_width bits that starts and ends at an informative bit, as (high_bit, low_bit)"""
+    informative = informativeBits(rules)
+    bits = [bit for bit in range(0,32) if informative & (1 << bit)]
+    for low_bit in bits:
+        for high_bit in bits:
+            if low_bit <= high_bit < low_bit + max_field_width:
+                yield (high_bit, low_bit)
+
+def buildDecisionTree(rules, max_depth = 20, max_field_width = 1, leaf_size = 1, subtrees = None):
+    """Build a decision tree that decodes a word as the first of the rules that it matches"""
+    if subtrees is None:
+        subtrees = dict()
+    key = (tuple(rules), max_depth)
+    if key in subtrees:
+        return(subtrees[key])
+    # NOTE: leaves are shared regardless of depth
+    leaf = lambda: subtrees.setdefault((tuple(rules), None), Leaf(rules))
+    if len(rules) <= leaf_size or max_depth == 0:
+        return(leaf())
+    best = None
+    for (high_bit, low_bit) in candidateFields(rules, max_field_width):
+        (children, likelihoods) = splitRules(rules, high_bit, low_bit)
+        # ties are broken in favour of narrower fields, then higher bits, so that trees are reproducible
+        cost = (expectedComparisons(children, likelihoods), high_bit - low_bit, -high_bit)
+        if best is None or cost < best[0]:
+            best = (cost, high_bit, low_bit, children)
+    if best is None or best[0][0] >= len(rules):
+        subtrees[key] = leaf()
+        return(subtrees[key])
+    (_, high_bit, low_bit, children) = best
+    subtrees[key] = Node(high_bit, low_bit, [buildDecisionTree(child, max_depth - 1, max_field_width, leaf_size, subtrees)
+                                             for child in children])
+    return(subtrees[key])
+
+def treeNodes(tree):
+    """Every node and leaf of the tree, each once, parents before their children"""
+    seen = set()
+    stack = [tree]
+    while stack != []:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen |= {id(node)}
+        yield node
+        if not node.is_leaf():
+            stack.extend(reversed(node.children))
+
+def sharedNodes(tree):
+    """The non-empty nodes and leaves that are a child more than once in the tree"""
+    references = dict()
+    for node in treeNodes(tree):
+        if not node.is_leaf():
+            for child in node.children:
+                references[id(child)] = references.get(id(child), 0) + 1
+    return([node for node in treeNodes(tree)
+            if references.get(id(node), 0) > 1 and not (node.is_leaf() and node.rules == [])])
+
+def treeDepth(tree):
+    if tree.is_leaf():
+        return(0)
+    return(1 + max([treeDepth(child) for child in tree.children]))
@@ -0,0 +1,48 @@
+import re
+from decoder import flatDecodeRules
+from decision_tree import buildDecisionTree
+
+WORD_PATTERN = re.compile(r"(0x)?[0-9a-fA-F]{1,8}")
+
+def instructionClass(enc):
+    """The name of the encoding's class in the generated code, as common.instruction_class renders it"""
+    return(f"aarch64_a64_{enc.instruction.id.lower()}_{enc.id.lower()}")
+
+def opcodeName(enc):
+    """The name of the encoding's opcode in the generated code, as common.opcode renders it"""
+    return("op_" + instructionClass(enc))
+
+def readProfile(path):
+    """Each line of the profile as a (key, count) pair, where the key is an opcode name or an instruction word in hex"""
+    with open(path, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            fields = line.split('#')[0].split()
+            if fields == []:
+                continue
+            if len(fields) > 2 or (len(fields) == 2 and not fields[1].isdigit()):
+                raise ValueError(f"{path}:{line_number}: expected an opcode or instruction word, and a count")
+            yield (line_number, fields[0], int(fields[1]) if len(fields) == 2 else 1)
+
+def loadProfile(path, encodings_sets):
+    """The profile as a dict mapping each encoding to how often it was decoded"""
+    encodings = [enc for enc_set in encodings_sets for enc in enc_set.encodings]
+    by_name = dict([(opcodeName(enc), enc) for enc in encodings])
+    tree = None
+    weights = dict()
+    for (line_number, key, count) in readProfile(path):
+        if key in by_name:
+            enc = by_name[key]
+        elif key == "aarch64_unknown":
+            continue
+        elif WORD_PATTERN.fullmatch(key):
+            if tree is None:
+                # NOTE: the tree decodes as the flat rules do, but much faster for a long trace
+                tree = buildDecisionTree(flatDecodeRules(encodings_sets))
+            rule = tree.decode(int(key, 16))
+            if rule is None:
+                continue
+            enc = rule.payload
+        else:
+            raise ValueError(f"{path}:{line_number}: unknown opcode {key}")
+        weights[enc] = weights.get(enc, 0) + count
+    return(weights)
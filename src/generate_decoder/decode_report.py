@@ -0,0 +1,156 @@
+import json
+from decoder import orderedEncodingsSets
+from code_generator import decoder_structures
+from decode_profile import opcodeName
+
+# Rough sizes in bytes of the machine code for each part of the generated decode_a64, for estimating its size
+CHECK_BYTES = 12                # extract a field of the word, compare it, and branch
+RETURN_BYTES = 16               # set the opcode and return
+SWITCH_BYTES = 16               # extract the field, check it is in the range of the jump table, and branch
+JUMP_TABLE_ENTRY_BYTES = 4
+GOTO_BYTES = 4                  # jump to a shared subtree
+TABLE_WALK_BYTES = 96           # the loops that walk the tables and check the candidates
+
+class DecodeCosts():
+    """The checks in the generated decode_a64: how many are generated, and the most made to decode each encoding"""
+
+    def __init__(self):
+        self.conditions = 0
+        self.code_bytes = 0
+        self.data_bytes = 0
+        self.checks = dict()
+        self.decodes = dict()
+
+    def decoded(self, enc, checks):
+        """Record that a word of the encoding is decoded after at most the given number of checks"""
+        self.checks[enc] = max(self.checks.get(enc, 0), checks)
+        self.decodes[enc] = self.decodes.get(enc, 0) + 1
+
+def setsCosts(costs, layout, encodings_sets, before = 0, excluded_mask = 0):
+    """Add the costs of checking each of the sets in turn, returning the most checks made by a word in none of them"""
+    for enc_set in encodings_sets:
+        shared = len(enc_set.shared_bits_as_list_of_ranges(excluded_mask))
+        checks = before + shared
+        for enc in layout.encodings(enc_set):
+            leaf = len(enc_set.leaf_bits(enc))
+            checks += leaf
+            costs.decoded(enc, checks)
+            costs.conditions += leaf
+            costs.code_bytes += CHECK_BYTES * leaf + RETURN_BYTES
+        costs.conditions += shared
+        costs.code_bytes += CHECK_BYTES * shared
+        before += shared
+    return(before)
+
+def flatCosts(costs, layout):
+    checks = setsCosts(costs, layout, layout.hot)
+    costs.code_bytes += RETURN_BYTES
+    setsCosts(costs, layout, layout.cold, checks)
+
+def treeCosts(costs, node, before = 0, emitted = None, emit = True):
+    """Add the costs of the decision tree, counting the code of a shared subtree once"""
+    if emitted is None:
+        emitted = set()
+    if emit and id(node) in emitted and not (node.is_leaf() and node.rules == []):
+        costs.code_bytes += GOTO_BYTES
+        emit = False
+    emitted |= {id(node)}
+    if node.is_leaf():
+        for i, rule in enumerate(node.rules):
+            costs.decoded(rule.payload, before + i + 1)
+        if emit:
+            costs.conditions += len(node.rules)
+            costs.code_bytes += (CHECK_BYTES + RETURN_BYTES) * len(node.rules) + RETURN_BYTES
+        return
+    if emit:
+        costs.conditions += 1
+        costs.code_bytes += CHECK_BYTES
+    for child in node.children:
+        treeCosts(costs, child, before + 1, emitted, emit)
+
+def switchCosts(costs, layout, node, before = 0):
+    """Add the costs of the switch tree, returning the most checks made by a word that isn't in any of its sets"""
+    if node.is_leaf():
+        return(setsCosts(costs, layout, node.sets, before, node.switched_mask))
+    values = [value for value, _ in node.cases]
+    costs.conditions += 1
+    costs.code_bytes += SWITCH_BYTES + JUMP_TABLE_ENTRY_BYTES * (max(values) - min(values) + 1)
+    fallen_through = max([switchCosts(costs, layout, child, before + 1) for _, child in node.cases] + [before + 1])
+    if node.rest is None:
+        return(fallen_through)
+    return(switchCosts(costs, layout, node.rest, fallen_through))
+
+def tableCosts(costs, tables, index = 0, before = 0):
+    (mask, _, first, count) = tables.nodes[index]
+    if mask == 0:
+        for i, rule in enumerate(tables.candidates[first:first + count]):
+            costs.decoded(rule.payload, before + i + 1)
+        return
+    for child in set(tables.children[first:first + mask + 1]):
+        tableCosts(costs, tables, child, before + 1)
+
+def decodeCosts(backend, layout, structures):
+    costs = DecodeCosts()
+    if backend == "flat":
+        flatCosts(costs, layout)
+    elif backend == "tree":
+        treeCosts(costs, structures["tree"])
+    elif backend == "switch":
+        switchCosts(costs, layout, structures["switch_tree"])
+        costs.code_bytes += RETURN_BYTES
+    elif backend == "table":
+        tables = structures["tables"]
+        tableCosts(costs, tables)
+        costs.conditions = len(tables.nodes) + len(tables.candidates)
+        costs.code_bytes = TABLE_WALK_BYTES
+        costs.data_bytes = tables.size_in_bytes()
+    return(costs)
+
+def decodeReport(encodings_sets, backend = "flat", slowest = 10, **structure_options):
+    """A report of the complexity of the decode_a64 that the backend generates, as a dict that can be written as JSON"""
+    encodings_sets = orderedEncodingsSets(encodings_sets)
+    (weights, layout, structures) = decoder_structures(encodings_sets, backend, **structure_options)
+    costs = decodeCosts(backend, layout, structures)
+
+    sets_of_encoding = dict()
+    for enc_set in encodings_sets:
+        for enc in enc_set.encodings:
+            sets_of_encoding[enc] = sets_of_encoding.get(enc, 0) + 1
+    checks = list(costs.checks.values())
+    report = {
+        'backend': backend,
+        'encodings_sets': len(encodings_sets),
+        'hot_sets': len(layout.hot),
+        'cold_sets': len(layout.cold),
+        'encodings': len(sets_of_encoding),
+        'duplicated_encodings': len([count for count in sets_of_encoding.values() if count > 1]),
+        'duplicated_decodes': sum(costs.decodes.values()) - len(costs.decodes),
+        'undecoded_encodings': len([enc for enc in sets_of_encoding if enc not in costs.checks]),
+        'conditions': costs.conditions,
+        'max_checks': max(checks) if checks != [] else 0,
+        'mean_checks': sum(checks) / len(checks) if checks != [] else 0.0,
+        'estimated_code_bytes': costs.code_bytes,
+        'table_bytes': costs.data_bytes,
+        'slowest': [(opcodeName(enc), count) for enc, count in
+                    sorted(costs.checks.items(), key=lambda pair: (-pair[1], opcodeName(pair[0])))[:slowest]],
+    }
+    if weights is not None and sum(weights.values()) > 0:
+        report['weighted_mean_checks'] = (sum([weights.get(enc, 0) * count for enc, count in costs.checks.items()])
+                                          / sum(weights.values()))
+    return(report)
+
+def printReport(report):
+    for key, value in report.items():
+        if key == 'slowest':
+            print("slowest to decode:")
+            for name, count in value:
+                print("  %-60s %d" % (name, count))
+        elif isinstance(value, float):
+            print("%s: %.2f" % (key, value))
+        else:
+            print("%s: %s" % (key, value))
+
+def writeReport(report, path):
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2)
+    print("Written to", path)
@@ -0,0 +1,193 @@
+# Counts the conditions that the generated decode_a64 evaluates for each word of a binary file of A64 instructions,
+# by walking the words through a model of exactly the checks that the backend's template emits, for comparing
+# ways of building the decoder on real workloads without the noise of timing compiled code. NumPy must be
+# installed.
+#
+#  e.g. python3 decode_simulator.py vmlinux.bin --backend=tree
+
+import argparse
+import numpy as np
+from decoder import orderedEncodingsSets
+from code_generator import decoder_structures, DECODER_TEMPLATES
+from decode_profile import opcodeName
+from decode_tables import MAX_ROOT_BITS
+from reference_decoder import asWords
+from switch_tree import fieldMask
+
+def setChecks(enc_set, encodings, excluded_mask = 0):
+    """The checks that common.encodings_set makes, as the shared bits' (mask, value) pairs and each encoding's"""
+    shared = [(fieldMask(bit_range['high'], bit_range['low']), bit_range['v'] << bit_range['low'])
+              for bit_range in enc_set.shared_bits_as_list_of_ranges(excluded_mask)]
+    leaves = [(enc, [(1 << (31 - i), bit.value << (31 - i)) for i, bit in enc_set.leaf_bits(enc)])
+              for enc in encodings]
+    return(shared, leaves)
+
+class DecodeSimulator():
+    """Decodes arrays of words as decode_a64 does, counting the conditions evaluated for each of them"""
+
+    def __init__(self, encodings_sets, backend = "flat", **structure_options):
+        encodings_sets = orderedEncodingsSets(encodings_sets)
+        (_, self.layout, structures) = decoder_structures(encodings_sets, backend, **structure_options)
+        self.backend = backend
+        self.structure = structures.get({"tree": "tree", "switch": "switch_tree", "table": "tables"}.get(backend))
+        self.encodings = [enc for enc_set in encodings_sets for enc in enc_set.encodingsOrderedByIncreasingUnbound()]
+        self.opcodes = dict([(enc, i) for i, enc in enumerate(self.encodings)])
+        self.set_checks = dict()
+
+    def check(self, indices, mask, value):
+        """Count a condition for each of the words, returning those that match it"""
+        self.conditions[indices] += 1
+        return(indices[(self.words[indices] & mask) == value])
+
+    def decode_as(self, indices, enc):
+        self.opcode[indices] = self.opcodes[enc]
+
+    def undecoded(self, indices):
+        return(indices[self.opcode[indices] < 0])
+
+    def simulate_sets(self, indices, encodings_sets, excluded_mask = 0):
+        """Check each of the sets in turn, returning the words that none of them decode"""
+        for enc_set in encodings_sets:
+            key = (enc_set, excluded_mask)
+            if key not in self.set_checks:
+                self.set_checks[key] = setChecks(enc_set, self.layout.encodings(enc_set), excluded_mask)
+            (shared, leaves) = self.set_checks[key]
+            matched = indices
+            for (mask, value) in shared:
+                matched = self.check(matched, mask, value)
+            for (enc, checks) in leaves:
+                decoded = matched
+                for (mask, value) in checks:
+                    decoded = self.check(decoded, mask, value)
+                self.decode_as(decoded, enc)
+                matched = self.undecoded(matched)
+            indices = self.undecoded(indices)
+        return(indices)
+
+    def simulate_rules(self, indices, rules):
+        for rule in rules:
+            self.decode_as(self.check(indices, rule.mask, rule.value), rule.payload)
+            indices = self.undecoded(indices)
+        return(indices)
+
+    def simulate_tree(self, indices, node):
+        if len(indices) == 0:
+            return(indices)
+        if node.is_leaf():
+            return(self.simulate_rules(indices, node.rules))
+        self.conditions[indices] += 1
+        fields = (self.words[indices] >> node.low_bit) & ((1 << node.width()) - 1)
+        return(np.concatenate([self.simulate_tree(indices[fields == value], child)
+                               for value, child in enumerate(node.children)]))
+
+    def simulate_switch(self, indices, node):
+        if len(indices) == 0:
+            return(indices)
+        if node.is_leaf():
+            return(self.simulate_sets(indices, node.sets, node.switched_mask))
+        self.conditions[indices] += 1
+        fields = (self.words[indices] >> node.low_bit) & ((1 << (node.high_bit - node.low_bit + 1)) - 1)
+        values = [value for value, _ in node.cases]
+        # NOTE: the words that aren't decoded in their case break out of the switch, as do those of no case
+        fallen_through = [indices[~np.isin(fields, values)]]
+        fallen_through += [self.simulate_switch(indices[fields == value], child) for value, child in node.cases]
+        indices = np.concatenate(fallen_through)
+        if node.rest is None:
+            return(indices)
+        return(self.simulate_switch(indices, node.rest))
+
+    def simulate_tables(self, indices, index = 0):
+        if len(indices) == 0:
+            return(indices)
+        (mask, shift, first, count) = self.structure.nodes[index]
+        if mask == 0:
+            return(self.simulate_rules(indices, self.structure.candidates[first:first + count]))
+        self.conditions[indices] += 1
+        children = np.array(self.structure.children[first:first + mask + 1])[(self.words[indices] >> shift) & mask]
+        return(np.concatenate([self.simulate_tables(indices[children == child], child)
+                               for child in np.unique(children)]))
+
+    def simulate(self, data):
+        """The opcode of each of the words, or -1 if unknown, and the number of conditions evaluated for each"""
+        self.words = asWords(data)
+        self.opcode = np.full(len(self.words), -1, dtype=np.int32)
+        self.conditions = np.zeros(len(self.words), dtype=np.int64)
+        indices = np.arange(len(self.words))
+        if self.backend == "flat":
+            self.simulate_sets(self.simulate_sets(indices, self.layout.hot), self.layout.cold)
+        elif self.backend == "tree":
+            self.simulate_tree(indices, self.structure)
+        elif self.backend == "switch":
+            self.simulate_switch(indices, self.structure)
+        elif self.backend == "table":
+            self.simulate_tables(indices)
+        (opcode, conditions) = (self.opcode, self.conditions)
+        del self.words, self.opcode, self.conditions
+        return(opcode, conditions)
+
+    def opcode_name(self, opcode):
+        return(opcodeName(self.encodings[opcode]) if opcode >= 0 else "aarch64_unknown")
+
+    def summary(self, data):
+        """The mean conditions evaluated per word, overall and for each opcode, as a dict that can be written as JSON"""
+        (words, counts) = np.unique(asWords(data), return_counts=True)
+        (opcode, conditions) = self.simulate(words)
+        total = int(counts.sum())
+        per_opcode = []
+        for op in np.unique(opcode):
+            selected = opcode == op
+            words_of_opcode = int(counts[selected].sum())
+            per_opcode.append((self.opcode_name(op), words_of_opcode,
+                               float((conditions[selected] * counts[selected]).sum() / words_of_opcode)))
+        return({
+            'backend': self.backend,
+            'words': total,
+            'unique_words': len(words),
+            'unknown_words': int(counts[opcode < 0].sum()),
+            'mean_conditions': float((conditions * counts).sum() / total) if total > 0 else 0.0,
+            'max_conditions': int(conditions.max()) if total > 0 else 0,
+            'opcodes': sorted(per_opcode, key=lambda row: (-row[1] * row[2], row[0])),
+        })
+
+if __name__ == "__main__":
+    import json
+    from parser import parseAllFiles
+    from decoder import buildEncodingsSets
+    from elf import loadCode
+
+    arg_parser = argparse.ArgumentParser(description='Count the conditions decode_a64 evaluates for a binary file of A64 instructions.')
+    arg_parser.add_argument('binary', help='A binary file of A64 instructions, or an AArch64 ELF file.')
+    arg_parser.add_argument('--backend', dest='backend', action='store', choices=list(DECODER_TEMPLATES.keys()), default='flat',
+                            help='The backend of decode_a64 to simulate, as for main.py.')
+    arg_parser.add_argument('--tree-max-depth', dest='tree_max_depth', action='store', type=int, default=20)
+    arg_parser.add_argument('--switch-max-field-width', dest='switch_max_field_width', action='store', type=int, default=8)
+    arg_parser.add_argument('--table-root-bits', dest='table_root_bits', action='store', type=int, default=8)
+    arg_parser.add_argument('--table-field-width', dest='table_field_width', action='store', type=int, default=4)
+    arg_parser.add_argument('--decode-profile', dest='decode_profile', action='store', default=None)
+    arg_parser.add_argument('--cold-threshold', dest='cold_threshold', action='store', type=float, default=0.0)
+    arg_parser.add_argument('--top', dest='top', action='store', type=int, default=20,
+                            help='The number of opcodes to list, by the conditions they account for.')
+    arg_parser.add_argument('--json', dest='json', action='store', default=None,
+                            help='Write the summary, with every opcode, to this JSON file.')
+    args = arg_parser.parse_args()
+    if not 0 <= args.table_root_bits <= MAX_ROOT_BITS:
+        arg_parser.error("--table-root-bits must be from 0 to %d" % MAX_ROOT_BITS)
+    if args.table_field_width < 1:
+        arg_parser.error("--table-field-width must be at least 1")
+
+    instructions = parseAllFiles()
+    simulator = DecodeSimulator(buildEncodingsSets(instructions), args.backend, tree_max_depth=args.tree_max_depth,
+                                switch_max_field_width=args.switch_max_field_width,
+                                table_root_bits=args.table_root_bits, table_field_width=args.table_field_width,
+                                decode_profile=args.decode_profile, cold_threshold=args.cold_threshold)
+    summary = simulator.summary(np.concatenate([asWords(code) for _, code in loadCode(args.binary)]
+                                               + [np.zeros(0, dtype=np.uint32)]))
+    print("%d words (%d unique, %d unknown), %.2f conditions per word, at most %d" % (
+        summary['words'], summary['unique_words'], summary['unknown_words'], summary['mean_conditions'],
+        summary['max_conditions']))
+    for name, count, mean in summary['opcodes'][:args.top]:
+        print("%-60s %10d %8.2f" % (name, count, mean))
+    if args.json is not None:
+        with open(args.json, 'w') as file:
+            json.dump(summary, file, indent=2)
+        print("Written to", args.json)
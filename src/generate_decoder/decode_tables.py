@@ -0,0 +1,64 @@
+from decision_tree import Node, splitRules, buildDecisionTree
+
+# the most top bits that index the root table, which has 2 ** root_bits entries
+MAX_ROOT_BITS = 16
+
+class DecodeTables():
+    """A decision tree flattened into the tables that the table-driven decode_a64 walks"""
+
+    def __init__(self, tree):
+        self.nodes = []
+        self.children = []
+        self.candidates = []
+        self.leaves = dict()
+        self.added = dict()
+        self.add(tree)
+
+    def add(self, node):
+        """Add the node and all of its descendants to the tables, returning the node's index"""
+        if node.is_leaf():
+            key = tuple([id(rule) for rule in node.rules])
+            if key not in self.leaves:
+                self.leaves[key] = len(self.nodes)
+                self.nodes.append((0, 0, len(self.candidates), len(node.rules)))
+                self.candidates.extend(node.rules)
+            return(self.leaves[key])
+        if id(node) in self.added:
+            return(self.added[id(node)])
+        index = len(self.nodes)
+        self.added[id(node)] = index
+        self.nodes.append(None)
+        # NOTE: the children are added first, so that their indices can be stored together in children
+        child_indices = [self.add(child) for child in node.children]
+        self.nodes[index] = ((1 << node.width()) - 1, node.low_bit, len(self.children), 0)
+        self.children.extend(child_indices)
+        return(index)
+
+    def decode(self, word):
+        """The first rule that the word matches, found by walking the tables as decode_a64 does"""
+        (mask, shift, first, count) = self.nodes[0]
+        while mask != 0:
+            (mask, shift, first, count) = self.nodes[self.children[first + ((word >> shift) & mask)]]
+        for rule in self.candidates[first:first + count]:
+            if rule.matches(word):
+                return(rule)
+        return(None)
+
+    def index_type(self):
+        """The smallest C++ type that can hold the index of any node"""
+        return("uint16_t" if len(self.nodes) <= 1 << 16 else "uint32_t")
+
+    def size_in_bytes(self):
+        """The size of the tables in the generated code, where a node is 12 bytes and a candidate 12 bytes"""
+        return(12 * len(self.nodes) + (2 if self.index_type() == "uint16_t" else 4) * len(self.children)
+               + 12 * len(self.candidates))
+
+def buildDecodeTables(rules, root_bits = 8, field_width = 4, max_depth = 20):
+    """Build the tables for decoding a word as the first of the rules that it matches"""
+    assert 0 <= root_bits <= MAX_ROOT_BITS and field_width >= 1
+    if root_bits == 0:
+        return(DecodeTables(buildDecisionTree(rules, max_depth, field_width)))
+    (children, _) = splitRules(rules, 31, 32 - root_bits)
+    subtrees = dict()
+    return(DecodeTables(Node(31, 32 - root_bits,
+                             [buildDecisionTree(child, max_depth - 1, field_width, 1, subtrees) for child in children])))
@@ -3,14 +3,17 @@
 import os
 import itertools
 from parser import *
+from decision_tree import Rule
+from phase_profiler import phase, count
 
 class EncodingsSet():
 
     def __init__(self, encodings, shared_bits):
+        count('sets_created')
+        self.shared_mask = maskOfBitIndices(shared_bits.keys())
+        self.shared_value = maskOfBitIndices([i for i, bit in shared_bits.items() if bit == Bit.One])
         for encoding in encodings:
-            for position, bit in shared_bits.items():
-                (_, bitValue) = encoding.getBit(position)
-                assert bitValue == bit
+            assert self.shares_bits(encoding)
         self.encodings = encodings
         self.shared_bits = shared_bits
 
@@ -27,12 +30,7 @@ class EncodingsSet():
         raise ValueError("Only call if this EncodingsSet is unknown to be a singleton")
 
     def __str__(self):
-        out = f"{len(self.encodings)} instructions share the bits: "
-        for bit in range(0,32):
-            out += strBitValue((BitValueType.Bound, self.shared_bits[bit])
-                               if bit in self.shared_bits
-                               else (BitValueType.Unbound, None))
-        out += "\n"
+        out = f"{len(self.encodings)} instructions share the bits: {self.shared_bits_pattern()}\n"
         for encoding in self.encodingsOrderedByIncreasingUnbound():
             out += f"- {str(encoding)} [{encoding.instruction.name}]({encoding.instruction.fileName})\n"
             for bit_sequence in encoding.bitSequences:
@@ -40,14 +38,24 @@ class EncodingsSet():
                     out += f"  - {bit_sequence.name}: [{bit_sequence.high_bit}..{bit_sequence.low_bit}]\n"
         return(out)
 
+    def shared_bits_pattern(self):
+        """The shared bits as 0s and 1s, and the other bits as xs, from bit 31 down"""
+        return("".join([strBitValue((BitValueType.Bound, self.shared_bits[bit])
+                                    if bit in self.shared_bits
+                                    else (BitValueType.Unbound, None))
+                        for bit in range(0,32)]))
+
     def ordered_shared_bits(self):
         for bit in sorted(self.shared_bits):
             yield (bit, self.shared_bits[bit])
 
+    def shares_bits(self, encoding):
+        """Whether all of the shared bits are bound in the encoding, and to the same values"""
+        return(self.shared_mask & ~encoding.known_mask == 0
+               and (encoding.known_value ^ self.shared_value) & self.shared_mask == 0)
+
     def append(self, encoding):
-        for position, bit in self.shared_bits.items():
-            (_, bitValue) = encoding.getBit(position)
-            assert bitValue == bit
+        assert self.shares_bits(encoding)
         self.encodings |= {encoding}
 
     # returns two new encoding sets
@@ -63,16 +71,16 @@ class EncodingsSet():
         ones_shared_bits[common_bit_position] = Bit.One
         ones = EncodingsSet(set(), ones_shared_bits)
 
+        bit = bitIndexMask(common_bit_position)
         for encoding in self.encodings:
-            (bit_type, bit_value) = encoding.getBit(common_bit_position)
-            if   (bit_type == BitValueType.Unbound) \
-              or (bit_type == BitValueType.Bound and bit_value == Bit.Zero) \
-              or (bit_type == BitValueType.Unpredictably_bound and bit_value == Bit.Zero):
+            if not encoding.known_mask & bit:
                 zeros.append(encoding)
-            if   (bit_type == BitValueType.Unbound) \
-              or (bit_type == BitValueType.Bound and bit_value == Bit.One) \
-              or (bit_type == BitValueType.Unpredictably_bound and bit_value == Bit.One):
                 ones.append(encoding)
+            elif encoding.known_value & bit:
+                ones.append(encoding)
+            else:
+                zeros.append(encoding)
+        count('empty_sets_created', len([each_set for each_set in (zeros, ones) if len(each_set) == 0]))
         return({zeros, ones})
 
     # returns 2 ** n new encoding sets by splitting on n bit positions
@@ -87,37 +95,48 @@ class EncodingsSet():
 
     # in addition to the bits listed by self.shared_bits, there may be other bits that are commonly bound - split on those
     def findOtherCommonlyBoundBits(self):
-        other_bits = set(range(32)) - set(self.shared_bits.keys())
-        unbound_in_an_instruction = set()
-        for position in other_bits:
-            for encoding in self.encodings:
-                (bitValueType, _) = encoding.getBit(position)
-                if bitValueType == BitValueType.Unbound:
-                    unbound_in_an_instruction |= {position}
-                    break
-        return(other_bits - unbound_in_an_instruction)
+        unbound_in_an_instruction = 0
+        for encoding in self.encodings:
+            unbound_in_an_instruction |= encoding.unbound_mask
+        return(bitIndicesOfMask(WORD_MASK & ~unbound_in_an_instruction & ~self.shared_mask))
 
     def findUncommonlyBoundBits(self):
         """These are the bit positions where at least one of the encodings has a bound bit"""
-        all_bound = set()
+        return(bitIndicesOfMask(self.uncommonly_bound_mask()))
+
+    def leaf_bits(self, encoding):
+        """The bits that decode_a64 checks for the encoding once a word has matched the shared bits, as (bit_pos, bit)"""
+        if self.is_singleton():
+            return([])
+        return([(i, bit) for i, (_, bit) in sorted(encoding.getBitMany(self.findUncommonlyBoundBits()).items())
+                if bit is not None])
+
+    def uncommonly_bound_mask(self):
+        all_bound = 0
         for enc in self.encodings:
-            for i in range(0,32):
-                (bitType, _) = enc.getBit(i)
-                if bitType == BitValueType.Bound:
-                    all_bound |= {i}
-        return(all_bound - set(self.shared_bits.keys()))
+            all_bound |= enc.bound_mask
+        return(all_bound & ~self.shared_mask)
 
     def splitOnCommonBoundBits(self):
-        return(self.splitMany(self.findOtherCommonlyBoundBits()))
+        return(self.splitOnBoundBits(self.findOtherCommonlyBoundBits()))
+
+    def splitOnBoundBits(self, bit_positions):
+        """Equivalent to splitMany for bit positions that are bound in every encoding, but without the empty sets"""
+        split_mask = maskOfBitIndices(bit_positions)
+        groups = dict()
+        for encoding in self.encodings:
+            groups.setdefault(encoding.known_value & split_mask, set()).add(encoding)
+        sets = set()
+        for value, encodings in groups.items():
+            shared_bits = self.shared_bits.copy()
+            for bit_position in bit_positions:
+                shared_bits[bit_position] = Bit.One if value & bitIndexMask(bit_position) else Bit.Zero
+            sets |= {EncodingsSet(encodings, shared_bits)}
+        return(sets)
 
     def encodingsOrderedByIncreasingUnbound(self):
-        unbound_count = dict([(i,set()) for i in range(0,32)])
-        for enc in self.encodings:
-            unbound_count[enc.unbound_count()] |= {enc}
-        ret = []
-        for i in range(0,32):
-            ret += unbound_count[i]
-        return(ret)
+        # ties are broken by the bit patterns and ids, so that the generated code is the same from run to run
+        return(sorted(self.encodings, key=lambda enc: (enc.unbound_count(), str(enc), enc.id)))
 
     def _remove_repeated_none_and_leading_none(self, elements):
         no_repeat_none = []
@@ -129,12 +148,13 @@ class EncodingsSet():
                     no_repeat_none.append(None)
         return(no_repeat_none)
 
-    def shared_bits_as_list_of_ranges(self):
+    def shared_bits_as_list_of_ranges(self, excluded_mask = 0):
+        """The shared bits as ranges of adjacent bits, leaving out those in excluded_mask e.g. as already checked"""
         if len(self.shared_bits) == 0:
             return([])
         none_separated_bit_data = self._remove_repeated_none_and_leading_none([
             {'v':self.shared_bits[i].value,'high':i,'low':i}
-            if i in self.shared_bits else None for i in range(0,32)])
+            if i in self.shared_bits and not excluded_mask & bitIndexMask(i) else None for i in range(0,32)])
         data = []
         initial = {'v':0,'high':None,'low':None}
         accumulator = initial
@@ -153,18 +173,90 @@ class EncodingsSet():
         return(data)
 
 def findCommonBitsAndSplitRecursively(encoding_set):
-    encoding_subsets = encoding_set.splitOnCommonBoundBits()
-    if len(encoding_subsets) == 1:
+    common_bits = encoding_set.findOtherCommonlyBoundBits()
+    if len(common_bits) == 0:
         # stop when splitting does nothing but apply singleton function
         return {encoding_set}
     encoding_subsubsets = set()
-    for subset in encoding_subsets:
-        if len(subset) == 0:
-            # we don't care about empty encoding sets
-            pass
-        elif len(subset) == 1:
+    # NOTE: the empty sets that splitting on all of the common bits would create are never made, as we don't care about them
+    for subset in encoding_set.splitOnBoundBits(common_bits):
+        if len(subset) == 1:
             # don't split singletons sets to keep the minimum shared_bits set
             encoding_subsubsets |= {subset}
         else:
             encoding_subsubsets |= findCommonBitsAndSplitRecursively(subset)
     return(encoding_subsubsets)
+
+def orderedEncodingsSets(encodings_sets):
+    """The sets in a consistent order, which as the sets are disjoint does not affect which encoding is decoded"""
+    return(sorted(encodings_sets, key=lambda enc_set: (enc_set.shared_mask, enc_set.shared_value)))
+
+class DecodeLayout():
+    """The order in which decode_a64 checks the sets, and each set's encodings"""
+
+    def __init__(self, hot, cold = [], encoding_orders = dict()):
+        self.hot = hot
+        self.cold = cold
+        self.encoding_orders = encoding_orders
+
+    def sets(self):
+        return(self.hot + self.cold)
+
+    def encodings(self, enc_set):
+        if enc_set in self.encoding_orders:
+            return(self.encoding_orders[enc_set])
+        return(enc_set.encodingsOrderedByIncreasingUnbound())
+
+def flatLayout(encodings_sets):
+    return(DecodeLayout(orderedEncodingsSets(encodings_sets)))
+
+def leafChecksOverlap(enc_set, enc_a, enc_b):
+    """Whether a word could pass the checks that decode_a64 makes for both encodings of the set"""
+    uncommonly_bound = enc_set.uncommonly_bound_mask()
+    return((enc_a.known_value ^ enc_b.known_value) & enc_a.known_mask & enc_b.known_mask & uncommonly_bound == 0)
+
+def hottestFirst(enc_set, encodings, weights):
+    """The encodings hottest-first, except that none is moved ahead of an earlier one that it overlaps"""
+    remaining = list(encodings)
+    ordered = []
+    while remaining != []:
+        for enc in sorted(remaining, key=lambda enc: -weights.get(enc, 0)):
+            earlier = remaining[:remaining.index(enc)]
+            if not any([leafChecksOverlap(enc_set, other, enc) for other in earlier]):
+                break
+        remaining.remove(enc)
+        ordered.append(enc)
+    return(ordered)
+
+def profiledLayout(encodings_sets, weights, cold_threshold = 0.0):
+    """Order the sets and their encodings hottest-first, leaving out those decoded no more than cold_threshold"""
+    set_weight = lambda enc_set: sum([weights.get(enc, 0) for enc in enc_set.encodings])
+    total = sum(weights.values())
+    # the sort is stable, so sets of equal weight stay in a consistent order
+    ordered = sorted(orderedEncodingsSets(encodings_sets), key=lambda enc_set: -set_weight(enc_set))
+    encoding_orders = dict([(enc_set, hottestFirst(enc_set, enc_set.encodingsOrderedByIncreasingUnbound(), weights))
+                            for enc_set in ordered if not enc_set.is_singleton()])
+    return(DecodeLayout([enc_set for enc_set in ordered if set_weight(enc_set) > cold_threshold * total],
+                        [enc_set for enc_set in ordered if set_weight(enc_set) <= cold_threshold * total],
+                        encoding_orders))
+
+def flatDecodeRules(encodings_sets, weights = None, layout = None):
+    """The checks that decode_a64 makes, as Rules in the order that it makes them"""
+    if layout is None:
+        layout = flatLayout(encodings_sets)
+    rules = []
+    for enc_set in layout.sets():
+        # NOTE: only the shared bits of singleton sets are checked
+        uncommonly_bound = 0 if enc_set.is_singleton() else enc_set.uncommonly_bound_mask()
+        for enc in layout.encodings(enc_set):
+            rules.append(Rule(enc_set.shared_mask | (enc.known_mask & uncommonly_bound),
+                              enc_set.shared_value | (enc.known_value & uncommonly_bound),
+                              enc,
+                              1 if weights is None else weights.get(enc, 0)))
+    return(rules)
+
+def buildEncodingsSets(instructions):
+    encodings = list(itertools.chain(*[inst.encodings for inst in instructions]))
+    encoding_set = EncodingsSet(set(encodings), {})
+    with phase("findCommonBitsAndSplitRecursively"):
+        return(set(list(findCommonBitsAndSplitRecursively(encoding_set))))
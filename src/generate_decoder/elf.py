@@ -0,0 +1,88 @@
+import mmap
+import struct
+
+ELF_MAGIC = b'\x7fELF'
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+EM_AARCH64 = 183
+SHT_NOBITS = 8
+SHF_EXECINSTR = 0x4
+PT_LOAD = 1
+PF_X = 0x1
+
+ELF_HEADER = struct.Struct('<16sHHIQQQIHHHHHH')
+SECTION_HEADER = struct.Struct('<IIQQQQIIQQ')
+PROGRAM_HEADER = struct.Struct('<IIQQQQQQ')
+
+class CodeRegion():
+    """A range of a file that holds code, and the virtual address that it is loaded at"""
+
+    def __init__(self, name, address, offset, size):
+        self.name = name
+        self.address = address
+        self.offset = offset
+        self.size = size
+
+    def __repr__(self):
+        return(f"CodeRegion({self.name!r}, {self.address:#x}, {self.offset:#x}, {self.size:#x})")
+
+def isElf(data):
+    return(bytes(data[:4]) == ELF_MAGIC)
+
+def checkInFile(data, offset, size, what):
+    if offset + size > len(data):
+        raise ValueError("The " + what + " of the ELF file run past its end")
+
+def sectionName(names, offset):
+    end = names.find(b'\0', offset)
+    return(names[offset:end if end != -1 else len(names)].decode('ascii', 'replace'))
+
+def elfCodeRegions(data):
+    """The executable sections of a little-endian AArch64 ELF file, or its executable segments if it has no sections"""
+    if len(data) < ELF_HEADER.size or not isElf(data):
+        raise ValueError("Not an ELF file")
+    (ident, _, machine, _, _, phoff, shoff, _, _, phentsize, phnum, shentsize, shnum, shstrndx) = \
+        ELF_HEADER.unpack_from(data, 0)
+    if ident[4] != ELFCLASS64 or ident[5] != ELFDATA2LSB or machine != EM_AARCH64:
+        raise ValueError("Not a little-endian, 64-bit AArch64 ELF file")
+
+    if shnum != 0 and shentsize == SECTION_HEADER.size:
+        checkInFile(data, shoff, shnum * shentsize, "section headers")
+        sections = [SECTION_HEADER.unpack_from(data, shoff + i * shentsize) for i in range(shnum)]
+        names = b''
+        if shstrndx < shnum:
+            (_, _, _, _, names_offset, names_size, _, _, _, _) = sections[shstrndx]
+            checkInFile(data, names_offset, names_size, "section names")
+            names = bytes(data[names_offset:names_offset + names_size])
+        regions = [CodeRegion(sectionName(names, name), address, offset, size)
+                   for (name, section_type, flags, address, offset, size, _, _, _, _) in sections
+                   if flags & SHF_EXECINSTR and section_type != SHT_NOBITS and size != 0]
+    else:
+        if phentsize != PROGRAM_HEADER.size:
+            raise ValueError("The ELF file has neither section headers nor program headers")
+        checkInFile(data, phoff, phnum * phentsize, "program headers")
+        segments = [PROGRAM_HEADER.unpack_from(data, phoff + i * phentsize) for i in range(phnum)]
+        regions = [CodeRegion("", address, offset, size)
+                   for (segment_type, flags, offset, address, _, size, _, _) in segments
+                   if segment_type == PT_LOAD and flags & PF_X and size != 0]
+    for region in regions:
+        checkInFile(data, region.offset, region.size, "code")
+    return(regions)
+
+def codeRegions(data, raw_address = 0):
+    """The code in the data, which is either an AArch64 ELF file, or raw instructions at raw_address"""
+    if isElf(data):
+        return(elfCodeRegions(data))
+    return([CodeRegion("", raw_address, 0, len(data))])
+
+def loadCode(path, raw_address = 0):
+    """The code in the file as (region, data) pairs, where the data is a view of the mapped file"""
+    with open(path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # NOTE: empty files can't be mapped
+            return([])
+    view = memoryview(mapped)
+    return([(region, view[region.offset:region.offset + region.size - region.size % 4])
+            for region in codeRegions(view, raw_address)])
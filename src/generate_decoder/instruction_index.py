@@ -0,0 +1,139 @@
+import functools
+import hashlib
+import os
+import re
+import sqlite3
+from parser import PARSER_VERSION
+from overlap import invertedExclusions
+
+# Bump whenever the schema changes, so that indices built by older versions are rebuilt
+INDEX_VERSION = 2
+INDEX_PATH = "../../cache/instructions.sqlite"
+SPEC_DIR = "../../spec/ISA_v82A_A64_xml_00bet3.1/"
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE instructions (id INTEGER PRIMARY KEY, name TEXT, filename TEXT, mnemonic TEXT, is_alias INTEGER,
+                           encoding_count INTEGER);
+CREATE TABLE encodings (instruction INTEGER, position INTEGER, id TEXT, text TEXT, known_mask INTEGER,
+                        known_value INTEGER);
+CREATE TABLE exclusions (instruction INTEGER, position INTEGER, mask INTEGER, value INTEGER);
+CREATE INDEX instructions_name ON instructions (name);
+CREATE INDEX instructions_filename ON instructions (filename);
+CREATE INDEX instructions_mnemonic ON instructions (mnemonic);
+CREATE INDEX instructions_encoding_count ON instructions (encoding_count);
+CREATE INDEX encodings_instruction ON encodings (instruction, position);
+CREATE INDEX exclusions_encoding ON exclusions (instruction, position);
+"""
+
+def specFingerprint(spec_dir):
+    """A digest of the sizes and modification times of the spec files, and of the versions of the parser and index"""
+    digest = hashlib.sha1(f"{PARSER_VERSION}:{INDEX_VERSION}".encode())
+    for entry in sorted(os.scandir(spec_dir), key=lambda entry: entry.name):
+        stat = entry.stat()
+        digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return(digest.hexdigest())
+
+@functools.lru_cache(maxsize=None)
+def compiledPattern(pattern):
+    return(re.compile(pattern))
+
+class IndexedInstruction():
+    """An instruction as read back from the index, with the attributes that the query tool prints"""
+
+    def __init__(self, name, fileName, mnemonic, is_alias):
+        self.name = name
+        self.fileName = fileName
+        self.mnemonic = mnemonic
+        self.is_alias = is_alias
+        self.encodings = []
+
+class InstructionIndex():
+    """A persistent SQLite index of the parsed instructions, which is rebuilt whenever the spec files change"""
+
+    def __init__(self, path = INDEX_PATH, spec_dir = SPEC_DIR, parse = None, rebuild = False):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.connect()
+        fingerprint = specFingerprint(spec_dir)
+        if rebuild or self.fingerprint() != fingerprint:
+            if parse is None:
+                from parser import parseAllFiles
+                parse = lambda: parseAllFiles(include_aliases=True, use_cache=not rebuild)
+            self.build(parse(), fingerprint)
+
+    def connect(self):
+        self.connection = sqlite3.connect(self.path)
+        self.connection.create_function("REGEXP", 2, lambda pattern, value: compiledPattern(pattern).search(value)
+                                        is not None, deterministic=True)
+
+    def close(self):
+        self.connection.close()
+
+    def fingerprint(self):
+        try:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        except sqlite3.DatabaseError:
+            return(None)
+        return(row[0] if row is not None else None)
+
+    def build(self, instructions, fingerprint):
+        # NOTE: the new index is built beside the old one and swapped in, so that concurrent queries never see it
+        # half-built
+        temporary_path = self.path + ".tmp"
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        with sqlite3.connect(temporary_path) as connection:
+            connection.executescript(SCHEMA)
+            for (id, inst) in enumerate(sorted(instructions, key=lambda inst: inst.fileName)):
+                connection.execute("INSERT INTO instructions VALUES (?, ?, ?, ?, ?, ?)",
+                                   (id, inst.name, inst.fileName, inst.mnemonic, inst.is_alias, len(inst.encodings)))
+                connection.executemany("INSERT INTO encodings VALUES (?, ?, ?, ?, ?, ?)",
+                                       [(id, position, enc.id, str(enc), enc.known_mask, enc.known_value)
+                                        for (position, enc) in enumerate(inst.encodings)])
+                connection.executemany("INSERT INTO exclusions VALUES (?, ?, ?, ?)",
+                                       [(id, position, mask, value) for (position, enc) in enumerate(inst.encodings)
+                                        for (mask, value) in invertedExclusions(enc)])
+            connection.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+        connection.close()
+        self.connection.close()
+        os.replace(temporary_path, self.path)
+        self.connect()
+
+    def query(self, name = None, filename = None, mnemonic = None, mnemonic_prefix = None, mnemonic_regex = None,
+              encoding_count = None, matching_word = None, binding_bit = None, include_aliases = False):
+        """The instructions that satisfy all of the given filters, ordered by filename"""
+        conditions = []
+        parameters = []
+        for (condition, value) in [("i.name = ?", name),
+                                   ("i.filename = ?", filename),
+                                   ("i.mnemonic = ?", mnemonic),
+                                   ("i.mnemonic REGEXP ?", mnemonic_regex),
+                                   ("i.encoding_count = ?", encoding_count),
+                                   ("e.known_mask & ? = e.known_value", matching_word),
+                                   # NOTE: as the spec defines it, a word doesn't match an encoding that it has the
+                                   # value of an inverted field of
+                                   ("NOT EXISTS (SELECT 1 FROM exclusions x WHERE x.instruction = e.instruction AND "
+                                    "x.position = e.position AND x.mask & ? = x.value)", matching_word),
+                                   ("e.known_mask & ? != 0", None if binding_bit is None else 1 << binding_bit)]:
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        if mnemonic_prefix is not None:
+            # NOTE: a range, rather than LIKE, so that the index on mnemonic is used, and the match is case-sensitive
+            conditions.append("i.mnemonic >= ? AND i.mnemonic < ?")
+            parameters += [mnemonic_prefix, mnemonic_prefix + "\U0010ffff"]
+        if not include_aliases:
+            conditions.append("NOT i.is_alias")
+        rows = self.connection.execute(
+            "SELECT i.id, i.name, i.filename, i.mnemonic, i.is_alias, e.text "
+            "FROM instructions i LEFT JOIN encodings e ON e.instruction = i.id"
+            + (" WHERE " + " AND ".join(conditions) if conditions != [] else "")
+            + " ORDER BY i.filename, e.position", parameters)
+        instructions = dict()
+        for (id, name, filename, mnemonic, is_alias, text) in rows:
+            if id not in instructions:
+                instructions[id] = IndexedInstruction(name, filename, mnemonic, bool(is_alias))
+            if text is not None:
+                instructions[id].encodings.append(text)
+        return(list(instructions.values()))
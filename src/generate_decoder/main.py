@@ -1,7 +1,12 @@
+import argparse
 import itertools
 from parser import parseAllFiles
-from decoder import EncodingsSet, findCommonBitsAndSplitRecursively
-from code_generator import generate_code
+from decoder import buildEncodingsSets
+from code_generator import generate_code, DECODER_TEMPLATES
+from decode_tables import MAX_ROOT_BITS
+from decode_report import decodeReport, printReport, writeReport
+from watch import watch
+from phase_profiler import startProfiling, stopProfiling, phase, printProfile, writeProfile
 
 def pop_many(count, initial_set):
     output_set = set()
@@ -18,18 +23,96 @@ def frequency_of_length_of_unbound_bit_sequences(encodings):
         print(k,",",v)
 
 if __name__ == "__main__":
-    instructions = parseAllFiles()
+    arg_parser = argparse.ArgumentParser(description='Generate the C++ decoder from the spec files.')
+    arg_parser.add_argument('--parallel', dest='parallel', action='store_const', const=True, default=False,
+                            help='Parse the spec files using a pool of worker processes.')
+    arg_parser.add_argument('--workers', dest='workers', action='store', type=int, default=None,
+                            help='Number of worker processes used by --parallel (defaults to the CPU count).')
+    arg_parser.add_argument('--no-cache', dest='use_cache', action='store_const', const=False, default=True,
+                            help='Ignore the cache of parsed spec files, and reparse all of them.')
+    arg_parser.add_argument('--parser', dest='parser_backend', action='store', choices=['dom', 'stream'], default='dom',
+                            help='Parse the spec files by building their DOMs, or in a single streaming pass.')
+    arg_parser.add_argument('--backend', dest='backend', action='store', choices=list(DECODER_TEMPLATES.keys()), default='flat',
+                            help='How decode_a64 is generated: a flat sequence of checks on each encodings set, a '
+                                 'decision tree built with a cost model, nested switch statements on opcode fields, '
+                                 'or a loop that walks lookup tables.')
+    arg_parser.add_argument('--tree-max-depth', dest='tree_max_depth', action='store', type=int, default=20,
+                            help='The maximum depth of the decision tree built for --backend=tree.')
+    arg_parser.add_argument('--switch-max-field-width', dest='switch_max_field_width', action='store', type=int, default=8,
+                            help='The widest field switched on by --backend=switch.')
+    arg_parser.add_argument('--table-root-bits', dest='table_root_bits', action='store', type=int, default=8,
+                            help='The number of top bits of the instruction, at most 16, that index the root table of --backend=table.')
+    arg_parser.add_argument('--table-field-width', dest='table_field_width', action='store', type=int, default=4,
+                            help='The widest field that indexes the tables below the root for --backend=table.')
+    arg_parser.add_argument('--decode-profile', dest='decode_profile', action='store', default=None,
+                            help='An instruction-frequency profile, of opcode counts or of instruction words from a '
+                                 'trace, by which the checks made by decode_a64 are ordered hottest-first.')
+    arg_parser.add_argument('--cold-threshold', dest='cold_threshold', action='store', type=float, default=0.0,
+                            help='With --decode-profile, the fraction of decoded instructions at or below which a set '
+                                 'of encodings is moved out of decode_a64 into a cold function.')
+    arg_parser.add_argument('--decode-cache', dest='decode_cache', action='store_const', const=True, default=False,
+                            help='Generate a per-thread cache of decoded words, which decode checks before decode_a64.')
+    arg_parser.add_argument('--decode-cache-sets', dest='decode_cache_sets', action='store', type=int, default=1024,
+                            help='The default number of sets in the decode cache, a power of two, which can be '
+                                 'overridden when compiling by defining AARCH64_DECODE_CACHE_SETS.')
+    arg_parser.add_argument('--decode-cache-ways', dest='decode_cache_ways', action='store', type=int, default=2,
+                            help='The default number of ways of each set of the decode cache, where 1 is direct-mapped, '
+                                 'which can be overridden when compiling by defining AARCH64_DECODE_CACHE_WAYS.')
+    arg_parser.add_argument('--decode-counters', dest='decode_counters', action='store_const', const=True, default=False,
+                            help='Instrument the generated decoder with per-opcode counts of the words decoded, and of '
+                                 'the conditions evaluated to decode them, when compiled with AARCH64_DECODE_COUNTERS.')
+    arg_parser.add_argument('--report', dest='report', action='store', default=None,
+                            help='Write a JSON report of the complexity of the generated decode_a64 to this file e.g. '
+                                 'the checks made to decode each encoding, and an estimate of its code size.')
+    arg_parser.add_argument('--profile', dest='profile', action='store', default=None,
+                            help='Write a JSON report of the time and memory taken by each phase of the run to this '
+                                 'file, along with counts of calls to getBit and of the encodings sets created.')
+    arg_parser.add_argument('--watch', dest='watch', action='store_const', const=True, default=False,
+                            help='Keep running, regenerating the outputs whenever the templates or spec files change.')
+    args = arg_parser.parse_args()
+    if not 0 <= args.table_root_bits <= MAX_ROOT_BITS:
+        arg_parser.error("--table-root-bits must be from 0 to %d" % MAX_ROOT_BITS)
+    if args.table_field_width < 1:
+        arg_parser.error("--table-field-width must be at least 1")
+
+    if args.profile is not None:
+        startProfiling()
+
+    parse_options = dict(parallel=args.parallel, workers=args.workers, use_cache=args.use_cache,
+                         backend=args.parser_backend)
+    with phase("parseAllFiles"):
+        instructions = parseAllFiles(**parse_options)
     print("Parsed", len(instructions), "instructions.")
 
     encodings = list(itertools.chain(*[inst.encodings for inst in instructions]))
     print(len(encodings), "encodings found.")
 
-    encoding_set = EncodingsSet(set(encodings), {})
-    encodings_sets = set(list(findCommonBitsAndSplitRecursively(encoding_set)))
+    encodings_sets = buildEncodingsSets(instructions)
 
     # # [print(str(es)) for es in encodings_sets]
 
-    generate_code(encodings_sets, instructions)
+    structure_options = dict(backend=args.backend, tree_max_depth=args.tree_max_depth,
+                             switch_max_field_width=args.switch_max_field_width,
+                             table_root_bits=args.table_root_bits, table_field_width=args.table_field_width,
+                             decode_profile=args.decode_profile, cold_threshold=args.cold_threshold)
+    decode_cache = dict(sets=args.decode_cache_sets, ways=args.decode_cache_ways) if args.decode_cache else None
+    generate_options = dict(structure_options, decode_cache=decode_cache, decode_counters=args.decode_counters)
+    with phase("generate_code"):
+        generate_code(encodings_sets, instructions, **generate_options)
+
+    if args.report is not None:
+        with phase("decodeReport"):
+            report = decodeReport(encodings_sets, **structure_options)
+        printReport(report)
+        writeReport(report, args.report)
+
+    if args.profile is not None:
+        profile = stopProfiling().report()
+        printProfile(profile)
+        writeProfile(profile, args.profile)
+
+    if args.watch:
+        watch(instructions, encodings_sets, parse_options, structure_options, generate_options, args.report)
 
     # frequency_of_length_of_unbound_bit_sequences(encodings)
 
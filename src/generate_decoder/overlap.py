@@ -0,0 +1,178 @@
+import argparse
+import itertools
+import json
+from parser import BitValueType, Bit
+from decode_profile import opcodeName
+
+# Buckets of at most this many encodings are compared pairwise, rather than split further
+LEAF_SIZE = 16
+
+def invertedExclusions(enc):
+    """The inverted fields of the encoding as (mask, value) pairs, where a word must not have the value in the mask"""
+    exclusions = []
+    for sequence in enc.bitSequences:
+        if not sequence.inverted:
+            continue
+        mask = 0
+        value = 0
+        for offset, (bitType, bitValue) in enumerate(sequence.constants):
+            if bitType != BitValueType.Unbound:
+                bit = 1 << (sequence.high_bit - offset)
+                mask |= bit
+                if bitValue == Bit.One:
+                    value |= bit
+        if mask != 0:
+            exclusions.append((mask, value))
+    return(exclusions)
+
+def masksOverlap(mask_a, value_a, mask_b, value_b):
+    return((value_a ^ value_b) & mask_a & mask_b == 0)
+
+def countWords(mask, value, exclusions):
+    """The number of words with the value in the mask, but none of the excluded values, by inclusion-exclusion"""
+    count = 0
+    for size in range(len(exclusions) + 1):
+        for subset in itertools.combinations(exclusions, size):
+            subset_mask = mask
+            subset_value = value
+            consistent = True
+            for (excluded_mask, excluded_value) in subset:
+                if not masksOverlap(subset_mask, subset_value, excluded_mask, excluded_value):
+                    consistent = False
+                    break
+                subset_mask |= excluded_mask
+                subset_value |= excluded_value
+            if consistent:
+                count += (-1) ** size * (1 << (32 - subset_mask.bit_count()))
+    return(count)
+
+def wordPattern(mask, value):
+    """The words with the value in the mask, as 0s, 1s, and xs from bit 31 down"""
+    return("".join(["x" if not mask & (1 << bit) else ("1" if value & (1 << bit) else "0")
+                    for bit in range(31, -1, -1)]))
+
+class Overlap():
+    """Two encodings that some words match both of, and the causes of the overlap"""
+
+    def __init__(self, enc_a, enc_b, words):
+        self.encodings = (enc_a, enc_b)
+        self.mask = enc_a.bound_mask | enc_b.bound_mask
+        self.value = enc_a.bound_value | enc_b.bound_value
+        self.words = words
+        self.order_dependent = masksOverlap(enc_a.known_mask, enc_a.known_value, enc_b.known_mask, enc_b.known_value)
+        self.causes = []
+        if not self.order_dependent:
+            self.causes.append('unpredictable')
+        if words != 1 << (32 - self.mask.bit_count()):
+            self.causes.append('inverted')
+        if enc_a.instruction.is_alias or enc_b.instruction.is_alias:
+            self.causes.append('alias')
+
+    def pattern(self):
+        return(wordPattern(self.mask, self.value))
+
+def splitBit(encodings, used_mask):
+    """The bit, not in used_mask, that is bound in the most encodings on both sides, or None if none is"""
+    best = (0, None)
+    for bit in range(32):
+        if used_mask & (1 << bit):
+            continue
+        ones = sum([1 for enc in encodings if enc.bound_mask & enc.bound_value & (1 << bit)])
+        zeros = sum([1 for enc in encodings if enc.bound_mask & ~enc.bound_value & (1 << bit)])
+        best = max(best, (min(ones, zeros), bit), key=lambda candidate: candidate[0])
+    return(best[1])
+
+def candidatePairs(encodings):
+    """The pairs of encodings that could overlap, as pairs of indices into encodings"""
+    pairs = set()
+    buckets = [(list(range(len(encodings))), 0)]
+    while buckets != []:
+        (bucket, used_mask) = buckets.pop()
+        bit = None if len(bucket) <= LEAF_SIZE else splitBit([encodings[i] for i in bucket], used_mask)
+        if bit is None:
+            pairs |= set(itertools.combinations(bucket, 2))
+            continue
+        mask = 1 << bit
+        buckets.append(([i for i in bucket if not encodings[i].bound_mask & ~encodings[i].bound_value & mask],
+                        used_mask | mask))
+        buckets.append(([i for i in bucket if not encodings[i].bound_mask & encodings[i].bound_value & mask],
+                        used_mask | mask))
+    return(pairs)
+
+def findOverlaps(encodings):
+    """Every pair of the encodings that some words match both of, as Overlaps"""
+    encodings = list(encodings)
+    overlaps = []
+    for (a, b) in sorted(candidatePairs(encodings)):
+        (enc_a, enc_b) = (encodings[a], encodings[b])
+        if not masksOverlap(enc_a.bound_mask, enc_a.bound_value, enc_b.bound_mask, enc_b.bound_value):
+            continue
+        words = countWords(enc_a.bound_mask | enc_b.bound_mask, enc_a.bound_value | enc_b.bound_value,
+                           invertedExclusions(enc_a) + invertedExclusions(enc_b))
+        if words != 0:
+            overlaps.append(Overlap(enc_a, enc_b, words))
+    return(overlaps)
+
+def overlapReport(encodings_sets):
+    """The overlapping encodings of the sets, and the sets that they are in, as a dict that can be written as JSON"""
+    set_of = dict([(enc, enc_set) for enc_set in encodings_sets for enc in enc_set.encodings])
+    overlaps = sorted(findOverlaps(sorted(set_of.keys(), key=opcodeName)),
+                      key=lambda overlap: (-overlap.words, [opcodeName(enc) for enc in overlap.encodings]))
+    sets = dict()
+    for overlap in overlaps:
+        for enc_set in {set_of[enc] for enc in overlap.encodings}:
+            sets[enc_set] = sets.get(enc_set, 0) + 1
+    causes = dict()
+    for overlap in overlaps:
+        for cause in overlap.causes:
+            causes[cause] = causes.get(cause, 0) + 1
+    return({
+        'encodings': len(set_of),
+        'overlapping_pairs': len(overlaps),
+        'order_dependent_pairs': len([overlap for overlap in overlaps if overlap.order_dependent]),
+        'cross_set_pairs': len([overlap for overlap in overlaps if set_of[overlap.encodings[0]] != set_of[overlap.encodings[1]]]),
+        'causes': causes,
+        'sets_with_overlaps': [{'shared_bits': enc_set.shared_bits_pattern(), 'encodings': len(enc_set), 'pairs': pairs}
+                               for (enc_set, pairs) in sorted(sets.items(),
+                                                              key=lambda item: (-item[1], item[0].shared_bits_pattern()))],
+        'overlaps': [{'encodings': [opcodeName(enc) for enc in overlap.encodings],
+                      'words': overlap.words,
+                      'pattern': overlap.pattern(),
+                      'order_dependent': overlap.order_dependent,
+                      'causes': overlap.causes}
+                     for overlap in overlaps],
+    })
+
+def printOverlapReport(report, top = 20):
+    print("%d encodings, %d overlapping pairs (%d order dependent, %d across sets)" % (
+        report['encodings'], report['overlapping_pairs'], report['order_dependent_pairs'], report['cross_set_pairs']))
+    for cause, count in sorted(report['causes'].items()):
+        print("  %s: %d" % (cause, count))
+    print("sets with overlaps:")
+    for enc_set in report['sets_with_overlaps'][:top]:
+        print("  %s %4d encodings %4d pairs" % (enc_set['shared_bits'], enc_set['encodings'], enc_set['pairs']))
+    print("overlaps:")
+    for overlap in report['overlaps'][:top]:
+        print("  %s %s %12d words %s%s" % (overlap['pattern'], " ".join(overlap['encodings']), overlap['words'],
+                                           "order dependent " if overlap['order_dependent'] else "",
+                                           ",".join(overlap['causes'])))
+
+if __name__ == "__main__":
+    from parser import parseAllFiles
+    from decoder import buildEncodingsSets
+
+    arg_parser = argparse.ArgumentParser(description='Find the encodings that some instruction words match more than one of.')
+    arg_parser.add_argument('-a', dest='include_aliases', action='store_const', const=True, default=False,
+                            help='Include the encodings of aliases.')
+    arg_parser.add_argument('--top', dest='top', action='store', type=int, default=20,
+                            help='The number of sets and overlaps to list.')
+    arg_parser.add_argument('--json', dest='json', action='store', default=None,
+                            help='Write the report, with every overlap, to this JSON file.')
+    args = arg_parser.parse_args()
+
+    report = overlapReport(buildEncodingsSets(parseAllFiles(include_aliases=args.include_aliases)))
+    printOverlapReport(report, args.top)
+    if args.json is not None:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+        print("Written to", args.json)
@@ -1,7 +1,17 @@
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from xml.dom.minidom import parse
+import itertools
+import os
 import xml.dom.minidom
+import xml.parsers.expat
 import re
+from spec_cache import SpecCache
+from phase_profiler import phase, count, countCalls, fileTime, profiling, addFileTime, timed
+
+# Bump whenever the parsed model changes, so that stale entries in the on-disk cache are discarded
+PARSER_VERSION = 1
+CACHE_PATH = "../../cache/spec.pickle"
 
 class Bit(Enum):
     Zero = 0
@@ -40,6 +50,21 @@ def strBitValue(bitValuePair):
         return(decodings[bitValuePair])
     raise ValueError("Unknown bit value: " + bitValuePair)
 
+WORD_MASK = 0xFFFFFFFF
+
+def bitIndexMask(index):
+    """The mask of a bit indexed from the left, as getBit does, where 0 corresponds to bit 31"""
+    return(1 << (31 - index))
+
+def maskOfBitIndices(indices):
+    mask = 0
+    for index in indices:
+        mask |= bitIndexMask(index)
+    return(mask)
+
+def bitIndicesOfMask(mask):
+    return(set([i for i in range(0,32) if mask & bitIndexMask(i)]))
+
 def getAttr(element, name, default):
     """Similar API to getAttr, but for DOM Elements"""
     return element.getAttribute(name) if element.hasAttribute(name) else default
@@ -72,13 +97,27 @@ class BitSequence(XmlDecoder):
         self.constants = [readBitValue(c) for c in constants]
 
     def parse(self, xmlNode, isT16):
-        self.high_bit = int(xmlNode.getAttribute("hibit"))
+        self.set_values(xmlNode.getAttribute("hibit"),
+                        getAttr(xmlNode, "width", 1),
+                        getAttr(xmlNode, "name", "_"),
+                        [c.childNodes[0].data for c in xmlNode.getElementsByTagName("c") if len(c.childNodes) > 0],
+                        isT16)
+
+    def set_values(self, hibit, width, name, constants, isT16):
+        self.high_bit = int(hibit)
         if isT16:
             self.high_bit = self.high_bit - 16
-        self.width = int(getAttr(xmlNode, "width", 1))
+        self.width = int(width)
         self.low_bit = self.high_bit - self.width + 1
-        self.name = getAttr(xmlNode, "name", "_")
-        self.parse_values([c.childNodes[0].data for c in xmlNode.getElementsByTagName("c") if len(c.childNodes) > 0 is not None])
+        self.name = name
+        self.parse_values(constants)
+
+    @classmethod
+    def from_values(cls, hibit, width, name, constants, isT16):
+        """For parser backends that extract the box's attributes and constants without building a DOM"""
+        sequence = cls.__new__(cls)
+        sequence.set_values(hibit, width, name, constants, isT16)
+        return(sequence)
 
 class Encoding(XmlDecoder):
 
@@ -92,11 +131,52 @@ class Encoding(XmlDecoder):
     def parse(self, xmlNode):
         regDiagram = xmlNode.getElementsByTagName("regdiagram")[0]
         isT16 = regDiagram.getAttribute("form") == "16"
-        self.psname = regDiagram.getAttribute("psname")
-        self.id = xmlNode.getAttribute("id")
-        self.instruction_set = "T16" if isT16 else xmlNode.getAttribute("isa")
-        self.bitSequences = [BitSequence(boxNode, isT16) for boxNode in regDiagram.getElementsByTagName("box")]
+        self.set_values(xmlNode.getAttribute("id"),
+                        xmlNode.getAttribute("isa"),
+                        regDiagram.getAttribute("psname"),
+                        isT16,
+                        [BitSequence(boxNode, isT16) for boxNode in regDiagram.getElementsByTagName("box")])
+
+    def set_values(self, id, isa, psname, isT16, bitSequences):
+        self.psname = psname
+        self.id = id
+        self.instruction_set = "T16" if isT16 else isa
+        self.bitSequences = bitSequences
         self.total_bit_sequence_length = sum([seq.width for seq in self.bitSequences])
+        self.compile_masks()
+
+    @classmethod
+    def from_values(cls, instruction, id, isa, psname, isT16, bitSequences):
+        """For parser backends that extract the iclass's attributes without building a DOM"""
+        encoding = cls.__new__(cls)
+        encoding.instruction = instruction
+        encoding.set_values(id, isa, psname, isT16, bitSequences)
+        return(encoding)
+
+    def compile_masks(self):
+        """Precompute the bitmasks used when building the decoder, indexed by the bit's position in the word"""
+        self.bound_mask = 0
+        self.bound_value = 0
+        self.unpredictable_mask = 0
+        self.unpredictable_value = 0
+        self.inverted_mask = 0
+        for sequence in self.bitSequences:
+            for offset, (bitType, bitValue) in enumerate(sequence.constants):
+                bit = 1 << (sequence.high_bit - offset)
+                if sequence.inverted:
+                    self.inverted_mask |= bit
+                elif bitType == BitValueType.Bound:
+                    self.bound_mask |= bit
+                    if bitValue == Bit.One:
+                        self.bound_value |= bit
+                elif bitType == BitValueType.Unpredictably_bound:
+                    self.unpredictable_mask |= bit
+                    if bitValue == Bit.One:
+                        self.unpredictable_value |= bit
+        # NOTE: inverted bit sequences are treated as unbound, as with getBit
+        self.known_mask = self.bound_mask | self.unpredictable_mask
+        self.known_value = self.bound_value | self.unpredictable_value
+        self.unbound_mask = WORD_MASK & ~self.known_mask
 
     def getSequenceByBitIndex(self, index):
         index_of_remainder = index
@@ -109,10 +189,15 @@ class Encoding(XmlDecoder):
     # NOTE: inverted bit sequences are treated as unbound for uniquely distinguishing encodings
     # NOTE: this is indexed from the left, where 0 corresponds to the highest position (leftmost)
     def getBit(self, index):
-        sequence = self.getSequenceByBitIndex(index)
-        if sequence.inverted:
-            return((BitValueType.Unbound, None))
-        return(sequence.constants[index - (31 - sequence.high_bit)])
+        if not 0 <= index < self.total_bit_sequence_length:
+            raise ValueError("index (" + str(index) + ") > length of instruction (" + str(self.total_bit_sequence_length) + ")")
+        bit = bitIndexMask(index)
+        value = Bit.One if self.known_value & bit else Bit.Zero
+        if self.bound_mask & bit:
+            return((BitValueType.Bound, value))
+        if self.unpredictable_mask & bit:
+            return((BitValueType.Unpredictably_bound, value))
+        return((BitValueType.Unbound, None))
 
     def getBitRange(self, lower, upper):
         return([self.getBit(i) for i in range(lower, upper)])
@@ -121,12 +206,7 @@ class Encoding(XmlDecoder):
         return(dict([(i,self.getBit(i)) for i in set_of_positions]))
 
     def unbound_count(self):
-        count = 0
-        for i in range(0,32):
-            (bitType, _) = self.getBit(i)
-            if bitType == BitValueType.Unbound:
-                count += 1
-        return(count)
+        return(self.unbound_mask.bit_count())
 
     def named_bit_sequences(self):
         return([bs for bs in self.bitSequences if bs.name != "_"])
@@ -144,6 +224,9 @@ class Encoding(XmlDecoder):
             size_dict[current_count] = size_dict.get(current_count, 0) + 1
         return(size_dict)
 
+# NOTE: counted only whilst profiling, as it is called for every bit of every encoding
+countCalls(Encoding, 'getBit', 'getBit_calls')
+
 
 class Instruction(XmlDecoder):
 
@@ -163,11 +246,10 @@ class Instruction(XmlDecoder):
 
     def parse(self, xmlNode):
         instNode = xmlNode.getElementsByTagName("instructionsection")[0]
-        self.name = instNode.getElementsByTagName("heading")[0].childNodes[0].data
-        self.id = getAttr(instNode, "id", None)
-        docvars = Instruction.parse_docvars(instNode)
-        self.mnemonic = docvars["mnemonic"] if "mnemonic" in docvars else instNode.getAttribute('id')
-        self.is_alias = getAttr(instNode, "type", "instruction") == "alias"
+        self.set_values(instNode.getElementsByTagName("heading")[0].childNodes[0].data,
+                        getAttr(instNode, "id", None),
+                        getAttr(instNode, "type", "instruction"),
+                        Instruction.parse_docvars(instNode))
         self.encodings = [Encoding(iclass, self) for iclass in instNode.getElementsByTagName("iclass")]
         if self.is_alias:
             self.aliasto_filename = instNode.getElementsByTagName('aliasto')[0].getAttribute('refiform')
@@ -176,6 +258,20 @@ class Instruction(XmlDecoder):
             self.aliaslist_filenames = set([aliasref.getAttribute('aliasfile') for aliasref
                                         in alias_list_node.getElementsByTagName('aliasref')])
 
+    def set_values(self, name, id, type, docvars):
+        self.name = name
+        self.id = id
+        self.mnemonic = docvars["mnemonic"] if "mnemonic" in docvars else (id or "")
+        self.is_alias = type == "alias"
+
+    @classmethod
+    def from_values(cls, fileName, name, id, type, docvars):
+        """For parser backends that extract the instructionsection's data without building a DOM"""
+        inst = cls.__new__(cls)
+        inst.fileName = fileName
+        inst.set_values(name, id, type, docvars)
+        return(inst)
+
     def update_alias_references(self, filename_inst_mapping):
         if self.is_alias:
             self.aliasto = filename_inst_mapping[self.aliasto_filename]
@@ -199,28 +295,220 @@ def xmlFileNames(indexFilePath):
     iforms = indexXml.getElementsByTagName('iform')
     return([iform.getAttribute('iformfile') for iform in iforms])
 
-def parseAllFiles(include_aliases = False):
+class InstructionSectionHandler():
+    """Collects the data needed for an Instruction in a single streaming pass over an instruction file"""
+
+    def __init__(self):
+        self.depth = 0
+        self.open = dict()      # the depth of each of the elements of interest that is currently open
+        self.section = None
+        self.finished = False
+        self.malformed = False
+        self.heading = None
+        self.docvars = None
+        self.aliasto = None
+        self.aliasrefs = None
+        self.iclasses = []
+        self.capture = None
+
+    def start_capture(self, on_text):
+        """Capture the element's first child text node, as DOM's childNodes[0].data"""
+        self.capture = ([], on_text)
+
+    def stop_capture(self, at_child_element):
+        if self.capture is None:
+            return
+        (chunks, on_text) = self.capture
+        self.capture = None
+        if chunks != []:
+            on_text("".join(chunks))
+        elif at_child_element:
+            self.malformed = True
+
+    def characters(self, data):
+        if self.capture is not None:
+            self.capture[0].append(data)
+
+    def start(self, name, attrs):
+        self.stop_capture(True)
+        self.depth += 1
+        if self.finished:
+            return
+        if self.section is None:
+            if name == "instructionsection":
+                self.section = attrs
+                self.open[name] = self.depth
+            return
+        if name == "heading" and self.heading is None:
+            self.heading = []
+            self.start_capture(self.heading.append)
+        elif name == "docvars" and self.docvars is None:
+            self.docvars = dict()
+            self.open[name] = self.depth
+        elif name == "docvar" and "docvars" in self.open:
+            self.docvars[attrs.get("key", "")] = attrs.get("value", "")
+        elif name == "aliasto" and self.aliasto is None:
+            self.aliasto = attrs.get("refiform", "")
+        elif name == "alias_list" and self.aliasrefs is None:
+            self.aliasrefs = set()
+            self.open[name] = self.depth
+        elif name == "aliasref" and "alias_list" in self.open:
+            self.aliasrefs |= {attrs.get("aliasfile", "")}
+        elif name == "iclass":
+            self.iclasses.append({"attrs": attrs, "regdiagram": None, "boxes": []})
+            self.open[name] = self.depth
+        elif name == "regdiagram" and "iclass" in self.open and self.iclasses[-1]["regdiagram"] is None:
+            self.iclasses[-1]["regdiagram"] = attrs
+            self.open[name] = self.depth
+        elif name == "box" and "regdiagram" in self.open:
+            self.iclasses[-1]["boxes"].append((attrs, []))
+            self.open[name] = self.depth
+        elif name == "c" and "box" in self.open:
+            self.start_capture(self.iclasses[-1]["boxes"][-1][1].append)
+
+    def end(self, name):
+        self.stop_capture(False)
+        if self.open.get(name) == self.depth:
+            del self.open[name]
+            if name == "instructionsection":
+                self.finished = True
+        self.depth -= 1
+
+    def instruction(self, fileName):
+        if self.section is None or self.malformed or not self.heading or self.docvars is None:
+            raise ValueError("Missing data in", fileName)
+        inst = Instruction.from_values(fileName, self.heading[0], self.section.get("id", None),
+                                       self.section.get("type", "instruction"), self.docvars)
+        inst.encodings = []
+        for iclass in self.iclasses:
+            isT16 = iclass["regdiagram"].get("form", "") == "16"
+            bitSequences = [BitSequence.from_values(attrs.get("hibit", ""), attrs.get("width", 1), attrs.get("name", "_"),
+                                                    constants, isT16)
+                            for (attrs, constants) in iclass["boxes"]]
+            inst.encodings.append(Encoding.from_values(inst, iclass["attrs"].get("id", ""), iclass["attrs"].get("isa", ""),
+                                                       iclass["regdiagram"].get("psname", ""), isT16, bitSequences))
+        if inst.is_alias:
+            if self.aliasto is None:
+                raise ValueError("Missing data in", fileName)
+            inst.aliasto_filename = self.aliasto
+        else:
+            if self.aliasrefs is None:
+                raise ValueError("Missing data in", fileName)
+            inst.aliaslist_filenames = self.aliasrefs
+        return(inst)
+
+def streamFile(path, start, end, characters = None):
+    parser = xml.parsers.expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    if characters is not None:
+        parser.CharacterDataHandler = characters
+    with open(path, 'rb') as file:
+        parser.ParseFile(file)
+
+def parseInstructionStream(xmlDir, xmlFile):
+    """As parseInstruction, but in a single streaming pass over the file rather than by building its DOM"""
+    handler = InstructionSectionHandler()
+    try:
+        streamFile(xmlDir + xmlFile, handler.start, handler.end, handler.characters)
+    except xml.parsers.expat.ExpatError:
+        raise ValueError("Failed to parse", xmlFile)
+    try:
+        return(handler.instruction(xmlFile))
+    except:
+        raise ValueError("Missing data in", xmlFile)
+
+def xmlFileNamesStream(indexFilePath):
+    """As xmlFileNames, but in a single streaming pass over the index file rather than by building its DOM"""
+    fileNames = []
+    def start(name, attrs):
+        if name == 'iform':
+            fileNames.append(attrs.get('iformfile', ''))
+    streamFile(indexFilePath, start, lambda name: None)
+    return(fileNames)
+
+# The parser backends, which each produce identical Instructions
+PARSER_BACKENDS = {
+    "dom": (xmlFileNames, parseInstruction),
+    "stream": (xmlFileNamesStream, parseInstructionStream)
+}
+
+def parseFiles(xmlDir, xmlFiles, parallel = False, workers = None, cache = None, backend = "dom"):
+    """Parse each of the instruction files that aren't in the cache, returning a mapping from filename to Instruction"""
+    instructions = dict()
+    if cache is not None:
+        for xmlFile in xmlFiles:
+            inst = cache.lookup(xmlDir + xmlFile)
+            if inst is not None:
+                instructions[xmlFile] = inst
+    toParse = [xmlFile for xmlFile in xmlFiles if xmlFile not in instructions]
+    count('files_from_cache', len(instructions))
+    count('files_parsed', len(toParse))
+    (_, parseFile) = PARSER_BACKENDS[backend]
+    if not parallel:
+        parsed = []
+        for xmlFile in toParse:
+            with fileTime(xmlFile):
+                parsed.append(parseFile(xmlDir, xmlFile))
+    elif toParse != []:
+        workers = workers or os.cpu_count()
+        chunksize = max(1, len(toParse) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if not profiling():
+                parsed = list(executor.map(parseFile, itertools.repeat(xmlDir), toParse, chunksize=chunksize))
+            else:
+                # NOTE: each file is timed in its worker, so the times are of parsing alone, not of pickling
+                timings = list(executor.map(timed, itertools.repeat(parseFile), itertools.repeat(xmlDir), toParse,
+                                            chunksize=chunksize))
+                parsed = [inst for (inst, _) in timings]
+                for xmlFile, (_, seconds) in zip(toParse, timings):
+                    addFileTime(xmlFile, seconds)
+    else:
+        parsed = []
+    for xmlFile, inst in zip(toParse, parsed):
+        if cache is not None:
+            cache.store(xmlDir + xmlFile, inst)
+        instructions[xmlFile] = inst
+    return(dict([(xmlFile, instructions[xmlFile]) for xmlFile in xmlFiles]))
+
+def resolveAliases(instructions_and_aliases):
+    """Convert alias filenames to object references, returning just those that are not aliases"""
+    just_instructions = set()
+    for filename, inst in instructions_and_aliases.items():
+        if not inst.is_alias:
+            just_instructions |= {inst}
+        inst.update_alias_references(instructions_and_aliases)
+    return(just_instructions)
+
+def parseAllFiles(include_aliases = False, parallel = False, workers = None, use_cache = True, backend = "dom"):
     xmlDir = "../../spec/ISA_v82A_A64_xml_00bet3.1/"
+    with phase("load cache"):
+        cache = SpecCache(CACHE_PATH, PARSER_VERSION) if use_cache else None
+    (readIndexFile, _) = PARSER_BACKENDS[backend]
+
+    def indexFileNames(indexFilePath):
+        return(readIndexFile(indexFilePath) if cache is None else cache.get(indexFilePath, readIndexFile))
 
-    baseInstructions_indexFile = xmlDir + "index.xml"
-    baseInstructions_xmlFilePaths = xmlFileNames(baseInstructions_indexFile)
+    with phase("parse index files"):
+        baseInstructions_indexFile = xmlDir + "index.xml"
+        baseInstructions_xmlFilePaths = indexFileNames(baseInstructions_indexFile)
 
-    fpsimdInstructions_indexFile = xmlDir + "fpsimdindex.xml"
-    fpsimdInstructions_xmlFilePaths = xmlFileNames(fpsimdInstructions_indexFile)
+        fpsimdInstructions_indexFile = xmlDir + "fpsimdindex.xml"
+        fpsimdInstructions_xmlFilePaths = indexFileNames(fpsimdInstructions_indexFile)
 
     xmlFiles = baseInstructions_xmlFilePaths + fpsimdInstructions_xmlFilePaths
 
-    instructions_and_aliases = dict([(xmlFile, parseInstruction(xmlDir, xmlFile)) for xmlFile in xmlFiles])
+    with phase("parse instruction files"):
+        instructions_and_aliases = parseFiles(xmlDir, xmlFiles, parallel, workers, cache, backend)
+
+    # the cache must be saved before the alias references are resolved, so that each entry only holds its own file's data
+    if cache is not None:
+        with phase("save cache"):
+            cache.save()
 
     if(include_aliases):
         return(instructions_and_aliases.values())
 
-    # Convert alias filenames to object references
-    just_instructions = set()
-    for filename, inst in instructions_and_aliases.items():
-        if not inst.is_alias:
-            just_instructions |= {inst}
-        inst.update_alias_references(instructions_and_aliases)
-
-    return(just_instructions)
-
+    with phase("resolve aliases"):
+        return(resolveAliases(instructions_and_aliases))
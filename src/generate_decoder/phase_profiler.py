@@ -0,0 +1,164 @@
+from contextlib import contextmanager
+import json
+import time
+import tracemalloc
+
+# The counters that are always reported, even if nothing is counted by them
+COUNTERS = [
+    'files_from_cache',         # spec files whose Instructions were in the cache
+    'files_parsed',             # spec files that were parsed
+    'getBit_calls',
+    'sets_created',             # EncodingsSets, including those that are split further
+    'empty_sets_created',       # EncodingsSets left empty by a split, which are of no use to the decoder
+]
+
+class Phase():
+    """The wall-clock and CPU time of a phase of a run, and the most memory that tracemalloc traced whilst it ran"""
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory = 0
+        self.memory_change = 0
+
+class PhaseProfiler():
+    """Records the phases of a run, which may be nested, and counts of events within them"""
+
+    def __init__(self):
+        self.phases = []
+        self.running = []
+        self.counters = dict([(name, 0) for name in COUNTERS])
+        self.file_times = dict()
+
+    @contextmanager
+    def phase(self, name):
+        entry = Phase(name, len(self.running))
+        self.phases.append(entry)
+        (start_memory, peak) = tracemalloc.get_traced_memory()
+        # NOTE: the peak so far is kept by the enclosing phase, as the peak is reset for this one
+        if self.running != []:
+            self.running[-1].peak_memory = max(self.running[-1].peak_memory, peak)
+        tracemalloc.reset_peak()
+        self.running.append(entry)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield entry
+        finally:
+            entry.wall_time = time.perf_counter() - start_wall
+            entry.cpu_time = time.process_time() - start_cpu
+            (end_memory, peak) = tracemalloc.get_traced_memory()
+            entry.peak_memory = max(entry.peak_memory, peak)
+            entry.memory_change = end_memory - start_memory
+            self.running.pop()
+            if self.running != []:
+                self.running[-1].peak_memory = max(self.running[-1].peak_memory, entry.peak_memory)
+
+    def count(self, name, n = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def file_time(self, name, seconds):
+        self.file_times[name] = self.file_times.get(name, 0.0) + seconds
+
+    def report(self, slowest_files = 10):
+        """The phases, counters, and slowest files to parse, as a dict that can be written as JSON"""
+        return({
+            'phases': [{'name': phase.name, 'depth': phase.depth, 'wall_time': phase.wall_time,
+                        'cpu_time': phase.cpu_time, 'peak_memory': phase.peak_memory,
+                        'memory_change': phase.memory_change}
+                       for phase in self.phases],
+            'counters': dict(sorted(self.counters.items())),
+            'slowest_files': sorted(self.file_times.items(), key=lambda item: -item[1])[:slowest_files],
+        })
+
+# the profiler of this run, or None if it isn't being profiled
+_profiler = None
+# the methods whose calls are counted whilst profiling, as (class, method name, counter) tuples
+_counted_methods = []
+
+def countCalls(cls, name, counter):
+    """Count the calls to the method of the class whilst profiling, which are otherwise left as they are"""
+    _counted_methods.append((cls, name, counter))
+
+def _counting(method, counter):
+    def counted(*args, **kwargs):
+        _profiler.count(counter)
+        return(method(*args, **kwargs))
+    counted.uncounted = method
+    return(counted)
+
+def startProfiling():
+    global _profiler
+    tracemalloc.start()
+    _profiler = PhaseProfiler()
+    for (cls, name, counter) in _counted_methods:
+        setattr(cls, name, _counting(getattr(cls, name), counter))
+    return(_profiler)
+
+def stopProfiling():
+    """Stop profiling, returning the profiler of the run"""
+    global _profiler
+    for (cls, name, _) in _counted_methods:
+        setattr(cls, name, getattr(cls, name).uncounted)
+    (profiler, _profiler) = (_profiler, None)
+    tracemalloc.stop()
+    return(profiler)
+
+def profiling():
+    return(_profiler is not None)
+
+@contextmanager
+def phase(name):
+    """Record the code run within this as a phase, if the run is being profiled"""
+    if _profiler is None:
+        yield None
+    else:
+        with _profiler.phase(name) as entry:
+            yield entry
+
+def count(name, n = 1):
+    if _profiler is not None:
+        _profiler.count(name, n)
+
+@contextmanager
+def fileTime(name):
+    """Record the wall-clock time taken by the code run within this against the file, if the run is being profiled"""
+    if _profiler is None:
+        yield
+    else:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _profiler.file_time(name, time.perf_counter() - start)
+
+def addFileTime(name, seconds):
+    """Record the time taken to parse a file elsewhere e.g. in a worker process, if the run is being profiled"""
+    if _profiler is not None:
+        _profiler.file_time(name, seconds)
+
+def timed(function, *args):
+    """The result of the function, and the wall-clock time it took, as a pair"""
+    start = time.perf_counter()
+    result = function(*args)
+    return((result, time.perf_counter() - start))
+
+def printProfile(report):
+    print("%-40s %10s %10s %12s %12s" % ("phase", "wall (s)", "cpu (s)", "peak (KiB)", "change (KiB)"))
+    for entry in report['phases']:
+        print("%-40s %10.3f %10.3f %12d %12d" % ("  " * entry['depth'] + entry['name'], entry['wall_time'],
+                                                 entry['cpu_time'], entry['peak_memory'] // 1024,
+                                                 entry['memory_change'] // 1024))
+    for name, value in report['counters'].items():
+        print("%s: %d" % (name, value))
+    if report['slowest_files'] != []:
+        print("slowest files to parse:")
+        for name, seconds in report['slowest_files']:
+            print("  %-60s %.4f" % (name, seconds))
+
+def writeProfile(report, path):
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2)
+    print("Written to", path)
@@ -1,5 +1,5 @@
 import argparse
-import distutils.util
+from instruction_index import InstructionIndex
 from parser import parseAllFiles
 
 
@@ -8,6 +8,10 @@ parser.add_argument('-c', dest='output_count', action='store_const', const=True,
                     help='Count the number of results and output that only')
 parser.add_argument('-a', dest='include_aliases', action='store_const', const=True, default=False,
                     help='Toggle for whether to include aliases.')
+parser.add_argument('--no-cache', dest='use_cache', action='store_const', const=False, default=True,
+                    help='Ignore the cache of parsed spec files, and the index of their instructions, and rebuild both.')
+parser.add_argument('--parser', dest='parser_backend', action='store', choices=['dom', 'stream'], default='dom',
+                    help='Parse the spec files by building their DOMs, or in a single streaming pass, when the index is rebuilt.')
 
 parser.add_argument('--q-name', dest='query_name', action='store',
                     help='Filter the instructions by their name')
@@ -15,27 +19,44 @@ parser.add_argument('--q-filename', dest='query_filename', action='store',
                     help='Filter the instructions by the specified filename.')
 parser.add_argument('--q-mnemonic', dest='query_mnemonic', action='store',
                     help='Filter the instructions by the specified mnemonic.')
+parser.add_argument('--q-mnemonic-prefix', dest='query_mnemonic_prefix', action='store',
+                    help='Filter the instructions by the start of their mnemonic.')
+parser.add_argument('--q-mnemonic-regex', dest='query_mnemonic_regex', action='store',
+                    help='Filter the instructions by a regular expression that is searched for in their mnemonic.')
 parser.add_argument('--q-encoding-count', dest='query_encoding_count', action='store',
                     help='Filter the instructions by the number of encodings that they have,')
+parser.add_argument('--q-word', dest='query_word', action='store', type=lambda word: int(word, 0),
+                    help='Filter the encodings by whether they match the given instruction word e.g. 0xd503201f.')
+parser.add_argument('--q-bit', dest='query_bit', action='store', type=int, choices=range(32), metavar='N',
+                    help='Filter the encodings by whether they bind bit N of the word, where bit 31 is the highest.')
 
 args = parser.parse_args()
 
-if(args.query_mnemonic is not None and any(filter(str.islower, args.query_mnemonic))):
-   print("Are you sure the query is correct? Mnemonic should be all uppercase.")
+for mnemonic in [args.query_mnemonic, args.query_mnemonic_prefix]:
+   if(mnemonic is not None and any(filter(str.islower, mnemonic))):
+      print("Are you sure the query is correct? Mnemonic should be all uppercase.")
 
-instructions = parseAllFiles(include_aliases=args.include_aliases)
+# NOTE: the spec is only reparsed when it has changed since the index was built
+index = InstructionIndex(parse=lambda: parseAllFiles(include_aliases=True, use_cache=args.use_cache,
+                                                     backend=args.parser_backend),
+                         rebuild=not args.use_cache)
 
-filtered_instructions = [i for i in instructions if
-                         (args.query_name == None or i.name == args.query_name) and
-                         (args.query_filename == None or i.fileName == args.query_filename) and
-                         (args.query_mnemonic == None or i.mnemonic == args.query_mnemonic) and
-                         (args.query_encoding_count == None or str(len(i.encodings)) == args.query_encoding_count)
-]
+filtered_instructions = index.query(name=args.query_name,
+                                    filename=args.query_filename,
+                                    mnemonic=args.query_mnemonic,
+                                    mnemonic_prefix=args.query_mnemonic_prefix,
+                                    mnemonic_regex=args.query_mnemonic_regex,
+                                    encoding_count=args.query_encoding_count,
+                                    matching_word=args.query_word,
+                                    binding_bit=args.query_bit,
+                                    include_aliases=args.include_aliases)
 
 if(args.output_count):
    print(len(filtered_instructions))
 else:
    if(len(filtered_instructions) > 10):
+      # NOTE: imported here as distutils takes longer to import than the query takes to answer
+      import distutils.util
       print("There are", len(filtered_instructions), "results. Print all?")
       if(not distutils.util.strtobool(input())):
          exit()
@@ -0,0 +1,99 @@
+# A decoder for instruction words in Python, which decodes exactly as the generated decode_a64 does, for checking
+# the generated decoders and for analysing binaries without a C++ toolchain. NumPy must be installed.
+
+import sys
+import numpy as np
+from decoder import flatDecodeRules
+from decision_tree import buildDecisionTree, treeNodes, treeDepth
+from decode_profile import opcodeName
+
+def opcodeOrder(instructions):
+    """The encodings in the order of the aarch64_opcodes enum, so that an encoding's index is its opcode's value"""
+    ordered = sorted(sorted(instructions, key=lambda inst: inst.fileName), key=lambda inst: inst.mnemonic.lower())
+    return([enc for inst in ordered for enc in inst.encodings])
+
+def asWords(data):
+    """The data as an array of instruction words, where raw bytes are read as little-endian without being copied"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return(np.frombuffer(data, dtype='<u4', count=len(data) // 4))
+    return(np.asarray(data, dtype=np.uint32))
+
+class ReferenceDecoder():
+    """Decodes arrays of instruction words to opcodes, where aarch64_unknown is -1"""
+
+    def __init__(self, encodings_sets, instructions, max_depth = 20, max_field_width = 4):
+        self.encodings = opcodeOrder(instructions)
+        opcodes = dict([(enc, i) for i, enc in enumerate(self.encodings)])
+        # NOTE: wider fields make for a shallower tree, and so fewer passes over the words
+        tree = buildDecisionTree(flatDecodeRules(encodings_sets), max_depth=max_depth, max_field_width=max_field_width)
+        nodes = list(treeNodes(tree))
+        node_index = dict([(id(node), i) for i, node in enumerate(nodes)])
+
+        self.low_bit = np.zeros(len(nodes), dtype=np.uint32)
+        self.field_mask = np.zeros(len(nodes), dtype=np.uint32)
+        self.first_child = np.zeros(len(nodes), dtype=np.int64)
+        self.first_rule = np.zeros(len(nodes), dtype=np.int64)
+        self.rule_count = np.zeros(len(nodes), dtype=np.int64)
+        children = []
+        rules = []
+        for i, node in enumerate(nodes):
+            self.first_child[i] = len(children)
+            if node.is_leaf():
+                # NOTE: a leaf is its own only child, so that words already at a leaf stay there
+                children.append(i)
+                self.first_rule[i] = len(rules)
+                self.rule_count[i] = len(node.rules)
+                rules.extend(node.rules)
+            else:
+                self.low_bit[i] = node.low_bit
+                self.field_mask[i] = (1 << node.width()) - 1
+                children.extend([node_index[id(child)] for child in node.children])
+        self.children = np.array(children, dtype=np.int64)
+        self.rule_mask = np.array([rule.mask for rule in rules], dtype=np.uint32)
+        self.rule_value = np.array([rule.value for rule in rules], dtype=np.uint32)
+        self.rule_opcode = np.array([opcodes[rule.payload] for rule in rules], dtype=np.int32)
+        self.depth = treeDepth(tree)
+        self.max_rule_count = int(self.rule_count.max())
+
+    def decode(self, data):
+        """The opcode of each of the words, which may be given as an array or as raw bytes"""
+        words = asWords(data)
+        current = np.zeros(len(words), dtype=np.int64)
+        for _ in range(self.depth):
+            current = self.children[self.first_child[current]
+                                    + ((words >> self.low_bit[current]) & self.field_mask[current])]
+        opcodes = np.full(len(words), -1, dtype=np.int32)
+        candidates = np.arange(len(words))
+        for k in range(self.max_rule_count):
+            candidates = candidates[k < self.rule_count[current[candidates]]]
+            rule = self.first_rule[current[candidates]] + k
+            matched = (words[candidates] & self.rule_mask[rule]) == self.rule_value[rule]
+            opcodes[candidates[matched]] = self.rule_opcode[rule[matched]]
+            candidates = candidates[~matched]
+        return(opcodes)
+
+    def opcode_name(self, opcode):
+        return(opcodeName(self.encodings[opcode]) if opcode >= 0 else "aarch64_unknown")
+
+    def histogram(self, data):
+        """How often each opcode is decoded from the words, most frequent first, as (name, count) pairs"""
+        opcodes, counts = np.unique(self.decode(data), return_counts=True)
+        return(sorted([(self.opcode_name(opcode), int(count)) for opcode, count in zip(opcodes, counts)],
+                      key=lambda pair: (-pair[1], pair[0])))
+
+if __name__ == "__main__":
+    from parser import parseAllFiles
+    from decoder import buildEncodingsSets
+
+    from elf import loadCode
+
+    if len(sys.argv) != 2:
+        print("Just the path of a binary file of A64 instructions, or of an AArch64 ELF file, must be given.")
+        exit(1)
+
+    instructions = parseAllFiles()
+    decoder = ReferenceDecoder(buildEncodingsSets(instructions), instructions)
+    words = np.concatenate([asWords(code) for _, code in loadCode(sys.argv[1])] + [np.zeros(0, dtype=np.uint32)])
+    # the histogram is printed in the format read by main.py's --decode-profile
+    for name, count in decoder.histogram(words):
+        print(name, count)
@@ -0,0 +1,67 @@
+import hashlib
+import os
+import pickle
+
+def fileDigest(path):
+    with open(path, 'rb') as file:
+        return(hashlib.sha1(file.read()).hexdigest())
+
+class SpecCache():
+    """A persistent cache of values derived from the spec files, each valid whilst its file is unchanged"""
+
+    def __init__(self, path, version):
+        self.path = path
+        self.version = version
+        self.entries = dict()
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'rb') as file:
+                (version, entries) = pickle.load(file)
+        except (OSError, EOFError, ValueError, AttributeError, ImportError, pickle.UnpicklingError):
+            return
+        if version == self.version:
+            self.entries = entries
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, 'wb') as file:
+            pickle.dump((self.version, self.entries), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self.path)
+        self.dirty = False
+
+    @staticmethod
+    def stamp(path):
+        stat = os.stat(path)
+        return((stat.st_size, stat.st_mtime_ns))
+
+    def lookup(self, path):
+        """The cached value for the file at path, or None if there is not a valid one"""
+        if path not in self.entries:
+            return(None)
+        (stamp, digest, value) = self.entries[path]
+        new_stamp = SpecCache.stamp(path)
+        if stamp == new_stamp:
+            return(value)
+        if fileDigest(path) != digest:
+            return(None)
+        self.entries[path] = (new_stamp, digest, value)
+        self.dirty = True
+        return(value)
+
+    def store(self, path, value):
+        self.entries[path] = (SpecCache.stamp(path), fileDigest(path), value)
+        self.dirty = True
+
+    def get(self, path, derive):
+        """The cached value for the file at path, deriving and storing it if there is not a valid one"""
+        value = self.lookup(path)
+        if value is None:
+            value = derive(path)
+            self.store(path, value)
+        return(value)
@@ -0,0 +1,75 @@
+class SetsLeaf():
+    """The EncodingsSets that a word reaching this point could be in, each checked in turn"""
+
+    def __init__(self, sets, switched_mask):
+        self.sets = sets
+        self.switched_mask = switched_mask
+
+    def is_leaf(self):
+        return(True)
+
+class Switch():
+    """Switches on the field high_bit..low_bit, checking the sets of rest after the switch"""
+
+    def __init__(self, high_bit, low_bit, cases, rest):
+        self.high_bit = high_bit
+        self.low_bit = low_bit
+        self.cases = cases
+        self.rest = rest
+
+    def is_leaf(self):
+        return(False)
+
+def fieldMask(high_bit, low_bit):
+    return(((1 << (high_bit - low_bit + 1)) - 1) << low_bit)
+
+def groupSetsByField(encodings_sets, high_bit, low_bit):
+    """The sets that bind all of the field's bits grouped by the field's value, and the rest of the sets"""
+    field_mask = fieldMask(high_bit, low_bit)
+    cases = dict()
+    rest = []
+    for enc_set in encodings_sets:
+        if enc_set.shared_mask & field_mask == field_mask:
+            cases.setdefault((enc_set.shared_value & field_mask) >> low_bit, []).append(enc_set)
+        else:
+            rest.append(enc_set)
+    return(cases, rest)
+
+def expectedSetChecks(cases, rest):
+    """The cost model: the expected number of sets checked after the switch, for a word in one of the sets"""
+    total = sum([len(case) for case in cases.values()]) + len(rest)
+    return(sum([len(case) ** 2 for case in cases.values()]) / total + len(rest))
+
+def candidateFields(encodings_sets, switched_mask, max_field_width):
+    """Each field of up to max_field_width bits that some set binds, and that hasn't already been switched on"""
+    shared = 0
+    for enc_set in encodings_sets:
+        shared |= enc_set.shared_mask
+    for low_bit in range(0, 32):
+        for high_bit in range(low_bit, min(low_bit + max_field_width, 32)):
+            field_mask = fieldMask(high_bit, low_bit)
+            if field_mask & switched_mask or field_mask & ~shared:
+                break
+            yield (high_bit, low_bit)
+
+def buildSwitchTree(encodings_sets, max_field_width = 8, leaf_size = 1, switched_mask = 0):
+    """Build nested switches over fields of the sets' shared bits, for the compiler to lower into jump tables"""
+    if len(encodings_sets) <= leaf_size:
+        return(SetsLeaf(encodings_sets, switched_mask))
+    best = None
+    for (high_bit, low_bit) in candidateFields(encodings_sets, switched_mask, max_field_width):
+        (cases, rest) = groupSetsByField(encodings_sets, high_bit, low_bit)
+        if len(cases) < 2:
+            continue
+        # ties are broken in favour of narrower fields, then higher bits, so that the switches are reproducible
+        cost = (expectedSetChecks(cases, rest), high_bit - low_bit, -high_bit)
+        if best is None or cost < best[0]:
+            best = (cost, high_bit, low_bit, cases, rest)
+    if best is None or best[0][0] >= len(encodings_sets):
+        return(SetsLeaf(encodings_sets, switched_mask))
+    (_, high_bit, low_bit, cases, rest) = best
+    case_mask = switched_mask | fieldMask(high_bit, low_bit)
+    return(Switch(high_bit, low_bit,
+                  [(value, buildSwitchTree(cases[value], max_field_width, leaf_size, case_mask))
+                   for value in sorted(cases)],
+                  buildSwitchTree(rest, max_field_width, leaf_size, switched_mask) if rest != [] else None))
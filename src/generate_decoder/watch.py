@@ -0,0 +1,80 @@
+import glob
+import importlib
+import os
+import time
+import code_generator
+import decode_report
+from parser import parseAllFiles
+from decoder import buildEncodingsSets
+
+TEMPLATES_DIR = '../../templates/'
+SPEC_DIR = '../../spec/ISA_v82A_A64_xml_00bet3.1/'
+
+def modification_times(paths):
+    times = dict()
+    for path in paths:
+        try:
+            times[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return(times)
+
+def changed_paths(old_times, new_times):
+    return(set([path for path in old_times.keys() | new_times.keys() if old_times.get(path) != new_times.get(path)]))
+
+def affected_templates(changed_templates):
+    """The templates whose output may change when the given templates change, including those that import them"""
+    all_templates = ['templates/' + os.path.basename(path) for path in glob.glob(TEMPLATES_DIR + '*.jinja')]
+    affected = set(changed_templates)
+    while True:
+        dependents = set([template for template in all_templates
+                          if template not in affected and code_generator.template_dependencies(template) & affected])
+        if dependents == set():
+            return(affected)
+        affected |= dependents
+
+def watch(instructions, encodings_sets, parse_options, structure_options, generate_options, report = None,
+          interval = 0.2):
+    """Keep the parsed instructions resident, regenerating the output files as the templates or spec files change"""
+    generator_path = code_generator.__file__
+    # NOTE: the profile orders the checks, so a change to it changes the decoder as a change to the generator does
+    inputs = [generator_path]
+    if structure_options.get('decode_profile') is not None:
+        inputs.append(structure_options['decode_profile'])
+    watched = lambda: (modification_times(glob.glob(SPEC_DIR + '*.xml')),
+                       modification_times(glob.glob(TEMPLATES_DIR + '*.jinja')),
+                       modification_times(inputs))
+    (spec_times, template_times, input_times) = watched()
+    print("Watching for changes to the spec, templates, code generator, and profile...")
+    while True:
+        time.sleep(interval)
+        (new_spec_times, new_template_times, new_input_times) = watched()
+        changed_spec = changed_paths(spec_times, new_spec_times)
+        changed_templates = changed_paths(template_times, new_template_times)
+        changed_inputs = changed_paths(input_times, new_input_times)
+        (spec_times, template_times, input_times) = (new_spec_times, new_template_times, new_input_times)
+        if not (changed_spec or changed_templates or changed_inputs):
+            continue
+
+        start = time.perf_counter()
+        try:
+            if generator_path in changed_inputs:
+                importlib.reload(code_generator)
+                # NOTE: decode_report imported decoder_structures from the module before it was reloaded
+                importlib.reload(decode_report)
+            if changed_spec:
+                instructions = parseAllFiles(**parse_options)
+                encodings_sets = buildEncodingsSets(instructions)
+            if changed_spec or changed_inputs:
+                code_generator.generate_code(encodings_sets, instructions, **generate_options)
+                # the report is of the decode structure, which the templates don't change
+                if report is not None:
+                    decode_report.writeReport(decode_report.decodeReport(encodings_sets, **structure_options), report)
+            else:
+                templates = affected_templates(['templates/' + os.path.basename(path) for path in changed_templates])
+                code_generator.generate_code(encodings_sets, instructions, templates, **generate_options)
+        except Exception as error:
+            # keep watching, so that the mistake can be fixed
+            print("Failed to regenerate:", repr(error))
+            continue
+        print("Regenerated in %.3fs" % (time.perf_counter() - start))
@@ -0,0 +1,17 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+from parser import BitSequence, Encoding, Instruction
+
+def encoding(instruction, id, bits):
+    """An encoding whose bits are given as a string of 0s, 1s, and xs, most significant first"""
+    return(Encoding.from_values(instruction, id, "A64", None, False,
+                                [BitSequence.from_values(31, 32, "_", list(bits), False)]))
+
+def instruction(file_name, mnemonic, encodings_bits):
+    """An instruction with an encoding ENC<i> of each of the strings of bits, as encoding takes them"""
+    inst = Instruction.from_values(file_name, mnemonic, mnemonic + "_ID", "instruction", {"mnemonic": mnemonic})
+    inst.encodings = [encoding(inst, "ENC" + str(i), bits) for i, bits in enumerate(encodings_bits)]
+    inst.aliaslist_filenames = set()
+    return(inst)
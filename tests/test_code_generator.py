@@ -0,0 +1,48 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import tempfile
+import unittest
+from code_generator import *
+from decoder import buildEncodingsSets
+from fixtures import instruction
+
+# the templates are loaded relative to the root of the repository, as they are by main.py
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+class TestCodeGenerator(unittest.TestCase):
+
+    def test_write_if_changed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = tmp_dir + "/out.cpp"
+            self.assertTrue(write_if_changed(path, iter(["int a;", "\n"])))
+            modified = os.stat(path).st_mtime_ns
+            self.assertFalse(write_if_changed(path, iter(["int a;\n"])))
+            self.assertEqual(os.stat(path).st_mtime_ns, modified)
+            self.assertTrue(write_if_changed(path, iter(["int b;\n"])))
+            with open(path, 'r') as file:
+                self.assertEqual(file.read(), "int b;\n")
+            self.assertEqual(os.listdir(tmp_dir), ["out.cpp"])
+
+    def render_set(self, enc_set, **context):
+        env = Environment(loader=FileSystemLoader(ROOT_DIR), line_statement_prefix='£')
+        env.globals.update(TEMPLATE_GLOBALS)
+        template = env.from_string("£ import 'templates/common.jinja' as common with context\n"
+                                   "{{ common.encodings_set(enc_set, enc_set.encodingsOrderedByIncreasingUnbound(), dict()) }}")
+        return(template.render(enc_set=enc_set, **context))
+
+    def test_decode_counters(self):
+        [enc_set] = buildEncodingsSets([instruction("add.xml", "ADD", ["1" + "x" * 31])])
+        code = self.render_set(enc_set)
+        self.assertEqual(enc_set.shared_bits_pattern(), "1" + "x" * 31)
+        self.assertIn("if( BITSEL(ir, 31) == 1\n) {", code)
+        self.assertNotIn("AARCH64_DECODE", code)
+        code = self.render_set(enc_set, decode_counters=True, set_indices={enc_set: 3})
+        self.assertIn("if( AARCH64_DECODE_CONDITION(BITSEL(ir, 31) == 1)\n) {\n  AARCH64_DECODE_SET(3);", code)
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
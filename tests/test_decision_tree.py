@@ -0,0 +1,93 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import random
+import unittest
+from decision_tree import *
+
+def first_match(rules, word):
+    for rule in rules:
+        if rule.matches(word):
+            return(rule)
+    return(None)
+
+class TestDecisionTree(unittest.TestCase):
+
+    @staticmethod
+    def rules():
+        return([
+            Rule(0xFF000000, 0x12000000, "a"),
+            Rule(0xFF000000, 0x13000000, "b"),
+            Rule(0xF0000000, 0x10000000, "c"),     # overlaps a and b, so must be checked after them
+            Rule(0x80000001, 0x80000001, "d"),
+            Rule(0x80000001, 0x80000000, "e"),
+            Rule(0x00000000, 0x00000000, "f"),     # matches anything not matched above
+        ])
+
+    def test_fieldValues(self):
+        self.assertEqual(sorted(fieldValues(Rule(0b1010, 0b1000, None), 3, 0)), [0b1000, 0b1001, 0b1100, 0b1101])
+        self.assertEqual(fieldValues(Rule(0b1010, 0b1000, None), 3, 3), [1])
+
+    def test_informativeBits(self):
+        self.assertEqual(informativeBits(TestDecisionTree.rules()), 0x81000001)
+
+    def test_splitRules(self):
+        (children, likelihoods) = splitRules(TestDecisionTree.rules(), 0, 0)
+        self.assertEqual([rule.payload for rule in children[0]], ["a", "b", "c", "e", "f"])
+        self.assertEqual([rule.payload for rule in children[1]], ["a", "b", "c", "d", "f"])
+        self.assertEqual(likelihoods[0], likelihoods[1])
+
+    def test_buildDecisionTree(self):
+        rules = TestDecisionTree.rules()
+        tree = buildDecisionTree(rules)
+        self.assertFalse(tree.is_leaf())
+        random.seed(0)
+        words = [random.getrandbits(32) for i in range(1000)] + [0x12345678, 0x13000000, 0x1F000000, 0x80000001]
+        for word in words:
+            self.assertIs(tree.decode(word), first_match(rules, word))
+
+    def test_buildDecisionTree_max_depth(self):
+        rules = TestDecisionTree.rules()
+        self.assertTrue(buildDecisionTree(rules, max_depth=0).is_leaf())
+        self.assertEqual(treeDepth(buildDecisionTree(rules, max_depth=2)), 2)
+
+    def test_buildDecisionTree_weights(self):
+        rules = lambda hot_weight: [
+            Rule(0x01000001, 0x00000001, "hot", hot_weight),
+            Rule(0x01000101, 0x00000100, "a"),
+            Rule(0x01000201, 0x00000200, "b"),
+            Rule(0x01000001, 0x00000000, "c"),
+            Rule(0x01000000, 0x01000000, "d"),
+        ]
+        # splitting on bit 0 or bit 24 is equally good when all rules are equally likely...
+        self.assertEqual(buildDecisionTree(rules(1), max_depth=1).low_bit, 24)
+        # ...but only bit 0 separates the hot rule from the others
+        self.assertEqual(buildDecisionTree(rules(1000), max_depth=1).low_bit, 0)
+
+    def test_buildDecisionTree_shared(self):
+        rules = [Rule(0b101, 0b000, "a"), Rule(0b011, 0b011, "b"), Rule(0b011, 0b001, "c"), Rule(0b110, 0b110, "d")]
+        tree = buildDecisionTree(rules)
+        for word in range(8):
+            self.assertIs(tree.decode(word), first_match(rules, word))
+        # the leaf for a is reached from two places in the tree, but only built once
+        [shared] = sharedNodes(tree)
+        self.assertEqual(shared.rules, rules[:1])
+        self.assertEqual(sum([node.children.count(shared) for node in treeNodes(tree) if not node.is_leaf()]), 2)
+
+    def test_sharedNodes(self):
+        leaf = Leaf([Rule(0, 0, "a")])
+        self.assertEqual(sharedNodes(Node(0, 0, [leaf, leaf])), [leaf])
+        empty = Leaf([])
+        self.assertEqual(sharedNodes(Node(0, 0, [empty, empty])), [])
+
+    def test_treeNodes(self):
+        leaf = Leaf([])
+        tree = Node(0, 0, [leaf, leaf])
+        self.assertEqual(list(treeNodes(tree)), [tree, leaf])
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import random
+import shutil
+import subprocess
+import tempfile
+import unittest
+import numpy as np
+from code_generator import BYTECODE_CACHE_DIR, generate_code
+from decoder import buildEncodingsSets
+from decode_simulator import DecodeSimulator
+from fixtures import instruction
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Decodes the words of the file with the generated decoder, writing its decode counters
+COUNTERS_DRIVER = """
+#include <stdio.h>
+#include "arm64-decode.cpp"
+using namespace captive::arch::aarch64;
+int main(int argc, char *argv[]) {
+  FILE *file = fopen(argv[1], "rb");
+  uint32_t word;
+  aarch64_decode_a64 decoder;
+  while (fread(&word, sizeof(word), 1, file) == 1) {
+    decoder.decode(0, 0, &word);
+  }
+  aarch64_decode::dump_decode_counters(stdout);
+  return 0;
+}
+"""
+
+class TestDecodeCounters(unittest.TestCase):
+
+    def setUp(self):
+        self.instruction = instruction("add.xml", "ADD", ["1" + "x" * 31, "01" + "x" * 30, "001" + "x" * 29])
+        self.encodings_sets = buildEncodingsSets([self.instruction])
+
+    def generated_counters(self, backend, words):
+        """The conditions counted by the decoder generated with --decode-counters, by opcode, for the words"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # NOTE: main.py generates from src/generate_decoder, into out, from the templates of the repository
+            generator_dir = os.path.join(tmp_dir, "src", "generate_decoder")
+            os.makedirs(generator_dir)
+            os.makedirs(os.path.join(generator_dir, BYTECODE_CACHE_DIR))
+            os.makedirs(os.path.join(tmp_dir, "out"))
+            os.symlink(os.path.join(ROOT_DIR, "templates"), os.path.join(tmp_dir, "templates"))
+            cwd = os.getcwd()
+            os.chdir(generator_dir)
+            try:
+                generate_code(self.encodings_sets, [self.instruction], backend=backend, decode_counters=True)
+            finally:
+                os.chdir(cwd)
+            out_dir = os.path.join(tmp_dir, "out")
+            with open(os.path.join(out_dir, "driver.cpp"), 'w') as file:
+                file.write(COUNTERS_DRIVER)
+            with open(os.path.join(out_dir, "words.bin"), 'wb') as file:
+                file.write(np.array(words, dtype='<u4').tobytes())
+            subprocess.run(["g++", "-O1", "-DAARCH64_DECODE_COUNTERS", "-I", out_dir, os.path.join(out_dir, "driver.cpp"),
+                            "-o", os.path.join(out_dir, "driver")], check=True)
+            dump = subprocess.run([os.path.join(out_dir, "driver"), os.path.join(out_dir, "words.bin")],
+                                  capture_output=True, text=True, check=True).stdout
+        counters = dict()
+        for line in dump.splitlines():
+            if not line.startswith("#"):
+                (name, count, _, conditions) = line.split()[:4]
+                counters[name] = (int(count), float(conditions))
+        return(counters)
+
+    @unittest.skipIf(shutil.which("g++") is None, "g++ is needed to build the generated decoder")
+    def test_decode_counters(self):
+        # the conditions counted by the generated decoder are those that the simulator models
+        random.seed(0)
+        words = [random.getrandbits(32) for i in range(1000)]
+        for backend in ["flat", "tree", "switch", "table"]:
+            simulator = DecodeSimulator(self.encodings_sets, backend)
+            (opcode, conditions) = simulator.simulate(words)
+            expected = dict()
+            for op in np.unique(opcode):
+                expected[simulator.opcode_name(op)] = ((opcode == op).sum(), round(conditions[opcode == op].mean(), 2))
+            self.assertEqual(self.generated_counters(backend, words), expected, backend)
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
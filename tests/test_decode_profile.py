@@ -0,0 +1,52 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import tempfile
+import unittest
+from decoder import buildEncodingsSets
+from decode_profile import *
+from fixtures import instruction
+
+class TestDecodeProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.instruction = instruction("add.xml", "ADD", ["1" + "x" * 31, "01" + "x" * 30, "00" + "x" * 30])
+        self.encodings_sets = buildEncodingsSets([self.instruction])
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.tmp_dir.name + "/profile.txt"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_profile(self, content):
+        with open(self.path, 'w') as file:
+            file.write(content)
+
+    def test_opcodeName(self):
+        self.assertEqual(opcodeName(self.instruction.encodings[0]), "op_aarch64_a64_add_id_enc0")
+
+    def test_loadProfile(self):
+        self.write_profile("# a histogram of opcodes...\n"
+                           "op_aarch64_a64_add_id_enc0 10\n"
+                           "\n"
+                           "# ...and a trace of instruction words\n"
+                           "0x40000000\n"
+                           "40000001 3 # decoded as the same encoding\n"
+                           "aarch64_unknown 7\n")
+        [enc0, enc1, _] = self.instruction.encodings
+        self.assertEqual(loadProfile(self.path, self.encodings_sets), {enc0: 10, enc1: 4})
+
+    def test_loadProfile_errors(self):
+        self.write_profile("op_aarch64_a64_sub_id_enc0 10\n")
+        with self.assertRaises(ValueError):
+            loadProfile(self.path, self.encodings_sets)
+        self.write_profile("op_aarch64_a64_add_id_enc0 many\n")
+        with self.assertRaises(ValueError):
+            loadProfile(self.path, self.encodings_sets)
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
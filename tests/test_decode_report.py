@@ -0,0 +1,61 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import tempfile
+import unittest
+from decoder import buildEncodingsSets
+from decode_report import *
+from decision_tree import Leaf, Node, Rule
+from fixtures import instruction
+
+class TestDecodeReport(unittest.TestCase):
+
+    def setUp(self):
+        self.instruction = instruction("add.xml", "ADD", ["1" + "x" * 31, "01" + "x" * 30, "00" + "x" * 30])
+        self.encodings_sets = buildEncodingsSets([self.instruction])
+
+    def test_flat(self):
+        report = decodeReport(self.encodings_sets)
+        self.assertEqual((report['encodings_sets'], report['encodings'], report['duplicated_encodings']), (3, 3, 0))
+        # each set is a single check of its shared bits, and a word of the last set fails those of the other two
+        self.assertEqual(report['conditions'], 3)
+        self.assertEqual((report['max_checks'], report['mean_checks']), (3, 2.0))
+        self.assertEqual(report['slowest'][0][1], 3)
+        self.assertNotIn('weighted_mean_checks', report)
+
+    def test_backends(self):
+        for backend in ["flat", "tree", "switch", "table"]:
+            report = decodeReport(self.encodings_sets, backend)
+            self.assertEqual(report['undecoded_encodings'], 0)
+            self.assertGreater(report['estimated_code_bytes'], 0)
+        self.assertEqual(decodeReport(self.encodings_sets, "tree")['max_checks'], 3)
+        self.assertGreater(decodeReport(self.encodings_sets, "table")['table_bytes'], 0)
+        self.assertEqual(decodeReport(self.encodings_sets, "flat")['table_bytes'], 0)
+
+    def test_tree_shared(self):
+        [enc0, enc1, _] = self.instruction.encodings
+        shared = Node(1, 1, [Leaf([Rule(0, 0, enc0)]), Leaf([Rule(0, 0, enc1)])])
+        costs = DecodeCosts()
+        treeCosts(costs, Node(0, 0, [shared, shared]))
+        # the shared subtree is counted once, but decodes in as many checks by either path
+        self.assertEqual(costs.conditions, 1 + 1 + 2)
+        self.assertEqual(costs.checks[enc0], 3)
+        self.assertEqual(costs.decodes[enc0], 2)
+
+    def test_weighted_mean_checks(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = tmp_dir + "/profile.txt"
+            with open(path, 'w') as file:
+                file.write("op_aarch64_a64_add_id_enc2 3\n"
+                           "op_aarch64_a64_add_id_enc0 1\n")
+            report = decodeReport(self.encodings_sets, decode_profile=path, cold_threshold=0.0)
+        # the hottest set is checked first, and the set that is never decoded is cold
+        self.assertEqual((report['hot_sets'], report['cold_sets']), (2, 1))
+        self.assertEqual(report['weighted_mean_checks'], (3 * 1 + 1 * 2) / 4)
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
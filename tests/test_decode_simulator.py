@@ -0,0 +1,66 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import random
+import tempfile
+import unittest
+import numpy as np
+from decoder import buildEncodingsSets, flatDecodeRules
+from decode_simulator import *
+from fixtures import instruction
+
+class TestDecodeSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.instruction = instruction("add.xml", "ADD", ["1" + "x" * 31, "01" + "x" * 30, "001" + "x" * 29])
+        self.encodings_sets = buildEncodingsSets([self.instruction])
+
+    def test_flat(self):
+        simulator = DecodeSimulator(self.encodings_sets)
+        (opcode, conditions) = simulator.simulate([0x80000000, 0x40000000, 0x20000000, 0])
+        self.assertEqual([simulator.opcode_name(op) for op in opcode],
+                         ["op_aarch64_a64_add_id_enc0", "op_aarch64_a64_add_id_enc1", "op_aarch64_a64_add_id_enc2",
+                          "op_aarch64_a64_add_id_enc2"])
+        # the sets are checked in the order of their shared bits, and only the shared bits of a singleton are checked
+        self.assertEqual(list(conditions), [1, 3, 2, 2])
+
+    def test_profiled_layout(self):
+        # the profiled sets are checked hottest-first, and the set that the profile never decodes is checked last
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = tmp_dir + "/profile.txt"
+            with open(path, 'w') as file:
+                file.write("op_aarch64_a64_add_id_enc2 10\nop_aarch64_a64_add_id_enc1 5\n")
+            simulator = DecodeSimulator(self.encodings_sets, decode_profile=path)
+        self.assertEqual(len(simulator.layout.cold), 1)
+        (opcode, conditions) = simulator.simulate([0x80000000, 0x40000000, 0x20000000, 0])
+        self.assertEqual([simulator.opcode_name(op) for op in opcode],
+                         ["op_aarch64_a64_add_id_enc0", "op_aarch64_a64_add_id_enc1", "op_aarch64_a64_add_id_enc2",
+                          "op_aarch64_a64_add_id_enc2"])
+        self.assertEqual(list(conditions), [3, 2, 1, 1])
+
+    def test_backends(self):
+        rules = flatDecodeRules(self.encodings_sets)
+        random.seed(0)
+        words = [random.getrandbits(32) for i in range(1000)]
+        for backend in ["flat", "tree", "switch", "table"]:
+            simulator = DecodeSimulator(self.encodings_sets, backend)
+            (opcode, conditions) = simulator.simulate(words)
+            for word, op in zip(words, opcode):
+                expected = next((rule.payload for rule in rules if rule.matches(word)), None)
+                self.assertIs(simulator.encodings[op] if op >= 0 else None, expected)
+            self.assertTrue((conditions > 0).all())
+
+    def test_summary(self):
+        simulator = DecodeSimulator(self.encodings_sets)
+        summary = simulator.summary(np.array([0x80000000] * 3 + [0x20000000], dtype='<u4').tobytes())
+        self.assertEqual((summary['words'], summary['unique_words'], summary['unknown_words']), (4, 2, 0))
+        self.assertEqual(summary['mean_conditions'], (3 * 1 + 2) / 4)
+        self.assertEqual(summary['opcodes'], [("op_aarch64_a64_add_id_enc0", 3, 1.0),
+                                              ("op_aarch64_a64_add_id_enc2", 1, 2.0)])
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
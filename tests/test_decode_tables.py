@@ -0,0 +1,52 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import random
+import unittest
+from decode_tables import *
+from decision_tree import Leaf
+from decision_tree import Rule
+from test_decision_tree import TestDecisionTree, first_match
+
+class TestDecodeTables(unittest.TestCase):
+
+    def test_buildDecodeTables(self):
+        rules = TestDecisionTree.rules()
+        random.seed(0)
+        words = [random.getrandbits(32) for i in range(1000)] + [0x12345678, 0x13000000, 0x1F000000, 0x80000001]
+        for root_bits, field_width in [(0, 1), (4, 1), (8, 4), (2, 8)]:
+            tables = buildDecodeTables(rules, root_bits, field_width)
+            for word in words:
+                self.assertIs(tables.decode(word), first_match(rules, word))
+
+    def test_root(self):
+        tables = buildDecodeTables(TestDecisionTree.rules(), root_bits=4)
+        self.assertEqual(tables.nodes[0][:2], (0xF, 28))
+        self.assertEqual(len(tables.children), 16 + sum([node[0] + 1 for node in tables.nodes[1:] if node[0] != 0]))
+
+    def test_bad_options(self):
+        for root_bits, field_width in [(-1, 4), (MAX_ROOT_BITS + 1, 4), (33, 4), (8, 0)]:
+            with self.assertRaises(AssertionError):
+                buildDecodeTables(TestDecisionTree.rules(), root_bits, field_width)
+
+    def test_shared_leaves(self):
+        rules = [Rule(0xF0000000, 0x10000000, "a")]
+        tables = buildDecodeTables(rules, root_bits=4)
+        # every value of the top bits but one leads to the same empty leaf
+        self.assertEqual(len(tables.nodes), 3)
+        self.assertEqual(tables.candidates, rules)
+        self.assertEqual(tables.index_type(), "uint16_t")
+
+    def test_shared_nodes(self):
+        shared = Node(1, 1, [Leaf([Rule(0b11, 0b01, "a")]), Leaf([Rule(0b11, 0b11, "b")])])
+        tables = DecodeTables(Node(0, 0, [shared, shared]))
+        self.assertEqual(len(tables.nodes), 4)
+        first = tables.nodes[0][2]
+        self.assertEqual(tables.children[first:first + 2], [1, 1])
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
@@ -109,6 +109,14 @@ class TestEncodingsSet(unittest.TestCase):
         sets = encodings_set.splitOnCommonBoundBits()
         self.assertEqual(len(sets), 2)
 
+    def test_splitOnBoundBits(self):
+        encoding_set = TestEncodingsSet.zero_and_one_set()
+        encoding_set.append(TestEncodingsSet.two_encoding())
+        sets = encoding_set.splitOnBoundBits({0, 1, 2})
+        self.assertEqual(len(sets), 3)
+        self.assertEqual(sorted([s.shared_bits for s in sets], key=str),
+                         sorted([s.shared_bits for s in encoding_set.splitMany([0, 1, 2]) if len(s) > 0], key=str))
+
     def test_encodingsOrderedByIncreasingUnbound(self):
         encoding_zero = Encoding(parseSingleNode(TestEncoding.xml_specified(dict([(i,'0') for i in range(0,32)]))).childNodes[0], None)
         encoding_one = Encoding(parseSingleNode(TestEncoding.xml_specified(dict([(i,'0') for i in range(1,32)]))).childNodes[0], None)
@@ -131,6 +139,53 @@ class TestEncodingsSet(unittest.TestCase):
             {'v':1,'high':31,'low':31},
             {'v':0,'high':21,'low':20}
         ])
+        self.assertEqual(TestEncodingsSet.zero_and_one_set({
+            1: Bit.Zero, 2: Bit.Zero, 3: Bit.Zero
+        }).shared_bits_as_list_of_ranges(0x20000000),[
+            {'v':0,'high':30,'low':30},
+            {'v':0,'high':28,'low':28}
+        ])
+
+    def test_leaf_bits(self):
+        encoding_set = TestEncodingsSet.zero_and_one_set(dict([(i, Bit.Zero) for i in range(1,32)]))
+        self.assertEqual(encoding_set.leaf_bits(TestEncodingsSet.one_encoding()), [(0, Bit.One)])
+        self.assertEqual(EncodingsSet(set([TestEncodingsSet.one_encoding()]), dict()).leaf_bits(TestEncodingsSet.one_encoding()), [])
+
+class TestDecodeLayout(unittest.TestCase):
+
+    @staticmethod
+    def encodings():
+        general = Encoding(parseSingleNode(TestEncoding.xml_specified({0:'0'})).childNodes[0], None)
+        specific = Encoding(parseSingleNode(TestEncoding.xml_specified({0:'0', 1:'1'})).childNodes[0], None)
+        other = Encoding(parseSingleNode(TestEncoding.xml_specified({0:'1'})).childNodes[0], None)
+        return(general, specific, other)
+
+    def test_hottestFirst(self):
+        (general, specific, other) = TestDecodeLayout.encodings()
+        encoding_set = EncodingsSet(set([general, specific, other]), dict())
+        self.assertEqual(encoding_set.encodingsOrderedByIncreasingUnbound()[0], specific)
+        self.assertTrue(leafChecksOverlap(encoding_set, general, specific))
+        self.assertFalse(leafChecksOverlap(encoding_set, general, other))
+        # the general encoding can't be moved ahead of the specific one that it overlaps
+        self.assertEqual(hottestFirst(encoding_set, encoding_set.encodingsOrderedByIncreasingUnbound(),
+                                      {general: 100, other: 50}),
+                         [other, specific, general])
+
+    def test_profiledLayout(self):
+        (general, specific, other) = TestDecodeLayout.encodings()
+        zeros = EncodingsSet(set([general, specific]), {0: Bit.Zero})
+        ones = EncodingsSet(set([other]), {0: Bit.One})
+        self.assertEqual(flatLayout({zeros, ones}).hot, [zeros, ones])
+
+        layout = profiledLayout({zeros, ones}, {other: 5})
+        self.assertEqual((layout.hot, layout.cold), ([ones], [zeros]))
+        self.assertEqual([rule.payload for rule in flatDecodeRules({zeros, ones}, layout=layout)],
+                         [other, specific, general])
+
+        layout = profiledLayout({zeros, ones}, {general: 1, other: 5})
+        self.assertEqual((layout.hot, layout.cold), ([ones, zeros], []))
+        layout = profiledLayout({zeros, ones}, {general: 1, other: 5}, cold_threshold=0.5)
+        self.assertEqual((layout.hot, layout.cold), ([ones], [zeros]))
 
 def main():
     unittest.main()
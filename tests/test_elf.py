@@ -0,0 +1,77 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import struct
+import tempfile
+import unittest
+from elf import *
+
+def buildElf(machine = EM_AARCH64, sections = True):
+    """A minimal ELF file with an executable .text section of two words at 0x400000, and a data section"""
+    code = struct.pack('<II', 0xd503201f, 0xd65f03c0)
+    names = b'\0.text\0.data\0.shstrtab\0'
+    code_offset = ELF_HEADER.size + PROGRAM_HEADER.size
+    names_offset = code_offset + len(code) + 4
+    sections_offset = names_offset + len(names)
+    section_headers = [SECTION_HEADER.pack(0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+                       SECTION_HEADER.pack(1, 1, 0x6, 0x400000, code_offset, len(code), 0, 0, 4, 0),
+                       SECTION_HEADER.pack(7, 1, 0x3, 0x500000, code_offset + len(code), 4, 0, 0, 4, 0),
+                       SECTION_HEADER.pack(13, 3, 0, 0, names_offset, len(names), 0, 0, 1, 0)]
+    ident = ELF_MAGIC + bytes([ELFCLASS64, ELFDATA2LSB, 1]) + bytes(9)
+    header = ELF_HEADER.pack(ident, 2, machine, 1, 0x400000, ELF_HEADER.size, sections_offset if sections else 0, 0,
+                             ELF_HEADER.size, PROGRAM_HEADER.size, 1,
+                             SECTION_HEADER.size, len(section_headers) if sections else 0, 3)
+    segment = PROGRAM_HEADER.pack(PT_LOAD, 0x5, code_offset, 0x400000, 0x400000, len(code), len(code), 0x1000)
+    return(header + segment + code + bytes(4) + names + b''.join(section_headers))
+
+class TestElf(unittest.TestCase):
+
+    def test_sections(self):
+        regions = codeRegions(buildElf())
+        self.assertEqual([(r.name, r.address, r.size) for r in regions], [(".text", 0x400000, 8)])
+
+    def test_segments(self):
+        regions = codeRegions(buildElf(sections = False))
+        self.assertEqual([(r.name, r.address, r.size) for r in regions], [("", 0x400000, 8)])
+
+    def test_raw(self):
+        regions = codeRegions(bytes(10), raw_address = 0x1000)
+        self.assertEqual([(r.address, r.offset, r.size) for r in regions], [(0x1000, 0, 10)])
+
+    def test_not_aarch64(self):
+        with self.assertRaises(ValueError):
+            codeRegions(buildElf(machine = 62))
+
+    def test_truncated(self):
+        code_offset = ELF_HEADER.size + PROGRAM_HEADER.size
+        # the section headers, program headers, and code each run past the end of the file
+        for data in [buildElf()[:-1], buildElf(sections = False)[:ELF_HEADER.size + 1],
+                     buildElf(sections = False)[:code_offset + 4]]:
+            with self.assertRaises(ValueError):
+                codeRegions(data)
+
+    def test_corrupt(self):
+        elf = bytearray(buildElf(sections = False))
+        struct.pack_into('<H', elf, 54, PROGRAM_HEADER.size - 1)
+        with self.assertRaises(ValueError):
+            codeRegions(bytes(elf))
+        # a section name without a NUL runs to the end of the names
+        self.assertEqual(sectionName(b'\0.text', 1), ".text")
+
+    def test_load_code(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = tmp_dir + "/a.out"
+            with open(path, 'wb') as file:
+                file.write(buildElf())
+            [(region, code)] = loadCode(path)
+            self.assertEqual(region.address, 0x400000)
+            self.assertEqual(struct.unpack('<II', code), (0xd503201f, 0xd65f03c0))
+            open(path, 'wb').close()
+            self.assertEqual(loadCode(path), [])
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import tempfile
+import unittest
+from instruction_index import *
+from parser import BitSequence, Encoding, Instruction
+
+def instruction(fileName, mnemonic, encodings, is_alias = False):
+    inst = Instruction.from_values(fileName, mnemonic + " heading", None, "alias" if is_alias else "instruction",
+                                   {"mnemonic": mnemonic})
+    inst.encodings = [Encoding.from_values(inst, fileName + str(n), "A64", "", False,
+                                           [BitSequence.from_values(31, 32, "_", list(bits), False)])
+                      for (n, bits) in enumerate(encodings)]
+    return(inst)
+
+class TestInstructionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.spec_dir = self.tmp_dir.name + "/spec/"
+        os.makedirs(self.spec_dir)
+        with open(self.spec_dir + "index.xml", 'w') as file:
+            file.write("<index/>")
+        self.parses = 0
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def parse(self):
+        self.parses += 1
+        return([instruction("add.xml", "ADD", ["1" * 16 + "x" * 16, "0" * 16 + "x" * 16]),
+                instruction("addp.xml", "ADDP", ["10" + "x" * 30]),
+                instruction("sub.xml", "SUB", ["01" + "x" * 30]),
+                instruction("mov.xml", "MOV", ["1" * 16 + "0" * 16], is_alias=True)])
+
+    def index(self):
+        return(InstructionIndex(self.tmp_dir.name + "/cache/instructions.sqlite", self.spec_dir, self.parse))
+
+    def test_rebuilt_when_spec_changes(self):
+        self.index().close()
+        self.index().close()
+        self.assertEqual(self.parses, 1)
+        with open(self.spec_dir + "index.xml", 'w') as file:
+            file.write("<index></index>")
+        self.index().close()
+        self.assertEqual(self.parses, 2)
+
+    def test_query(self):
+        index = self.index()
+        names = lambda instructions: [inst.fileName for inst in instructions]
+        self.assertEqual(names(index.query()), ["add.xml", "addp.xml", "sub.xml"])
+        self.assertEqual(names(index.query(include_aliases=True)), ["add.xml", "addp.xml", "mov.xml", "sub.xml"])
+        self.assertEqual(names(index.query(mnemonic="ADD")), ["add.xml"])
+        self.assertEqual(names(index.query(mnemonic_prefix="ADD")), ["add.xml", "addp.xml"])
+        self.assertEqual(names(index.query(mnemonic_regex="^(ADDP|SUB)$")), ["addp.xml", "sub.xml"])
+        self.assertEqual(names(index.query(encoding_count=2)), ["add.xml"])
+        self.assertEqual(names(index.query(filename="sub.xml", name="SUB heading")), ["sub.xml"])
+        self.assertEqual(index.query(name="missing"), [])
+        index.close()
+
+    def test_query_encodings(self):
+        index = self.index()
+        [add] = index.query(matching_word=0xffff0000)
+        self.assertEqual(add.encodings, ["1" * 16 + "x" * 16])
+        self.assertEqual([inst.fileName for inst in index.query(matching_word=0xffff0000, include_aliases=True)],
+                         ["add.xml", "mov.xml"])
+        self.assertEqual([inst.fileName for inst in index.query(matching_word=0x80000000)], ["addp.xml"])
+        self.assertEqual([inst.fileName for inst in index.query(binding_bit=29)], ["add.xml"])
+        self.assertEqual(len(index.query(binding_bit=29)[0].encodings), 2)
+        self.assertEqual([inst.fileName for inst in index.query(binding_bit=30, mnemonic_prefix="S")], ["sub.xml"])
+        index.close()
+
+    def test_query_inverted(self):
+        # a word with the value of an inverted field doesn't match the encoding, as the decoder treats it
+        inst = instruction("b.xml", "B", [])
+        inst.encodings = [Encoding.from_values(inst, "B", "A64", "", False,
+                                               [BitSequence.from_values(31, 28, "_", list("1" * 28), False),
+                                                BitSequence.from_values(3, 4, "cond", ["!= 111x"], False)])]
+        index = InstructionIndex(self.tmp_dir.name + "/cache/instructions.sqlite", self.spec_dir, lambda: [inst])
+        self.assertEqual([inst.fileName for inst in index.query(matching_word=0xfffffff0)], ["b.xml"])
+        self.assertEqual(index.query(matching_word=0xfffffffe), [])
+        self.assertEqual(index.query(matching_word=0xffffffff), [])
+        index.close()
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
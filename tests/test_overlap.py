@@ -0,0 +1,71 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import itertools
+import unittest
+from decoder import buildEncodingsSets
+from overlap import *
+from fixtures import encoding, instruction
+from parser import BitSequence, Encoding
+
+class TestOverlap(unittest.TestCase):
+
+    def setUp(self):
+        self.instruction = instruction("add.xml", "ADD", [])
+
+    def encodings(self, patterns):
+        self.instruction.encodings = [encoding(self.instruction, "ENC" + str(i), bits)
+                                      for i, bits in enumerate(patterns)]
+        return(self.instruction.encodings)
+
+    def test_bound_overlap(self):
+        [overlap] = findOverlaps(self.encodings(["1" + "x" * 31, "11" + "x" * 30, "01" + "x" * 30]))
+        self.assertEqual([enc.id for enc in overlap.encodings], ["ENC0", "ENC1"])
+        self.assertEqual(overlap.words, 1 << 30)
+        self.assertEqual(overlap.pattern(), "11" + "x" * 30)
+        self.assertTrue(overlap.order_dependent)
+        self.assertEqual(overlap.causes, [])
+
+    def test_unpredictable_overlap(self):
+        unpredictable = Encoding.from_values(self.instruction, "UNP", "A64", None, False,
+                                             [BitSequence.from_values(31, 32, "_", ["1", "(0)"] + ["x"] * 30, False)])
+        [overlap] = findOverlaps([unpredictable, encoding(self.instruction, "ENC", "11" + "x" * 30)])
+        self.assertFalse(overlap.order_dependent)
+        self.assertEqual(overlap.causes, ['unpredictable'])
+
+    def test_inverted_overlap(self):
+        def inverted(excluded):
+            return(Encoding.from_values(self.instruction, "INV", "A64", None, False,
+                                        [BitSequence.from_values(31, 2, "op", ["!= " + excluded], False),
+                                         BitSequence.from_values(29, 30, "_", ["x"] * 30, False)]))
+        # the inverted field excludes all of the words of the other encoding
+        self.assertEqual(findOverlaps([inverted("11"), encoding(self.instruction, "ENC", "11" + "x" * 30)]), [])
+        [overlap] = findOverlaps([inverted("11"), encoding(self.instruction, "ENC", "1" + "x" * 31)])
+        self.assertEqual(overlap.words, 1 << 30)
+        self.assertEqual(overlap.causes, ['inverted'])
+
+    def test_candidate_pairs(self):
+        # every overlapping pair is found, even though the bucketing compares far fewer than all of the pairs
+        patterns = ["".join(bits) + "x" * 26 for bits in itertools.product("01x", repeat=6)]
+        encodings = self.encodings(patterns)
+        overlapping = set([(a, b) for (a, b) in itertools.combinations(range(len(encodings)), 2)
+                           if masksOverlap(encodings[a].bound_mask, encodings[a].bound_value,
+                                           encodings[b].bound_mask, encodings[b].bound_value)])
+        pairs = candidatePairs(encodings)
+        self.assertEqual(overlapping - pairs, set())
+        self.assertLess(len(pairs), len(encodings) * (len(encodings) - 1) // 2)
+
+    def test_report(self):
+        self.encodings(["1" + "x" * 31, "11" + "x" * 30, "0" + "x" * 31])
+        report = overlapReport(buildEncodingsSets([self.instruction]))
+        self.assertEqual((report['encodings'], report['overlapping_pairs'], report['order_dependent_pairs']), (3, 1, 1))
+        self.assertEqual(report['cross_set_pairs'], 0)
+        self.assertEqual(report['sets_with_overlaps'], [{'shared_bits': "1" + "x" * 31, 'encodings': 2, 'pairs': 1}])
+        self.assertEqual(report['overlaps'][0]['encodings'], ["op_aarch64_a64_add_id_enc0", "op_aarch64_a64_add_id_enc1"])
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
 
+import tempfile
 import unittest
 from xml.dom.minidom import parseString
 from parser import *
@@ -91,6 +92,32 @@ class TestEncoding(unittest.TestCase):
         self.assertEqual(encoding.getBit(0), zero)
         self.assertEqual(encoding.getBitRange(0,3), [zero] * 3)
 
+    def test_compile_masks(self):
+        encoding = Encoding(parseSingleNode(TestEncoding.xml_specified({
+            0: '1',
+            1: '0',
+            2: '(1)',
+            3: '(0)'
+        })).childNodes[0], None)
+        self.assertEqual(encoding.bound_mask, 0xC0000000)
+        self.assertEqual(encoding.bound_value, 0x80000000)
+        self.assertEqual(encoding.unpredictable_mask, 0x30000000)
+        self.assertEqual(encoding.unpredictable_value, 0x20000000)
+        self.assertEqual(encoding.inverted_mask, 0)
+        self.assertEqual(encoding.unbound_mask, 0x0FFFFFFF)
+        self.assertEqual(encoding.unbound_count(), 28)
+        self.assertEqual(encoding.getBit(2), (BitValueType.Unpredictably_bound, Bit.One))
+        self.assertEqual(encoding.getBit(4), (BitValueType.Unbound, None))
+
+        inverted = Encoding(parseSingleNode(
+            '<iclass isa="A64"><regdiagram form="32">'
+            '<box hibit="31" width="2"><c>!= 01</c></box>'
+            '<box hibit="29" width="30"><c></c></box>'
+            '</regdiagram></iclass>').childNodes[0], None)
+        self.assertEqual(inverted.inverted_mask, 0xC0000000)
+        self.assertEqual(inverted.bound_mask, 0)
+        self.assertEqual(inverted.getBit(0), (BitValueType.Unbound, None))
+
     def test_named_bit_sequences(self):
         encoding = Encoding(parseSingleNode(TestEncoding.xml()).childNodes[0], None)
         bit_sequences = encoding.named_bit_sequences()
@@ -196,6 +223,78 @@ class TestInstruction(unittest.TestCase):
         alias.update_alias_references(filename_inst_dict)
         self.assertEqual(alias.aliasto, aliased_instruction)
 
+class TestParseFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.xml_dir = self.tmp_dir.name + "/"
+        for filename, xml_string in [("example.xml", TestInstruction.instruction_with_alias_xml()),
+                                     ("alias.xml", TestInstruction.alias_xml())]:
+            with open(self.xml_dir + filename, 'w') as file:
+                file.write(xml_string)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parseFiles(self):
+        xml_files = ["example.xml", "alias.xml"]
+        serial = parseFiles(self.xml_dir, xml_files)
+        parallel = parseFiles(self.xml_dir, xml_files, parallel=True, workers=2)
+        self.assertEqual(list(parallel.keys()), xml_files)
+        for filename in xml_files:
+            self.assertEqual(parallel[filename].name, serial[filename].name)
+            self.assertEqual([str(enc) for enc in parallel[filename].encodings],
+                             [str(enc) for enc in serial[filename].encodings])
+
+        just_instructions = resolveAliases(parallel)
+        self.assertEqual(just_instructions, set([parallel["example.xml"]]))
+        self.assertEqual(parallel["alias.xml"].aliasto, parallel["example.xml"])
+
+    def test_parseFiles_stream(self):
+        xml_files = ["example.xml", "alias.xml"]
+        dom = parseFiles(self.xml_dir, xml_files)
+        stream = parseFiles(self.xml_dir, xml_files, backend="stream")
+        for filename in xml_files:
+            self.assertEqual(stream[filename].name, dom[filename].name)
+            self.assertEqual(stream[filename].id, dom[filename].id)
+            self.assertEqual(stream[filename].mnemonic, dom[filename].mnemonic)
+            self.assertEqual(stream[filename].is_alias, dom[filename].is_alias)
+            for stream_enc, dom_enc in zip(stream[filename].encodings, dom[filename].encodings):
+                self.assertIs(stream_enc.instruction, stream[filename])
+                self.assertEqual(str(stream_enc), str(dom_enc))
+                self.assertEqual(stream_enc.instruction_set, dom_enc.instruction_set)
+                self.assertEqual(stream_enc.known_mask, dom_enc.known_mask)
+                self.assertEqual([bs.name for bs in stream_enc.bitSequences], [bs.name for bs in dom_enc.bitSequences])
+        self.assertEqual(stream["example.xml"].aliaslist_filenames, dom["example.xml"].aliaslist_filenames)
+        self.assertEqual(stream["alias.xml"].aliasto_filename, dom["alias.xml"].aliasto_filename)
+
+        with open(self.xml_dir + "missing.xml", 'w') as file:
+            file.write(TestInstruction.instruction_without_alias_xml().replace("<heading>Example</heading>", ""))
+        with self.assertRaises(ValueError):
+            parseInstructionStream(self.xml_dir, "missing.xml")
+
+    def test_parseFiles_cached(self):
+        xml_files = ["example.xml", "alias.xml"]
+        cache_path = self.xml_dir + "cache/spec.pickle"
+        cache = SpecCache(cache_path, PARSER_VERSION)
+        first = parseFiles(self.xml_dir, xml_files, cache=cache)
+        cache.save()
+
+        cache = SpecCache(cache_path, PARSER_VERSION)
+        second = parseFiles(self.xml_dir, xml_files, cache=cache)
+        self.assertEqual(second["example.xml"].name, "Example")
+        self.assertFalse(cache.dirty)
+
+        # only the edited file should be reparsed
+        with open(self.xml_dir + "alias.xml", 'w') as file:
+            file.write(TestInstruction.alias_xml().replace("<heading>Alias", "<heading>Edited"))
+        third = parseFiles(self.xml_dir, xml_files, cache=cache)
+        self.assertIs(third["example.xml"], second["example.xml"])
+        self.assertEqual(third["alias.xml"].name, "Edited")
+
+        # a change of version invalidates everything
+        self.assertEqual(SpecCache(cache_path, PARSER_VERSION + 1).entries, {})
+
 def main():
     unittest.main()
 
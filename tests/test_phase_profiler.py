@@ -0,0 +1,79 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import unittest
+from phase_profiler import *
+from decoder import EncodingsSet, buildEncodingsSets
+from fixtures import encoding, instruction
+from parser import Encoding
+
+class TestPhaseProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        if profiling():
+            stopProfiling()
+
+    def test_not_profiling(self):
+        self.assertFalse(profiling())
+        with phase("unprofiled") as entry:
+            count('getBit_calls')
+        self.assertIsNone(entry)
+
+    def test_phases(self):
+        startProfiling()
+        with phase("outer"):
+            with phase("inner"):
+                allocated = bytearray(1 << 20)
+            del allocated
+            count('getBit_calls', 2)
+            count('other')
+        report = stopProfiling().report()
+        self.assertFalse(profiling())
+        [outer, inner] = report['phases']
+        self.assertEqual((outer['name'], outer['depth'], inner['name'], inner['depth']), ("outer", 0, "inner", 1))
+        # the peak of the inner phase is also that of the outer phase, though it was freed before the outer phase ended
+        self.assertGreaterEqual(inner['peak_memory'], 1 << 20)
+        self.assertGreaterEqual(outer['peak_memory'], inner['peak_memory'])
+        self.assertLess(outer['memory_change'], 1 << 20)
+        self.assertGreaterEqual(outer['wall_time'], inner['wall_time'])
+        self.assertEqual(report['counters']['getBit_calls'], 2)
+        self.assertEqual(report['counters']['other'], 1)
+        self.assertEqual(report['counters']['files_parsed'], 0)
+        self.assertEqual(report['counters']['empty_sets_created'], 0)
+
+    def test_count_calls(self):
+        enc = encoding(instruction("add.xml", "ADD", []), "ENC", "1" + "x" * 31)
+        getBit = Encoding.getBit
+        startProfiling()
+        enc.getBit(0)
+        enc.getBit(1)
+        report = stopProfiling().report()
+        self.assertEqual(report['counters']['getBit_calls'], 2)
+        # the method is only wrapped whilst profiling
+        self.assertIs(Encoding.getBit, getBit)
+
+    def test_buildEncodingsSets(self):
+        startProfiling()
+        buildEncodingsSets([instruction("add.xml", "ADD", ["1" + "x" * 31, "01" + "x" * 30, "00" + "x" * 30])])
+        report = stopProfiling().report()
+        self.assertEqual([entry['name'] for entry in report['phases']], ["findCommonBitsAndSplitRecursively"])
+        self.assertGreater(report['counters']['sets_created'], 3)
+        # splitting on the bits bound in every encoding leaves no set empty
+        self.assertEqual(report['counters']['empty_sets_created'], 0)
+
+    def test_empty_sets_created(self):
+        encodings = instruction("add.xml", "ADD", ["11" + "x" * 30, "10" + "x" * 30]).encodings
+        startProfiling()
+        EncodingsSet(set(encodings), {}).split(1)
+        self.assertEqual(stopProfiling().report()['counters']['empty_sets_created'], 0)
+        # both encodings have a 1 at bit 0, so no encoding is left for the 0 side of the split
+        startProfiling()
+        EncodingsSet(set(encodings), {}).split(0)
+        self.assertEqual(stopProfiling().report()['counters']['empty_sets_created'], 1)
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
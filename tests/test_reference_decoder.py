@@ -0,0 +1,57 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import unittest
+import numpy as np
+from decoder import buildEncodingsSets, flatDecodeRules
+from reference_decoder import *
+from fixtures import instruction
+from test_decision_tree import first_match
+
+class TestReferenceDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.instructions = [
+            instruction("sub.xml", "SUB", ["1" + "x" * 30 + "0", "1" + "x" * 30 + "1"]),
+            instruction("add.xml", "add", ["01" + "x" * 26 + "0000", "01" + "x" * 30]),     # overlapping encodings
+            instruction("b.xml", "B", ["0011" + "x" * 28]),
+            instruction("cbz.xml", "CBZ", ["0010" + "x" * 28]),
+        ]
+        self.encodings_sets = buildEncodingsSets(self.instructions)
+
+    def test_opcodeOrder(self):
+        [sub, add, b, cbz] = self.instructions
+        self.assertEqual(opcodeOrder(self.instructions), add.encodings + b.encodings + cbz.encodings + sub.encodings)
+
+    def test_asWords(self):
+        self.assertEqual(list(asWords(b"\x01\x00\x00\x00\x00\x00\x00\x80\xff")), [1, 0x80000000])
+        self.assertEqual(asWords([1, 2]).dtype, np.uint32)
+
+    def test_decode(self):
+        rules = flatDecodeRules(self.encodings_sets)
+        encodings = opcodeOrder(self.instructions)
+        words = np.random.default_rng(0).integers(0, 1 << 32, 10000, dtype=np.uint32)
+        for max_field_width in [1, 4]:
+            decoder = ReferenceDecoder(self.encodings_sets, self.instructions, max_field_width=max_field_width)
+            for word, opcode in zip(words, decoder.decode(words)):
+                rule = first_match(rules, int(word))
+                self.assertEqual(opcode, -1 if rule is None else encodings.index(rule.payload))
+        decoder = ReferenceDecoder(self.encodings_sets, self.instructions)
+        self.assertEqual(list(decoder.decode(np.array([0x40000000, 0x40000001, 0x00000000], dtype=np.uint32))),
+                         [0, 1, -1])
+        self.assertEqual(list(decoder.decode(np.array([0x40000000], dtype=np.uint32).tobytes())), [0])
+
+    def test_histogram(self):
+        decoder = ReferenceDecoder(self.encodings_sets, self.instructions)
+        self.assertEqual(decoder.histogram([0x40000001, 0x40000001, 0x30000000, 0x00000000]), [
+            ("op_aarch64_a64_add_id_enc1", 2),
+            ("aarch64_unknown", 1),
+            ("op_aarch64_a64_b_id_enc0", 1),
+        ])
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
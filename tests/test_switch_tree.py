@@ -0,0 +1,67 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath( os.path.join(os.path.dirname(__file__), '..') ))
+
+import random
+import unittest
+from decoder import EncodingsSet
+from parser import Bit
+from switch_tree import *
+
+def leading_bits(bits):
+    """shared_bits binding the leading bits of the word to the given string of 0s and 1s"""
+    return(dict([(i, Bit.One if bit == '1' else Bit.Zero) for i, bit in enumerate(bits)]))
+
+def setsChecked(tree, word):
+    """The sets that decode_a64 would check for the word, in order"""
+    if tree is None:
+        return([])
+    if tree.is_leaf():
+        return(tree.sets)
+    value = (word >> tree.low_bit) & ((1 << (tree.high_bit - tree.low_bit + 1)) - 1)
+    case = dict(tree.cases).get(value)
+    return(setsChecked(case, word) + setsChecked(tree.rest, word))
+
+class TestSwitchTree(unittest.TestCase):
+
+    @staticmethod
+    def sets():
+        return([
+            EncodingsSet(set(), leading_bits("0000")),
+            EncodingsSet(set(), leading_bits("0001")),
+            EncodingsSet(set(), leading_bits("0010")),
+            EncodingsSet(set(), leading_bits("1")),     # doesn't bind bits 29..28, so is checked after the switch
+        ])
+
+    def test_groupSetsByField(self):
+        sets = TestSwitchTree.sets()
+        (cases, rest) = groupSetsByField(sets, 29, 28)
+        self.assertEqual(cases, {0: [sets[0]], 1: [sets[1]], 2: [sets[2]]})
+        self.assertEqual(rest, [sets[3]])
+
+    def test_buildSwitchTree(self):
+        sets = TestSwitchTree.sets()
+        tree = buildSwitchTree(sets)
+        self.assertFalse(tree.is_leaf())
+        self.assertEqual((tree.high_bit, tree.low_bit), (29, 28))
+        self.assertEqual([value for value, _ in tree.cases], [0, 1, 2])
+        self.assertEqual(tree.cases[0][1].switched_mask, 0x30000000)
+        self.assertEqual(tree.rest.sets, [sets[3]])
+        self.assertEqual(tree.rest.switched_mask, 0)
+
+        random.seed(0)
+        for word in [random.getrandbits(32) for i in range(1000)]:
+            for enc_set in sets:
+                if word & enc_set.shared_mask == enc_set.shared_value:
+                    self.assertIn(enc_set, setsChecked(tree, word))
+
+    def test_buildSwitchTree_max_field_width(self):
+        tree = buildSwitchTree(TestSwitchTree.sets(), max_field_width=1)
+        self.assertEqual((tree.high_bit, tree.low_bit), (29, 29))
+        self.assertTrue(buildSwitchTree(TestSwitchTree.sets()[:1]).is_leaf())
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()